@@ -4,4 +4,5 @@
  * Stub functions for the concrete execution.
  */
 
-require_once 'base-wordpress-loader.php';
\ No newline at end of file
+// Harnesses with a minimal loader traced by LoaderTracer.php set $symwp_base_loader
+require_once $symwp_base_loader ?? 'base-wordpress-loader.php';
\ No newline at end of file
@@ -14,4 +14,5 @@ function sanitize_text_field($str)
     return $str;
 }
 
-require_once 'base-wordpress-loader.php';
\ No newline at end of file
+// Harnesses with a minimal loader traced by LoaderTracer.php set $symwp_base_loader
+require_once $symwp_base_loader ?? 'base-wordpress-loader.php';
\ No newline at end of file
@@ -58,7 +58,8 @@ public:
 S2E_DEFINE_PLUGIN(InternedStringTracker, "Describe what the plugin does here", "", );
 
 void InternedStringTracker::initialize() {
-    addresses = s2e()->getConfig()->getIntegerList(getConfigKey() + ".addressesToTrack");
+    ConfigFile::integer_list addressList = s2e()->getConfig()->getIntegerList(getConfigKey() + ".addressesToTrack");
+    addresses.insert(addressList.begin(), addressList.end());
 
     s2e()->getPlugin<FunctionMonitor>()->onCall.connect(sigc::mem_fun(*this, &InternedStringTracker::onCall));
 }
@@ -66,13 +67,7 @@ void InternedStringTracker::initialize() {
 void InternedStringTracker::onCall(S2EExecutionState *state, const ModuleDescriptorConstPtr &source,
                                    const ModuleDescriptorConstPtr &dest, uint64_t callerPc, uint64_t calleePc,
                                    const FunctionMonitor::ReturnSignalPtr &returnSignal) {
-    bool found = false;
-    foreach2 (address, addresses.begin(), addresses.end()) {
-        if (state->regs()->getPc() == (unsigned long) *address) {
-            found = true;
-        }
-    }
-    if (!found) {
+    if (!addresses.count(state->regs()->getPc())) {
         return;
     }
 
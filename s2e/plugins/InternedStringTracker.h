@@ -27,6 +27,8 @@
 
 #include <s2e/Plugins/Core/BaseInstructions.h>
 
+#include <unordered_set>
+
 namespace s2e {
 namespace plugins {
 
@@ -58,7 +60,7 @@ public:
                 uint64_t callerPc, uint64_t calleePc, const FunctionMonitor::ReturnSignalPtr &returnSignal);
 
 private:
-    ConfigFile::integer_list addresses;
+    std::unordered_set<uint64_t> addresses;
 };
 
 } // namespace plugins
@@ -0,0 +1,170 @@
+///
+/// Copyright (C) 2025, TaiYou
+///
+/// Permission is hereby granted, free of charge, to any person obtaining a copy
+/// of this software and associated documentation files (the "Software"), to deal
+/// in the Software without restriction, including without limitation the rights
+/// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+/// copies of the Software, and to permit persons to whom the Software is
+/// furnished to do so, subject to the following conditions:
+///
+/// The above copyright notice and this permission notice shall be included in all
+/// copies or substantial portions of the Software.
+///
+/// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+/// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+/// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+/// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+/// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+/// OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+/// SOFTWARE.
+///
+
+
+#include <algorithm>
+#include <cstdio>
+#include <fstream>
+#include <iomanip>
+#include <sstream>
+#include <unistd.h>
+
+#include "SinkStats.h"
+
+namespace s2e {
+namespace plugins {
+
+namespace {
+
+void writeCounters(std::stringstream &ss, const SinkStats::Counters &counters) {
+    ss << "\"hits\": " << counters.hits;
+    ss << ", \"symbolic_hits\": " << counters.symbolicHits;
+    ss << ", \"solver_calls\": " << counters.solverCalls;
+    ss << ", \"solver_failures\": " << counters.solverFailures;
+    ss << ", \"solver_us\": " << counters.solverMicros;
+    ss << ", \"max_solver_us\": " << counters.maxSolverMicros;
+    ss << ", \"skipped\": " << counters.skipped;
+    ss << ", \"test_cases\": " << counters.testCases;
+}
+
+} // namespace
+
+void SinkStats::checkFork() {
+    // The parent process keeps reporting what happened before the fork
+    if (m_pid == getpid()) {
+        return;
+    }
+    if (m_pid != 0) {
+        m_constraintsAdded = 0;
+        m_invalidConstraints = 0;
+        m_callSites.clear();
+        m_states.clear();
+    }
+    m_pid = getpid();
+    m_lastDump = std::chrono::steady_clock::now();
+}
+
+template <typename F>
+void SinkStats::update(S2EExecutionState *state, const std::string &sink, uint64_t callerPc, F fn) {
+    checkFork();
+    fn(m_callSites[std::make_pair(sink, callerPc)]);
+    fn(m_states[state->getID()]);
+}
+
+void SinkStats::hit(S2EExecutionState *state, const std::string &sink, uint64_t callerPc, bool symbolic) {
+    update(state, sink, callerPc, [symbolic](Counters &counters) {
+        ++counters.hits;
+        if (symbolic) {
+            ++counters.symbolicHits;
+        }
+    });
+}
+
+void SinkStats::solved(S2EExecutionState *state, const std::string &sink, uint64_t callerPc, uint64_t micros,
+                       bool success) {
+    update(state, sink, callerPc, [micros, success](Counters &counters) {
+        ++counters.solverCalls;
+        if (!success) {
+            ++counters.solverFailures;
+        }
+        counters.solverMicros += micros;
+        counters.maxSolverMicros = std::max(counters.maxSolverMicros, micros);
+    });
+}
+
+void SinkStats::skipped(S2EExecutionState *state, const std::string &sink, uint64_t callerPc) {
+    update(state, sink, callerPc, [](Counters &counters) { ++counters.skipped; });
+}
+
+void SinkStats::testCase(S2EExecutionState *state, const std::string &sink, uint64_t callerPc) {
+    update(state, sink, callerPc, [](Counters &counters) { ++counters.testCases; });
+}
+
+void SinkStats::constraintsAdded(uint64_t count) {
+    checkFork();
+    m_constraintsAdded += count;
+}
+
+void SinkStats::invalidConstraint() {
+    checkFork();
+    ++m_invalidConstraints;
+}
+
+void SinkStats::onTimer() {
+    checkFork();
+    if (std::chrono::steady_clock::now() - m_lastDump >= std::chrono::seconds(m_interval)) {
+        dump();
+    }
+}
+
+void SinkStats::dump() {
+    if (!enabled()) {
+        return;
+    }
+    checkFork();
+    m_lastDump = std::chrono::steady_clock::now();
+
+    double now =
+        std::chrono::duration<double>(std::chrono::system_clock::now().time_since_epoch()).count();
+
+    std::stringstream ss;
+    ss << "{\"time\": " << std::fixed << std::setprecision(3) << now;
+    ss << ", \"constraints_added\": " << m_constraintsAdded;
+    ss << ", \"invalid_constraints\": " << m_invalidConstraints;
+    ss << ",\n \"call_sites\": [";
+    bool first = true;
+    for (const auto &it : m_callSites) {
+        ss << (first ? "\n  " : ",\n  ");
+        first = false;
+        // Sink names come from the config keys, so they need no escaping
+        ss << "{\"sink\": \"" << it.first.first << "\", \"pc\": \"0x" << std::hex << it.first.second << std::dec
+           << "\", ";
+        writeCounters(ss, it.second);
+        ss << "}";
+    }
+    ss << "],\n \"states\": [";
+    first = true;
+    for (const auto &it : m_states) {
+        ss << (first ? "\n  " : ",\n  ");
+        first = false;
+        ss << "{\"id\": " << it.first << ", ";
+        writeCounters(ss, it.second);
+        ss << "}";
+    }
+    ss << "]}\n";
+
+    // Readers never see a partially written file
+    std::string path = m_s2e->getOutputFilename(m_fileName);
+    std::string tmpPath = path + ".tmp";
+    {
+        std::ofstream os(tmpPath, std::ios::trunc);
+        if (!os) {
+            m_s2e->getWarningsStream() << "Could not open stats file " << tmpPath << "\n";
+            return;
+        }
+        os << ss.str();
+    }
+    std::rename(tmpPath.c_str(), path.c_str());
+}
+
+} // namespace plugins
+} // namespace s2e
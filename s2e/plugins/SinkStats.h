@@ -0,0 +1,118 @@
+///
+/// Copyright (C) 2025, TaiYou
+///
+/// Permission is hereby granted, free of charge, to any person obtaining a copy
+/// of this software and associated documentation files (the "Software"), to deal
+/// in the Software without restriction, including without limitation the rights
+/// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+/// copies of the Software, and to permit persons to whom the Software is
+/// furnished to do so, subject to the following conditions:
+///
+/// The above copyright notice and this permission notice shall be included in all
+/// copies or substantial portions of the Software.
+///
+/// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+/// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+/// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+/// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+/// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+/// OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+/// SOFTWARE.
+///
+
+
+#ifndef S2E_PLUGINS_SINKSTATS_H
+#define S2E_PLUGINS_SINKSTATS_H
+
+#include <s2e/S2E.h>
+#include <s2e/S2EExecutionState.h>
+
+#include <chrono>
+#include <map>
+#include <string>
+#include <sys/types.h>
+#include <utility>
+
+namespace s2e {
+namespace plugins {
+
+///
+/// Counters of the sink calls of the tracker plugins, per call site and per
+/// state, dumped periodically to a JSON file in the S2E output directory:
+///
+/// {"time": 1718000000.123, "constraints_added": 320, "invalid_constraints": 0,
+///  "call_sites": [{"sink": "php_output_write", "pc": "0x5a1f30", "hits": 12, "symbolic_hits": 4,
+///                  "solver_calls": 3, "solver_failures": 0, "solver_us": 52000, "max_solver_us": 31000,
+///                  "skipped": 1, "test_cases": 2}],
+///  "states": [{"id": 3, "hits": 2, ...}]}
+///
+/// The file is rewritten as a whole on every dump. A forked S2E process starts
+/// from zero, so the files of all processes of a run can simply be summed.
+///
+class SinkStats {
+public:
+    struct Counters {
+        uint64_t hits = 0;
+        uint64_t symbolicHits = 0;
+        uint64_t solverCalls = 0;
+        uint64_t solverFailures = 0;
+        uint64_t solverMicros = 0;
+        uint64_t maxSolverMicros = 0;
+        // Symbolic hits that didn't ask the solver: call site limit, already exploited or no new constraints
+        uint64_t skipped = 0;
+        uint64_t testCases = 0;
+    };
+
+    SinkStats(S2E *s2e) : m_s2e(s2e), m_pid(0), m_interval(10), m_constraintsAdded(0), m_invalidConstraints(0) {
+    }
+
+    /// Set the file name, an empty name disables the stats
+    void setFileName(const std::string &fileName) {
+        m_fileName = fileName;
+    }
+
+    bool enabled() const {
+        return !m_fileName.empty();
+    }
+
+    /// Seconds between two dumps
+    void setInterval(unsigned interval) {
+        m_interval = interval;
+    }
+
+    void hit(S2EExecutionState *state, const std::string &sink, uint64_t callerPc, bool symbolic);
+    void solved(S2EExecutionState *state, const std::string &sink, uint64_t callerPc, uint64_t micros, bool success);
+    void skipped(S2EExecutionState *state, const std::string &sink, uint64_t callerPc);
+    void testCase(S2EExecutionState *state, const std::string &sink, uint64_t callerPc);
+
+    /// Constraints added to the symbolic inputs when they are created
+    void constraintsAdded(uint64_t count);
+    /// A state was terminated because one of these constraints was invalid
+    void invalidConstraint();
+
+    /// Dump the counters if the interval elapsed since the last dump
+    void onTimer();
+    void dump();
+
+private:
+    S2E *m_s2e;
+    std::string m_fileName;
+    pid_t m_pid;
+    unsigned m_interval;
+    std::chrono::steady_clock::time_point m_lastDump;
+
+    uint64_t m_constraintsAdded;
+    uint64_t m_invalidConstraints;
+    // (sink, call site) -> counters
+    std::map<std::pair<std::string, uint64_t>, Counters> m_callSites;
+    // state id -> counters, only for the states that reached a sink
+    std::map<int, Counters> m_states;
+
+    void checkFork();
+    template <typename F> void update(S2EExecutionState *state, const std::string &sink, uint64_t callerPc, F fn);
+};
+
+} // namespace plugins
+} // namespace s2e
+
+#endif // S2E_PLUGINS_SINKSTATS_H
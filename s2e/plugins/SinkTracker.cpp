@@ -0,0 +1,302 @@
+///
+/// Copyright (C) 2025, TaiYou
+///
+/// Permission is hereby granted, free of charge, to any person obtaining a copy
+/// of this software and associated documentation files (the "Software"), to deal
+/// in the Software without restriction, including without limitation the rights
+/// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+/// copies of the Software, and to permit persons to whom the Software is
+/// furnished to do so, subject to the following conditions:
+///
+/// The above copyright notice and this permission notice shall be included in all
+/// copies or substantial portions of the Software.
+///
+/// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+/// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+/// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+/// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+/// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+/// OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+/// SOFTWARE.
+///
+
+
+#include <s2e/ConfigFile.h>
+#include <s2e/Plugins/OSMonitors/ModuleDescriptor.h>
+#include <s2e/S2E.h>
+#include <s2e/Utils.h>
+#include <s2e/cpu.h>
+
+#include <klee/util/ExprUtil.h>
+
+#include <chrono>
+
+#include "SinkTracker.h"
+
+namespace s2e {
+namespace plugins {
+
+namespace {
+
+// System V calling convention: rdi, rsi, rdx, rcx, r8, r9
+const unsigned ARG_REGISTERS[] = {R_EDI, R_ESI, R_EDX, R_ECX, 8, 9};
+const unsigned ARG_REGISTER_COUNT = sizeof(ARG_REGISTERS) / sizeof(ARG_REGISTERS[0]);
+
+// Offsets of the length and value of a zend_string
+const uint64_t ZEND_STRING_LEN_OFFSET = 0x10;
+const uint64_t ZEND_STRING_VAL_OFFSET = 0x18;
+
+class SinkTrackerState : public PluginState {
+    // (call site, exploitable names) -> number of constraints when it was last solved
+    std::map<std::pair<uint64_t, std::set<std::string>>, size_t> m_solvedConstraints;
+
+public:
+    static PluginState *factory(Plugin *p, S2EExecutionState *s) {
+        return new SinkTrackerState();
+    }
+
+    virtual ~SinkTrackerState() {
+    }
+
+    virtual SinkTrackerState *clone() const {
+        return new SinkTrackerState(*this);
+    }
+
+    // Without new constraints the solver would return the same solution again
+    bool isSolved(uint64_t callerPc, const std::set<std::string> &foundNames, size_t constraints) {
+        auto key = std::make_pair(callerPc, foundNames);
+        auto it = m_solvedConstraints.find(key);
+        if (it != m_solvedConstraints.end() && it->second == constraints) {
+            return true;
+        }
+        m_solvedConstraints[key] = constraints;
+        return false;
+    }
+};
+
+uint64_t readArg(S2EExecutionState *state, unsigned arg) {
+    return state->regs()->read<uint64_t>(offsetof(CPUX86State, regs[ARG_REGISTERS[arg]]));
+}
+
+} // namespace
+
+S2E_DEFINE_PLUGIN(SinkTracker, "Tracks symbolic data reaching the sink functions of PHP", "", "FunctionMonitor");
+
+void SinkTracker::initialize() {
+    ConfigFile *cfg = s2e()->getConfig();
+
+    std::string testCaseFile = cfg->getString(getConfigKey() + ".testCaseFile", "");
+    unsigned maxPerCallSite = cfg->getInt(getConfigKey() + ".maxTestCasesPerCallSite", 0);
+    std::string policy = cfg->getString(getConfigKey() + ".onExploitable", "continue");
+
+    bool ok = false;
+    ConfigFile::string_list sinkNames = cfg->getListKeys(getConfigKey() + ".sinks", &ok);
+    if (!ok || sinkNames.empty()) {
+        getWarningsStream() << "No sinks to track\n";
+    }
+
+    for (const auto &name : sinkNames) {
+        std::string key = getConfigKey() + ".sinks." + name;
+
+        Sink sink;
+        sink.name = name;
+        sink.kind = cfg->getString(key + ".kind", name);
+        sink.arg = cfg->getInt(key + ".arg", 0);
+        sink.exploitable = cfg->getBool(key + ".exploitable", sink.kind == "xss");
+
+        std::string layout = cfg->getString(key + ".layout", "buffer");
+        if (layout == "buffer") {
+            sink.layout = LAYOUT_BUFFER;
+        } else if (layout == "zend_string") {
+            sink.layout = LAYOUT_ZEND_STRING;
+        } else {
+            getWarningsStream() << "Unknown layout " << layout << " for sink " << name << "\n";
+            exit(-1);
+        }
+
+        unsigned lastArg = sink.layout == LAYOUT_BUFFER ? sink.arg + 1 : sink.arg;
+        if (lastArg >= ARG_REGISTER_COUNT) {
+            getWarningsStream() << "Sink " << name << " uses a stack argument, which is not supported\n";
+            exit(-1);
+        }
+
+        auto &recorder = m_recorders[sink.kind];
+        if (!recorder) {
+            recorder.reset(new TestCaseRecorder(s2e(), sink.kind));
+            if (!testCaseFile.empty()) {
+                recorder->setFileName(sink.kind + "-" + testCaseFile);
+            }
+            recorder->setMaxPerCallSite(maxPerCallSite);
+            if (!recorder->setPolicy(policy)) {
+                getWarningsStream() << "Unknown onExploitable policy " << policy << ", using continue\n";
+            }
+        }
+        sink.recorder = recorder.get();
+
+        uint64_t address = cfg->getInt(key + ".address");
+        m_sinks[address] = sink;
+    }
+
+    m_stats.setFileName(cfg->getString(getConfigKey() + ".statsFile", ""));
+    m_stats.setInterval(cfg->getInt(getConfigKey() + ".statsInterval", 10));
+    if (m_stats.enabled()) {
+        s2e()->getCorePlugin()->onTimer.connect(sigc::mem_fun(*this, &SinkTracker::onTimer));
+        s2e()->getCorePlugin()->onEngineShutdown.connect(sigc::mem_fun(*this, &SinkTracker::onEngineShutdown));
+    }
+
+    if (cfg->getBool(getConfigKey() + ".constrainPrintable", true)) {
+        s2e()->getCorePlugin()->onSymbolicVariableCreation.connect(
+            sigc::mem_fun(*this, &SinkTracker::onSymbolicVariableCreation));
+    }
+    s2e()->getPlugin<FunctionMonitor>()->onCall.connect(sigc::mem_fun(*this, &SinkTracker::onCall));
+}
+
+void SinkTracker::onCall(S2EExecutionState *state, const ModuleDescriptorConstPtr &source,
+                         const ModuleDescriptorConstPtr &dest, uint64_t callerPc, uint64_t calleePc,
+                         const FunctionMonitor::ReturnSignalPtr &returnSignal) {
+    auto it = m_sinks.find(state->regs()->getPc());
+    if (it == m_sinks.end()) {
+        return;
+    }
+    const Sink &sink = it->second;
+
+    uint64_t address, size;
+    if (!readSinkData(state, sink, address, size)) {
+        getWarningsStream(state) << "[" << sink.name << "] Could not read sink data\n";
+        return;
+    }
+
+    bool symbolic = state->mem()->symbolic(address, size);
+    m_stats.hit(state, sink.name, callerPc, symbolic);
+    if (symbolic) {
+        getDebugStream(state) << "[" << sink.name << "] Received symbolic memory access\n";
+        generateTestCases(state, sink, callerPc, address, size);
+    } else {
+        std::string str;
+        state->mem()->readString(address, str, size);
+        getDebugStream(state) << "[" << sink.name << "] Received string: " << str << "\n";
+    }
+}
+
+bool SinkTracker::readSinkData(S2EExecutionState *state, const Sink &sink, uint64_t &address, uint64_t &size) {
+    switch (sink.layout) {
+        case LAYOUT_BUFFER:
+            address = readArg(state, sink.arg);
+            size = readArg(state, sink.arg + 1);
+            return true;
+        case LAYOUT_ZEND_STRING: {
+            uint64_t str = readArg(state, sink.arg);
+            address = str + ZEND_STRING_VAL_OFFSET;
+            return state->mem()->read<uint64_t>(str + ZEND_STRING_LEN_OFFSET, &size);
+        }
+        default:
+            return false;
+    }
+}
+
+void SinkTracker::generateTestCases(S2EExecutionState *state, const Sink &sink, uint64_t callerPc, uint64_t address,
+                                    uint64_t size) {
+    TestCaseRecorder *recorder = sink.recorder;
+
+    if (!recorder->canRecord(callerPc)) {
+        m_stats.skipped(state, sink.name, callerPc);
+        if (recorder->isExploited(callerPc)) {
+            recorder->applyPolicy(state, callerPc);
+        }
+        return;
+    }
+
+    // Symbolic inputs that end up in the data reaching an exploitable sink
+    std::set<std::string> foundNames;
+    for (uint64_t i = 0; sink.exploitable && i < size; i++) {
+        klee::ref<klee::Expr> byteExpr = state->mem()->read(address + i);
+        if (byteExpr && !isa<klee::ConstantExpr>(byteExpr)) {
+            std::vector<klee::ref<klee::ReadExpr>> reads;
+            klee::findReads(byteExpr, false, reads);
+            for (const auto &read : reads) {
+                foundNames.insert(read->getUpdates()->getRoot()->getName());
+            }
+        }
+    }
+
+    if (recorder->isExploited(callerPc, foundNames)) {
+        m_stats.skipped(state, sink.name, callerPc);
+        recorder->applyPolicy(state, callerPc);
+        return;
+    }
+
+    DECLARE_PLUGINSTATE(SinkTrackerState, state);
+    if (plgState->isSolved(callerPc, foundNames, state->constraints().size())) {
+        m_stats.skipped(state, sink.name, callerPc);
+        return;
+    }
+
+    TestCaseRecorder::ConcreteInputs inputs;
+    auto solverStart = std::chrono::steady_clock::now();
+    bool solved = state->getSymbolicSolution(inputs);
+    auto solverMicros =
+        std::chrono::duration_cast<std::chrono::microseconds>(std::chrono::steady_clock::now() - solverStart);
+    m_stats.solved(state, sink.name, callerPc, solverMicros.count(), solved);
+    if (!solved) {
+        getWarningsStream(state) << "Could not get symbolic solutions" << '\n';
+        return;
+    }
+
+    if (!recorder->add(callerPc, inputs, foundNames)) {
+        return;
+    }
+    m_stats.testCase(state, sink.name, callerPc);
+
+    getDebugStream(state) << "[" << sink.name << "] Test case at " << hexval(callerPc) << " with "
+                          << foundNames.size() << " exploitable inputs\n";
+    recorder->write(state, inputs, foundNames);
+
+    if (!foundNames.empty()) {
+        recorder->markExploited(callerPc, foundNames);
+        recorder->applyPolicy(state, callerPc);
+    }
+}
+
+// Symbolic bytes may only be printable or NUL
+void SinkTracker::onSymbolicVariableCreation(S2EExecutionState *state, const std::string &name,
+                                             const std::vector<klee::ref<klee::Expr>> &expr,
+                                             const klee::ArrayPtr &array) {
+    uint64_t address;
+    state->regs()->read(CPU_OFFSET(regs[R_EAX]), &address, sizeof(address), false);
+
+    uint64_t added = 0;
+    for (uint64_t i = 0; i < array->getSize(); ++i) {
+        klee::ref<klee::Expr> byteExpr = state->mem()->read(address + i);
+        if (byteExpr) {
+            klee::ref<klee::Expr> ge20 =
+                klee::SgeExpr::create(byteExpr, klee::ConstantExpr::create(0x20, byteExpr->getWidth()));
+            klee::ref<klee::Expr> le7E =
+                klee::SleExpr::create(byteExpr, klee::ConstantExpr::create(0x7E, byteExpr->getWidth()));
+            klee::ref<klee::Expr> asciiPrintable = klee::AndExpr::create(ge20, le7E);
+
+            klee::ref<klee::Expr> isNull =
+                klee::EqExpr::create(byteExpr, klee::ConstantExpr::create(0, byteExpr->getWidth()));
+
+            klee::ref<klee::Expr> validChar = klee::OrExpr::create(asciiPrintable, isNull);
+
+            if (!state->addConstraint(validChar, true)) {
+                m_stats.constraintsAdded(added);
+                m_stats.invalidConstraint();
+                s2e()->getExecutor()->terminateState(*state, "Tried to add an invalid constraint");
+            }
+            ++added;
+        }
+    }
+    m_stats.constraintsAdded(added);
+}
+
+void SinkTracker::onTimer() {
+    m_stats.onTimer();
+}
+
+void SinkTracker::onEngineShutdown() {
+    m_stats.dump();
+}
+
+} // namespace plugins
+} // namespace s2e
@@ -0,0 +1,116 @@
+///
+/// Copyright (C) 2025, TaiYou
+///
+/// Permission is hereby granted, free of charge, to any person obtaining a copy
+/// of this software and associated documentation files (the "Software"), to deal
+/// in the Software without restriction, including without limitation the rights
+/// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+/// copies of the Software, and to permit persons to whom the Software is
+/// furnished to do so, subject to the following conditions:
+///
+/// The above copyright notice and this permission notice shall be included in all
+/// copies or substantial portions of the Software.
+///
+/// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+/// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+/// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+/// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+/// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+/// OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+/// SOFTWARE.
+///
+
+
+#ifndef S2E_PLUGINS_SINKTRACKER_H
+#define S2E_PLUGINS_SINKTRACKER_H
+
+#include <s2e/Plugin.h>
+
+#include <s2e/Plugins/ExecutionMonitors/FunctionMonitor.h>
+
+#include <map>
+#include <memory>
+#include <unordered_map>
+
+#include "SinkStats.h"
+#include "TestCaseRecorder.h"
+
+namespace s2e {
+namespace plugins {
+
+///
+/// Tracks every sink function of the PHP binary with a single onCall handler.
+/// Sinks are looked up by address in a hash map, so adding sinks costs nothing
+/// for the calls that don't hit one.
+///
+/// pluginsConfig.SinkTracker = {
+///     testCaseFile = "SinkTracker.testcases.jsonl",
+///     maxTestCasesPerCallSite = 0,
+///     onExploitable = "continue",
+///     constrainPrintable = true,
+///     statsFile = "SinkTracker.stats.json",
+///     statsInterval = 10,
+///     sinks = {
+///         php_output_write = { address = 0x..., kind = "xss", layout = "buffer", arg = 0 },
+///         sqlite_handle_preparer = { address = 0x..., kind = "sqli", layout = "zend_string", arg = 1 },
+///     },
+/// }
+///
+/// Layouts describe where the data reaching the sink is:
+///   - buffer: a pointer in argument `arg` and its length in argument `arg + 1`
+///   - zend_string: a zend_string pointer in argument `arg`
+///
+/// Test cases of each kind are written to "<kind>-<testCaseFile>".
+///
+/// Symbolic inputs reaching an exploitable sink are reported as exploitable,
+/// and only those call sites are subject to the onExploitable policy. Sinks
+/// are exploitable if they set `exploitable = true`, which is the default for
+/// the "xss" kind: printed inputs are what the XSS checker injects payloads
+/// into. A query reached with symbolic data is only a candidate injection
+/// until the SQLi checker confirms it, so its call site is never cut.
+///
+/// If statsFile is set, the hits, solver calls and test cases of every call
+/// site and state are dumped to it every statsInterval seconds (see SinkStats).
+///
+class SinkTracker : public Plugin {
+
+    S2E_PLUGIN
+public:
+    SinkTracker(S2E *s2e) : Plugin(s2e), m_stats(s2e) {
+    }
+
+    void initialize();
+
+    void onCall(S2EExecutionState *state, const ModuleDescriptorConstPtr &source, const ModuleDescriptorConstPtr &dest,
+                uint64_t callerPc, uint64_t calleePc, const FunctionMonitor::ReturnSignalPtr &returnSignal);
+    void onSymbolicVariableCreation(S2EExecutionState *state, const std::string &name,
+                                    const std::vector<klee::ref<klee::Expr>> &expr, const klee::ArrayPtr &array);
+    void onTimer();
+    void onEngineShutdown();
+
+private:
+    enum SinkLayout { LAYOUT_BUFFER, LAYOUT_ZEND_STRING };
+
+    struct Sink {
+        std::string name;
+        std::string kind;
+        SinkLayout layout;
+        unsigned arg;
+        bool exploitable;
+        TestCaseRecorder *recorder;
+    };
+
+    std::unordered_map<uint64_t, Sink> m_sinks;
+    // One recorder per sink kind, shared by the sinks of that kind
+    std::map<std::string, std::unique_ptr<TestCaseRecorder>> m_recorders;
+    SinkStats m_stats;
+
+    bool readSinkData(S2EExecutionState *state, const Sink &sink, uint64_t &address, uint64_t &size);
+    void generateTestCases(S2EExecutionState *state, const Sink &sink, uint64_t callerPc, uint64_t address,
+                           uint64_t size);
+};
+
+} // namespace plugins
+} // namespace s2e
+
+#endif // S2E_PLUGINS_SINKTRACKER_H
@@ -0,0 +1,182 @@
+///
+/// Copyright (C) 2025, TaiYou
+///
+/// Permission is hereby granted, free of charge, to any person obtaining a copy
+/// of this software and associated documentation files (the "Software"), to deal
+/// in the Software without restriction, including without limitation the rights
+/// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+/// copies of the Software, and to permit persons to whom the Software is
+/// furnished to do so, subject to the following conditions:
+///
+/// The above copyright notice and this permission notice shall be included in all
+/// copies or substantial portions of the Software.
+///
+/// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+/// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+/// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+/// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+/// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+/// OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+/// SOFTWARE.
+///
+
+
+#include <chrono>
+#include <iomanip>
+#include <sstream>
+#include <unistd.h>
+
+#include <s2e/S2EExecutor.h>
+#include <s2e/Utils.h>
+
+#include "TestCaseRecorder.h"
+
+namespace s2e {
+namespace plugins {
+
+namespace {
+
+void writeJsonString(std::stringstream &ss, const std::string &str) {
+    ss << '"';
+    for (unsigned char c : str) {
+        if (c == '"' || c == '\\') {
+            ss << '\\' << c;
+        } else if (c < 0x20 || c >= 0x7f) {
+            ss << "\\u" << std::setw(4) << std::setfill('0') << std::hex << (unsigned) c << std::dec;
+        } else {
+            ss << c;
+        }
+    }
+    ss << '"';
+}
+
+// FNV-1a
+uint64_t hashBytes(uint64_t hash, const void *data, size_t size) {
+    const unsigned char *bytes = static_cast<const unsigned char *>(data);
+    for (size_t i = 0; i < size; ++i) {
+        hash ^= bytes[i];
+        hash *= 0x100000001b3ULL;
+    }
+    return hash;
+}
+
+} // namespace
+
+TestCaseRecorder::~TestCaseRecorder() {
+    delete m_os;
+}
+
+llvm::raw_ostream *TestCaseRecorder::getStream() {
+    // A forked S2E process gets its own output directory, so don't keep
+    // writing to the file of the parent
+    if (m_os && m_pid == getpid()) {
+        return m_os;
+    }
+
+    delete m_os;
+    m_os = m_s2e->openOutputFile(m_fileName);
+    m_pid = getpid();
+    return m_os;
+}
+
+bool TestCaseRecorder::canRecord(uint64_t callerPc) const {
+    if (m_maxPerCallSite == 0) {
+        return true;
+    }
+
+    auto it = m_callSiteCounts.find(callerPc);
+    return it == m_callSiteCounts.end() || it->second < m_maxPerCallSite;
+}
+
+bool TestCaseRecorder::add(uint64_t callerPc, const ConcreteInputs &inputs,
+                           const std::set<std::string> &exploitable) {
+    uint64_t hash = hashBytes(0xcbf29ce484222325ULL, &callerPc, sizeof(callerPc));
+    for (const auto &vp : inputs) {
+        uint64_t size = vp.second.size();
+        hash = hashBytes(hash, vp.first.data(), vp.first.size() + 1);
+        hash = hashBytes(hash, &size, sizeof(size));
+        hash = hashBytes(hash, vp.second.data(), vp.second.size());
+    }
+    for (const auto &name : exploitable) {
+        hash = hashBytes(hash, name.data(), name.size() + 1);
+    }
+
+    if (!m_seen.insert(hash).second) {
+        return false;
+    }
+
+    ++m_callSiteCounts[callerPc];
+    return true;
+}
+
+bool TestCaseRecorder::setPolicy(const std::string &policy) {
+    if (policy == "continue") {
+        m_policy = POLICY_CONTINUE;
+    } else if (policy == "kill") {
+        m_policy = POLICY_KILL;
+    } else if (policy == "no-fork") {
+        m_policy = POLICY_NO_FORK;
+    } else {
+        return false;
+    }
+    return true;
+}
+
+void TestCaseRecorder::applyPolicy(S2EExecutionState *state, uint64_t callerPc) {
+    switch (m_policy) {
+        case POLICY_KILL: {
+            std::stringstream ss;
+            ss << "Exploitable " << m_kind << " test case already found at " << hexval(callerPc);
+            m_s2e->getExecutor()->terminateState(*state, ss.str());
+            break;
+        }
+        case POLICY_NO_FORK:
+            state->disableForking();
+            break;
+        default:
+            break;
+    }
+}
+
+void TestCaseRecorder::write(S2EExecutionState *state, const ConcreteInputs &inputs,
+                             const std::set<std::string> &exploitable) {
+    if (!enabled()) {
+        return;
+    }
+
+    llvm::raw_ostream *os = getStream();
+    if (!os) {
+        m_s2e->getWarningsStream(state) << "Could not open test case file " << m_fileName << "\n";
+        return;
+    }
+
+    double now =
+        std::chrono::duration<double>(std::chrono::system_clock::now().time_since_epoch()).count();
+
+    std::stringstream ss;
+    ss << "{\"kind\": ";
+    writeJsonString(ss, m_kind);
+    ss << ", \"state\": " << state->getID();
+    ss << ", \"time\": " << std::fixed << std::setprecision(3) << now;
+    ss << ", \"inputs\": [";
+    for (unsigned i = 0; i < inputs.size(); ++i) {
+        const VarValuePair &vp = inputs[i];
+        if (i != 0) {
+            ss << ", ";
+        }
+        ss << "{\"name\": ";
+        writeJsonString(ss, vp.first);
+        ss << ", \"bytes\": \"";
+        for (unsigned char byte : vp.second) {
+            ss << std::setw(2) << std::setfill('0') << std::hex << (unsigned) byte << std::dec;
+        }
+        ss << "\", \"exploitable\": " << (exploitable.count(vp.first) ? "true" : "false") << "}";
+    }
+    ss << "]}\n";
+
+    *os << ss.str();
+    os->flush();
+}
+
+} // namespace plugins
+} // namespace s2e
@@ -0,0 +1,148 @@
+///
+/// Copyright (C) 2025, TaiYou
+///
+/// Permission is hereby granted, free of charge, to any person obtaining a copy
+/// of this software and associated documentation files (the "Software"), to deal
+/// in the Software without restriction, including without limitation the rights
+/// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+/// copies of the Software, and to permit persons to whom the Software is
+/// furnished to do so, subject to the following conditions:
+///
+/// The above copyright notice and this permission notice shall be included in all
+/// copies or substantial portions of the Software.
+///
+/// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+/// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+/// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+/// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+/// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+/// OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+/// SOFTWARE.
+///
+
+
+#ifndef S2E_PLUGINS_TESTCASERECORDER_H
+#define S2E_PLUGINS_TESTCASERECORDER_H
+
+#include <s2e/S2E.h>
+#include <s2e/S2EExecutionState.h>
+
+#include <llvm/Support/raw_ostream.h>
+
+#include <map>
+#include <set>
+#include <string>
+#include <sys/types.h>
+#include <unordered_set>
+#include <vector>
+
+namespace s2e {
+namespace plugins {
+
+///
+/// Writes the test cases found by the tracker plugins as JSON lines to a file
+/// in the S2E output directory, one record per line:
+///
+/// {"kind": "xss", "state": 3, "time": 1718000000.123,
+///  "inputs": [{"name": "v0_arg1_0", "bytes": "41420000", "exploitable": true}]}
+///
+/// The file is reopened after S2E forks a new process, so every instance
+/// writes to its own output directory.
+///
+/// The recorder also deduplicates test cases across states: a solution is
+/// only reported once per call site, and at most maxPerCallSite test cases
+/// are reported for a call site if a limit is set.
+///
+/// Once a call site has produced an exploitable test case, the states that
+/// reach it with the same exploitable inputs are handled by the
+/// onExploitable policy, so the search moves on to other sinks.
+///
+class TestCaseRecorder {
+public:
+    typedef std::pair<std::string, std::vector<unsigned char>> VarValuePair;
+    typedef std::vector<VarValuePair> ConcreteInputs;
+
+    enum ExploitablePolicy {
+        // Keep exploring the state
+        POLICY_CONTINUE,
+        // Terminate the state
+        POLICY_KILL,
+        // Let the state finish its current path without forking new states
+        POLICY_NO_FORK
+    };
+
+    TestCaseRecorder(S2E *s2e, const std::string &kind)
+        : m_s2e(s2e), m_kind(kind), m_pid(0), m_os(nullptr), m_maxPerCallSite(0), m_policy(POLICY_CONTINUE) {
+    }
+
+    ~TestCaseRecorder();
+
+    /// Set the file name, an empty name disables the recorder
+    void setFileName(const std::string &fileName) {
+        m_fileName = fileName;
+    }
+
+    bool enabled() const {
+        return !m_fileName.empty();
+    }
+
+    /// Limit the number of test cases per call site, 0 means no limit
+    void setMaxPerCallSite(unsigned maxPerCallSite) {
+        m_maxPerCallSite = maxPerCallSite;
+    }
+
+    /// Whether the call site may still produce test cases, checked before
+    /// asking the solver for a solution
+    bool canRecord(uint64_t callerPc) const;
+
+    /// Remember a test case, returns false if the call site already produced it
+    bool add(uint64_t callerPc, const ConcreteInputs &inputs, const std::set<std::string> &exploitable);
+
+    /// Set the policy from its name in the config: "continue", "kill" or "no-fork"
+    bool setPolicy(const std::string &policy);
+
+    /// Remember that the call site produced an exploitable test case
+    void markExploited(uint64_t callerPc, const std::set<std::string> &exploitable) {
+        if (m_policy != POLICY_CONTINUE) {
+            m_exploited.insert(std::make_pair(callerPc, exploitable));
+            m_exploitedCallSites.insert(callerPc);
+        }
+    }
+
+    bool isExploited(uint64_t callerPc, const std::set<std::string> &exploitable) const {
+        return m_exploited.count(std::make_pair(callerPc, exploitable)) > 0;
+    }
+
+    bool isExploited(uint64_t callerPc) const {
+        return m_exploitedCallSites.count(callerPc) > 0;
+    }
+
+    /// Apply the policy to a state at an exploited call site. Doesn't return
+    /// if the state is killed.
+    void applyPolicy(S2EExecutionState *state, uint64_t callerPc);
+
+    void write(S2EExecutionState *state, const ConcreteInputs &inputs, const std::set<std::string> &exploitable);
+
+private:
+    S2E *m_s2e;
+    std::string m_kind;
+    std::string m_fileName;
+    pid_t m_pid;
+    llvm::raw_ostream *m_os;
+
+    unsigned m_maxPerCallSite;
+    std::map<uint64_t, unsigned> m_callSiteCounts;
+    // Hashes of (call site, solution) pairs that were already reported
+    std::unordered_set<uint64_t> m_seen;
+
+    ExploitablePolicy m_policy;
+    std::set<std::pair<uint64_t, std::set<std::string>>> m_exploited;
+    std::unordered_set<uint64_t> m_exploitedCallSites;
+
+    llvm::raw_ostream *getStream();
+};
+
+} // namespace plugins
+} // namespace s2e
+
+#endif // S2E_PLUGINS_TESTCASERECORDER_H
@@ -119,7 +119,10 @@ function execute_target {
     # php is dynamically linked, so s2e.so has been preloaded to
     # provide symbolic arguments to the target if required. You can do so by
     # using the ``S2E_SYM_ARGS`` environment variable as required
-    S2E_SYM_ARGS="" LD_PRELOAD="${S2E_SO}" "${TARGET}" "$@" > /dev/null 2> /dev/null
+    # pipeline_runner.py times the guest bootstrap up to this message
+    ${S2ECMD} message "SymWP: target started"
+    # Minimal loaders report the functions they miss through s2ecmd
+    SYMWP_S2ECMD="$(realpath "${S2ECMD}")" S2E_SYM_ARGS="" LD_PRELOAD="${S2E_SO}" "${TARGET}" "$@" > /dev/null 2> /dev/null
 }
 
 # Nothing more to initialize on Linux
@@ -133,9 +136,70 @@ function target_tools {
     echo "${TARGET_TOOLS32_ROOT}/s2e.so" "${TARGET_TOOLS64_ROOT}/s2e.so"
 }
 
+# Make PHP, WordPress and the loaders of a guest snapshot available in the
+# working directory. If the guest image already has this snapshot, nothing is
+# transferred; otherwise the compressed bundle is fetched and unpacked.
+function load_guest_snapshot {
+    local SNAPSHOT_ID
+    local SNAPSHOT_BUNDLE
+
+    SNAPSHOT_ID="$1"
+    SNAPSHOT_BUNDLE="guest-${SNAPSHOT_ID}.tar.gz"
+
+    if [ ! -f "${GUEST_SNAPSHOT_ROOT}/.snapshot-${SNAPSHOT_ID}" ]; then
+        ${S2ECMD} get "${SNAPSHOT_BUNDLE}"
+        if [ ! -f "${SNAPSHOT_BUNDLE}" ]; then
+            ${S2ECMD} kill 1 "Could not fetch guest snapshot ${SNAPSHOT_BUNDLE} from host"
+        fi
+        rm -rf "${GUEST_SNAPSHOT_ROOT}"
+        mkdir -p "${GUEST_SNAPSHOT_ROOT}"
+        tar -xzf "${SNAPSHOT_BUNDLE}" -C "${GUEST_SNAPSHOT_ROOT}"
+        rm -f "${SNAPSHOT_BUNDLE}"
+        touch "${GUEST_SNAPSHOT_ROOT}/.snapshot-${SNAPSHOT_ID}"
+    fi
+
+    for ENTRY in "${GUEST_SNAPSHOT_ROOT}"/*; do
+        ln -sfn "${ENTRY}" .
+    done
+}
+
+# Opcache looks scripts up by their full path, so the plugin is moved to where
+# the host compiled it and linked back
+function load_opcache {
+    local PLUGIN
+
+    PLUGIN="$1"
+
+    mkdir -p "${GUEST_SNAPSHOT_ROOT}/plugins"
+    rm -rf "${GUEST_SNAPSHOT_ROOT}/plugins/${PLUGIN}"
+    mv "${PLUGIN}" "${GUEST_SNAPSHOT_ROOT}/plugins/${PLUGIN}"
+    ln -sfn "${GUEST_SNAPSHOT_ROOT}/plugins/${PLUGIN}" .
+
+    ${S2ECMD} get "${OPCACHE}"
+    if [ ! -f "${OPCACHE}" ]; then
+        ${S2ECMD} kill 1 "Could not fetch opcache ${OPCACHE} from host"
+    fi
+    rm -rf "${GUEST_SNAPSHOT_ROOT}/opcache"
+    tar -xf "${OPCACHE}" -C "${GUEST_SNAPSHOT_ROOT}"
+    rm -f "${OPCACHE}"
+
+    # Loads conf.d/opcache.ini without changing the PHP command line
+    export PHP_INI_SCAN_DIR="${GUEST_SNAPSHOT_ROOT}/conf.d"
+}
+
 S2ECMD=./s2ecmd
 COMMON_TOOLS="s2ecmd"
 
+# Set by pipeline_runner.py --guest-snapshot
+GUEST_SNAPSHOT=""
+GUEST_SNAPSHOT_ROOT="/var/tmp/symwp"
+
+# Set by pipeline_runner.py --opcache
+OPCACHE=""
+
+# Set by pipeline_runner.py --minimal-loader
+MINIMAL_LOADER=""
+
 ###############################################################################
 
 update_common_tools
@@ -161,20 +225,28 @@ sudo swapoff -a
 
 target_init
 
-# Download the target file to analyze
-${S2ECMD} get "php"
+if [ -n "${GUEST_SNAPSHOT}" ]; then
+    # PHP, WordPress and loaders
+    load_guest_snapshot "${GUEST_SNAPSHOT}"
+else
+    # Download the target file to analyze
+    ${S2ECMD} get "php"
 
-# WordPress
-${S2ECMD} get "WordPress.tar.gz"
-tar -xzf WordPress.tar.gz
+    # WordPress
+    ${S2ECMD} get "WordPress.tar.gz"
+    tar -xzf WordPress.tar.gz
 
-# WordPress loader
-${S2ECMD} get "base-wordpress-loader.php"
-${S2ECMD} get "symbolic-wordpress-loader.php"
+    # WordPress loader
+    ${S2ECMD} get "base-wordpress-loader.php"
+    ${S2ECMD} get "symbolic-wordpress-loader.php"
+fi
 
 # Plugin
 
 ${S2ECMD} get "harness.php"
+if [ -n "${MINIMAL_LOADER}" ]; then
+    ${S2ECMD} get "${MINIMAL_LOADER}"
+fi
 
 # Run the analysis
 TARGET_PATH='./php'
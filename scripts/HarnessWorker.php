@@ -0,0 +1,194 @@
+<?php
+
+/**
+ * Long-lived harness runner for the dynamic checkers.
+ *
+ * Booting WordPress through the concrete loader dominates the cost of a single
+ * harness run, so the worker loads it once, listens on a Unix socket and forks
+ * a child per request. The child runs the harness (without its loader require)
+ * with the requested argv and sends the output back over the connection, while
+ * the parent state stays untouched for the next request.
+ *
+ * Protocol: the client sends one JSON line {"harness": path, "argv": [base64...],
+ * "merge_stderr": bool} and reads the harness output until the worker closes
+ * the connection.
+ */
+class HarnessWorker
+{
+    public const SOCKET_ENV_VAR = 'SYMWP_HARNESS_WORKER';
+    public const ACCEPT_TIMEOUT_SECONDS = 1;
+
+    private static $conn = null;
+    private static ?string $errorLog = null;
+
+    /**
+     * Run a harness through the worker listening on $socketPath.
+     * Returns null if the worker can't be reached, so callers can fall back to
+     * a fresh PHP process.
+     */
+    public static function run(string $socketPath, string $harnessPath, array $argv, bool $mergeStderr = false): ?string
+    {
+        $conn = @stream_socket_client("unix://$socketPath", $errno, $errstr);
+        if ($conn === false) {
+            return null;
+        }
+
+        $request = [
+            'harness' => $harnessPath,
+            'argv' => array_map('base64_encode', array_values($argv)),
+            'merge_stderr' => $mergeStderr,
+        ];
+        fwrite($conn, json_encode($request) . "\n");
+        $output = stream_get_contents($conn);
+        fclose($conn);
+
+        return $output === false ? null : $output;
+    }
+
+    public static function listen(string $socketPath)
+    {
+        if (file_exists($socketPath)) {
+            unlink($socketPath);
+        }
+
+        $server = stream_socket_server("unix://$socketPath", $errno, $errstr);
+        if ($server === false) {
+            echo "[!] Failed to listen on $socketPath: $errstr\n";
+            exit(1);
+        }
+
+        return $server;
+    }
+
+    public static function reap_children(): void
+    {
+        while (pcntl_waitpid(-1, $status, WNOHANG) > 0);
+    }
+
+    /**
+     * Read a request and return the harness code and argv for the child, or
+     * null if the request is invalid.
+     */
+    public static function read_request($conn, string $loader): ?array
+    {
+        $request = json_decode((string) fgets($conn), true);
+        if (!is_array($request) || !isset($request['harness'], $request['argv'])) {
+            fwrite($conn, "[!] Invalid harness worker request\n");
+            return null;
+        }
+
+        $code = @file_get_contents($request['harness']);
+        if ($code === false) {
+            fwrite($conn, "[!] Harness file does not exist: {$request['harness']}\n");
+            return null;
+        }
+
+        // The loader is already in place, requiring it again would redeclare everything
+        $code = preg_replace('/^require(_once)?\s+\'' . preg_quote($loader, '/') . '\';$/m', '', $code, 1);
+
+        return [
+            'code' => '?>' . $code,
+            'argv' => array_merge([$request['harness']], array_map('base64_decode', $request['argv'])),
+            'merge_stderr' => (bool) ($request['merge_stderr'] ?? false),
+        ];
+    }
+
+    /**
+     * Prepare the forked child to run a harness: reopen the database connection
+     * so children don't share the parent's handle, and capture everything the
+     * harness prints until it exits.
+     */
+    public static function prepare_child($conn, bool $mergeStderr): void
+    {
+        self::$conn = $conn;
+
+        if (isset($GLOBALS['wpdb']) && method_exists($GLOBALS['wpdb'], 'db_connect')) {
+            $GLOBALS['wpdb']->dbh = null;
+            $GLOBALS['wpdb']->db_connect();
+        }
+
+        if ($mergeStderr) {
+            self::$errorLog = tempnam(sys_get_temp_dir(), 'symwp-worker-');
+            ini_set('error_log', self::$errorLog);
+        }
+
+        ob_start();
+        // Registered from a shutdown function, so it runs after the ones of the harness
+        register_shutdown_function(function () {
+            register_shutdown_function([self::class, 'send_output']);
+        });
+    }
+
+    public static function send_output(): void
+    {
+        while (ob_get_level() > 1) {
+            ob_end_flush();
+        }
+        $output = ob_get_level() > 0 ? ob_get_clean() : '';
+
+        if (self::$errorLog !== null) {
+            $output .= (string) @file_get_contents(self::$errorLog);
+            @unlink(self::$errorLog);
+        }
+
+        fwrite(self::$conn, $output);
+        fclose(self::$conn);
+    }
+}
+
+if ($argv && $argv[0] && realpath($argv[0]) === __FILE__) {
+    if (count($argv) < 3) {
+        die("Usage: php {$argv[0]} <socket_path> <wordpress_loader>\n");
+    }
+    if (!function_exists('pcntl_fork')) {
+        die("[!] The harness worker requires the pcntl extension (configure PHP with --enable-pcntl).\n");
+    }
+    if (!file_exists($argv[2])) {
+        die("[!] WordPress loader does not exist.\n");
+    }
+
+    // Prefixed names, as harnesses run in this global scope and use names like $request
+    $__symwp_socket_path = $argv[1];
+    $__symwp_loader = $argv[2];
+    $__symwp_server = HarnessWorker::listen($__symwp_socket_path);
+
+    // Load WordPress in the global scope, exactly as a harness would
+    require $__symwp_loader;
+
+    echo "[+] Harness worker listening on $__symwp_socket_path\n";
+
+    while (true) {
+        $__symwp_conn = @stream_socket_accept($__symwp_server, HarnessWorker::ACCEPT_TIMEOUT_SECONDS);
+        HarnessWorker::reap_children();
+        if ($__symwp_conn === false) {
+            continue;
+        }
+
+        $__symwp_request = HarnessWorker::read_request($__symwp_conn, $__symwp_loader);
+        if ($__symwp_request === null) {
+            fclose($__symwp_conn);
+            continue;
+        }
+
+        $__symwp_pid = pcntl_fork();
+        if ($__symwp_pid === -1) {
+            fwrite($__symwp_conn, "[!] Failed to fork harness worker\n");
+            fclose($__symwp_conn);
+            continue;
+        }
+        if ($__symwp_pid > 0) {
+            fclose($__symwp_conn);
+            continue;
+        }
+
+        // Child: run the harness in the global scope with the requested argv
+        fclose($__symwp_server);
+        HarnessWorker::prepare_child($__symwp_conn, $__symwp_request['merge_stderr']);
+        $argv = $__symwp_request['argv'];
+        $argc = count($argv);
+        $_SERVER['argv'] = $argv;
+        $_SERVER['argc'] = $argc;
+        eval($__symwp_request['code']);
+        exit(0);
+    }
+}
@@ -0,0 +1,347 @@
+<?php
+
+/**
+ * Generate a minimal WordPress loader for a harness from concrete runs.
+ *
+ * The base loader requires every WordPress file a plugin might need, and all
+ * of them are compiled inside S2E for each harness. The tracer first loads the
+ * base loader once to learn which of its top-level requires defines which
+ * function and class. It then runs the concrete harness with a loader that
+ * keeps none of those requires, and adds back the require defining each
+ * function reported as undefined, until the harness runs as it does with the
+ * full loader. Classes of the files that were left out are autoloaded, so
+ * only function files have to be traced.
+ *
+ * The minimal loader is a copy of the base loader without the requires the
+ * harness didn't need. Loaders pick it up through $symwp_base_loader.
+ *
+ * Functions can't be autoloaded, and the trace only follows one concrete path.
+ * If a symbolic path calls a function of a file that was left out, the minimal
+ * loader sends MISS_MARKER with the function name to S2E through the s2ecmd
+ * named by SYMWP_S2ECMD when PHP shuts down, and pipeline_runner.py runs the
+ * harness again with the full loader.
+ */
+class LoaderTracer
+{
+    public const BASE_LOADER = 'base-wordpress-loader.php';
+    public const CONCRETE_LOADER = 'concrete-wordpress-loader.php';
+    public const RUN_TIMEOUT_SECONDS = 60;
+    public const REPORT_MARKER = '__SYMWP_LOADER_TRACER__';
+    // Sent by minimal loaders as a guest message, see pipeline_runner.py
+    public const MISS_MARKER = 'SymWP: minimal loader misses ';
+
+    // Required by the loader itself or by every harness (hooks for do_action)
+    public const ALWAYS_REQUIRED = ['version.php', 'compat.php', 'load.php', 'plugin.php'];
+
+    /**
+     * Find the top-level requires of the base loader.
+     * Returns line index => line.
+     */
+    public static function find_requires(array $lines): array
+    {
+        $requires = [];
+        foreach ($lines as $index => $line) {
+            if (preg_match('/^(require|include)(_once)?\s+ABSPATH\b.*;\s*$/', $line)) {
+                $requires[$index] = $line;
+            }
+        }
+        return $requires;
+    }
+
+    public static function is_always_required(string $line): bool
+    {
+        foreach (self::ALWAYS_REQUIRED as $file) {
+            if (str_contains($line, "/$file'")) {
+                return true;
+            }
+        }
+        return false;
+    }
+
+    /**
+     * Run PHP with the given arguments, killing it after $timeout seconds.
+     * Returns the combined stdout and stderr.
+     */
+    public static function run_php(array $args, int $timeout): string
+    {
+        $proc = proc_open(
+            array_merge([PHP_BINARY, '-d', 'display_errors=stderr'], $args),
+            [0 => ['file', '/dev/null', 'r'], 1 => ['pipe', 'w'], 2 => ['redirect', 1]],
+            $pipes
+        );
+        if (!is_resource($proc)) {
+            return '';
+        }
+
+        stream_set_blocking($pipes[1], false);
+        $output = '';
+        $deadline = microtime(true) + $timeout;
+        while (!feof($pipes[1]) && microtime(true) < $deadline) {
+            $read = [$pipes[1]];
+            $write = $except = null;
+            if (stream_select($read, $write, $except, 1) > 0) {
+                $output .= (string) fread($pipes[1], 65536);
+            }
+        }
+
+        fclose($pipes[1]);
+        proc_terminate($proc, 9);
+        proc_close($proc);
+        return $output;
+    }
+
+    /**
+     * Path relative to the working directory, so the loader also works in
+     * the guest, where WordPress is unpacked next to the harness.
+     */
+    public static function relative_path(string $path): string
+    {
+        $cwd = getcwd() . DIRECTORY_SEPARATOR;
+        return str_starts_with($path, $cwd) ? substr($path, strlen($cwd)) : $path;
+    }
+
+    /**
+     * Load the base loader once and attribute every user function and class
+     * to the top-level require that (transitively) included its file.
+     * Returns [function name => line index, class name => file] or null.
+     */
+    public static function attribute_definitions(array $lines, array $requires): ?array
+    {
+        $instrumented = $lines;
+        foreach ($requires as $index => $line) {
+            $instrumented[$index] = "\$__symwp_bounds[$index] = [count(get_included_files())];\n"
+                . $line
+                . "\$__symwp_bounds[$index][] = count(get_included_files());\n";
+        }
+        $instrumented[] = <<<'EOT'
+
+$__symwp_report = ['files' => get_included_files(), 'bounds' => $__symwp_bounds, 'functions' => [], 'classes' => []];
+foreach (get_defined_functions()['user'] as $__symwp_name) {
+    $__symwp_report['functions'][$__symwp_name] = (new ReflectionFunction($__symwp_name))->getFileName();
+}
+foreach (array_merge(get_declared_classes(), get_declared_interfaces(), get_declared_traits()) as $__symwp_name) {
+    $__symwp_class = new ReflectionClass($__symwp_name);
+    if ($__symwp_class->isUserDefined()) {
+        $__symwp_report['classes'][strtolower($__symwp_name)] = $__symwp_class->getFileName();
+    }
+}
+EOT;
+        $instrumented[] = "\necho \"\\n" . self::REPORT_MARKER . "\" . json_encode(\$__symwp_report);\n";
+
+        $path = tempnam(getcwd(), 'symwp-loader-');
+        file_put_contents($path, implode('', $instrumented));
+        $output = self::run_php([$path], self::RUN_TIMEOUT_SECONDS);
+        unlink($path);
+
+        $position = strrpos($output, self::REPORT_MARKER);
+        if ($position === false) {
+            return null;
+        }
+        $report = json_decode(substr($output, $position + strlen(self::REPORT_MARKER)), true);
+        if (!is_array($report)) {
+            return null;
+        }
+
+        $fileOwners = [];
+        foreach ($report['bounds'] as $index => [$start, $end]) {
+            for ($i = $start; $i < $end; $i++) {
+                $fileOwners[$report['files'][$i]] = $index;
+            }
+        }
+
+        $functions = [];
+        foreach ($report['functions'] as $name => $file) {
+            if (isset($fileOwners[$file])) {
+                $functions[strtolower($name)] = $fileOwners[$file];
+            }
+        }
+        $classes = [];
+        foreach ($report['classes'] as $name => $file) {
+            if (isset($fileOwners[$file])) {
+                $classes[$name] = [$fileOwners[$file], self::relative_path($file)];
+            }
+        }
+
+        return [$functions, $classes];
+    }
+
+    /**
+     * Build the loader that keeps only the $needed requires, autoloads the
+     * classes of the requires that were left out and reports calls to their
+     * functions.
+     */
+    public static function build_loader(
+        array $lines,
+        array $requires,
+        array $needed,
+        array $functions,
+        array $classes,
+        string $harnessPath
+    ): string {
+        $autoload = [];
+        foreach ($classes as $name => [$index, $file]) {
+            if (!isset($needed[$index])) {
+                $autoload[$name] = $file;
+            }
+        }
+        $dropped = [];
+        foreach ($functions as $name => $index) {
+            if (!isset($needed[$index])) {
+                $dropped[$name] = true;
+            }
+        }
+
+        $loader = "<?php\n";
+        $loader .= "// Minimal WordPress loader traced for $harnessPath. Do not edit.\n";
+        $loader .= "spl_autoload_register(function (\$class) {\n";
+        $loader .= "    static \$classes = " . var_export($autoload, true) . ";\n";
+        $loader .= "    \$class = strtolower(\$class);\n";
+        $loader .= "    if (isset(\$classes[\$class])) {\n";
+        $loader .= "        require_once \$classes[\$class];\n";
+        $loader .= "    }\n";
+        $loader .= "});\n";
+        // Uncaught errors are still fatal, the guest message only tells the pipeline why
+        $loader .= "register_shutdown_function(function () {\n";
+        $loader .= "    static \$dropped = " . var_export($dropped, true) . ";\n";
+        $loader .= "    \$s2ecmd = getenv('SYMWP_S2ECMD');\n";
+        $loader .= "    \$error = error_get_last();\n";
+        $loader .= "    if (\n";
+        $loader .= "        \$s2ecmd &&\n";
+        $loader .= "        \$error &&\n";
+        $loader .= "        preg_match('/Call to undefined function ([\\w\\\\\\\\]+)\\(\\)/', \$error['message'], \$matches) &&\n";
+        $loader .= "        isset(\$dropped[strtolower(ltrim(\$matches[1], '\\\\'))])\n";
+        $loader .= "    ) {\n";
+        $loader .= "        // s2e.so must not make the arguments of s2ecmd symbolic\n";
+        $loader .= "        exec('LD_PRELOAD= S2E_SYM_ARGS= ' . escapeshellarg(\$s2ecmd) . ' message ' . "
+            . "escapeshellarg('" . self::MISS_MARKER . "' . \$matches[1] . '()'));\n";
+        $loader .= "    }\n";
+        $loader .= "});\n";
+
+        foreach ($lines as $index => $line) {
+            // The opening tag was emitted above
+            if ($index === 0 && str_starts_with($line, '<?php')) {
+                continue;
+            }
+            if (isset($requires[$index]) && !isset($needed[$index])) {
+                continue;
+            }
+            $loader .= $line;
+        }
+        return $loader;
+    }
+
+    /**
+     * Run the concrete harness with the given base loader.
+     */
+    public static function run_harness(string $harnessPath, string $baseLoader): string
+    {
+        $code = file_get_contents($harnessPath);
+        $assignment = "\$symwp_base_loader = " . var_export($baseLoader, true) . ";\n";
+        $code = preg_replace(
+            '/^require(_once)?\s+\'' . preg_quote(self::CONCRETE_LOADER, '/') . '\';$/m',
+            $assignment . '$0',
+            $code,
+            1
+        );
+
+        $argc = 0;
+        if (preg_match_all('/\$argv\[(\d+)\]/', $code, $matches)) {
+            $argc = max(array_map('intval', $matches[1]));
+        }
+
+        $path = tempnam(getcwd(), 'symwp-harness-');
+        file_put_contents($path, $code);
+        $output = self::run_php(array_merge([$path], array_fill(0, $argc, 'a')), self::RUN_TIMEOUT_SECONDS);
+        unlink($path);
+        // Errors mention the temporary copy, runs are compared by their errors
+        return str_replace($path, $harnessPath, $output);
+    }
+
+    public static function get_fatal_errors(string $output): array
+    {
+        preg_match_all('/^.*Fatal error.*$/m', $output, $matches);
+        return array_values(array_unique($matches[0]));
+    }
+
+    /**
+     * Trace the requires the harness needs and return its minimal loader,
+     * or null if the harness can't run without the full loader.
+     */
+    public static function trace(string $harnessPath, string $baseLoaderPath): ?string
+    {
+        $lines = file($baseLoaderPath);
+        $requires = self::find_requires($lines);
+
+        $definitions = self::attribute_definitions($lines, $requires);
+        if ($definitions === null) {
+            echo "[!] Failed to load $baseLoaderPath\n";
+            return null;
+        }
+        [$functions, $classes] = $definitions;
+
+        $expectedErrors = self::get_fatal_errors(self::run_harness($harnessPath, $baseLoaderPath));
+
+        $needed = [];
+        foreach ($requires as $index => $line) {
+            if (self::is_always_required($line)) {
+                $needed[$index] = true;
+            }
+        }
+
+        $candidatePath = tempnam(getcwd(), 'symwp-minimal-');
+        try {
+            for ($i = 0; $i <= count($requires); $i++) {
+                $loader = self::build_loader($lines, $requires, $needed, $functions, $classes, $harnessPath);
+                file_put_contents($candidatePath, $loader);
+                $output = self::run_harness($harnessPath, $candidatePath);
+
+                if (!preg_match('/Call to undefined function ([\w\\\\]+)\(\)/', $output, $matches)) {
+                    if (self::get_fatal_errors($output) != $expectedErrors) {
+                        echo "[!] $harnessPath fails with the minimal loader:\n";
+                        echo implode("\n", self::get_fatal_errors($output)) . "\n";
+                        return null;
+                    }
+                    return $loader;
+                }
+
+                $function = strtolower(ltrim($matches[1], '\\'));
+                if (!isset($functions[$function]) || isset($needed[$functions[$function]])) {
+                    echo "[!] $harnessPath calls $function(), which the base loader doesn't define\n";
+                    return null;
+                }
+                $needed[$functions[$function]] = true;
+            }
+        } finally {
+            unlink($candidatePath);
+        }
+
+        return null;
+    }
+}
+
+if ($argv && $argv[0] && realpath($argv[0]) === __FILE__) {
+    if (count($argv) < 3) {
+        die("Usage: php {$argv[0]} <concrete_harness> <output_loader> [base_loader]\n");
+    }
+    $harnessPath = $argv[1];
+    $outputPath = $argv[2];
+    $baseLoaderPath = $argv[3] ?? LoaderTracer::BASE_LOADER;
+    if (!file_exists($harnessPath)) {
+        die("[!] Harness does not exist: $harnessPath\n");
+    }
+    if (!file_exists($baseLoaderPath)) {
+        die("[!] Base loader does not exist: $baseLoaderPath\n");
+    }
+
+    $loader = LoaderTracer::trace($harnessPath, $baseLoaderPath);
+    if ($loader === null) {
+        exit(1);
+    }
+
+    if (!is_dir(dirname($outputPath))) {
+        mkdir(dirname($outputPath), 0755, true);
+    }
+    file_put_contents($outputPath, $loader);
+    $kept = substr_count($loader, "\n");
+    echo "[+] Minimal loader for $harnessPath written to $outputPath ($kept lines)\n";
+}
@@ -1,9 +1,13 @@
 <?php
 
+require_once __DIR__ . '/HarnessWorker.php';
+
 class SQLiChecker
 {
     private const PAYLOAD = "'\";/\\-+=*\`|)(#-- ,!@~<>%";
     private const OUTPUT_DIR = '.SQLiChecker_output';
+    private const OUTPUT_DIR_ENV_VAR = 'SYMWP_CHECKER_OUTPUT_DIR';
+    private string $outputDir;
     private string $harnessPath;
     private array $argvValues;
     private string $phpExecutable;
@@ -15,6 +19,8 @@ class SQLiChecker
         $this->harnessPath = $harnessPath;
         $this->argvValues = $argv;
 
+        $this->outputDir = getenv(self::OUTPUT_DIR_ENV_VAR) ?: self::OUTPUT_DIR;
+
         $this->phpExecutable = getenv(self::PHP_ENV_VAR) ?? self::DEFAULT_PHP_EXECUTABLE;
         if (!getenv(self::PHP_ENV_VAR) || !file_exists($this->phpExecutable)) {
             echo "[!] PHP executable not found. Please set SYMWP_PHP environment variable to the path of your PHP executable.\n";
@@ -45,7 +51,7 @@ class SQLiChecker
             }
             $output .= $result;
 
-            file_put_contents(self::OUTPUT_DIR . '/' . basename($this->harnessPath) . ".arg{$i}.out", $output);
+            file_put_contents($this->outputDir . '/' . basename($this->harnessPath) . ".arg{$i}.out", $output);
             echo "[*] Testing argv $i...\n";
 
             $results = array_merge($results, $this->detect_taint_exposure($result));
@@ -58,6 +64,14 @@ class SQLiChecker
 
     private function run_harness(): string|bool|null
     {
+        $workerSocket = getenv(HarnessWorker::SOCKET_ENV_VAR);
+        if ($workerSocket) {
+            $result = HarnessWorker::run($workerSocket, $this->harnessPath, $this->argvValues, true);
+            if (!is_null($result)) {
+                return $result;
+            }
+        }
+
         $cmd = "$this->phpExecutable $this->harnessPath " . implode(' ', array_map('escapeshellarg', $this->argvValues)) . " 2>&1";
         return shell_exec($cmd);
     }
@@ -79,9 +93,9 @@ class SQLiChecker
 
     private function check_or_create_output_dir()
     {
-        if (!is_dir(self::OUTPUT_DIR)) {
-            if (!mkdir(self::OUTPUT_DIR, 0755, true)) {
-                echo "[!] Failed to create output directory: " . self::OUTPUT_DIR . "\n";
+        if (!is_dir($this->outputDir)) {
+            if (!mkdir($this->outputDir, 0755, true)) {
+                echo "[!] Failed to create output directory: " . $this->outputDir . "\n";
                 exit(1);
             }
         }
@@ -1,5 +1,7 @@
 <?php
 
+require_once __DIR__ . '/HarnessWorker.php';
+
 class XSSChecker
 {
     private const SPECIAL_SYMBOLS = [
@@ -11,6 +13,8 @@ class XSSChecker
     private const XSS_PAYLOAD_MARKER = 'XSS_PAYLOAD_MARKER';
     private const PAYLOAD = self::TAINT_START_MARKER . "'\"<>/;=#`\\<script>alert(1)</script><img src=x onerror=alert(1)>" . self::TAINT_END_MARKER;
     private const OUTPUT_DIR = '.XSSChecker_output';
+    private const OUTPUT_DIR_ENV_VAR = 'SYMWP_CHECKER_OUTPUT_DIR';
+    private string $outputDir;
 
     private string $harnessPath;
     private array $argvValues;
@@ -37,6 +41,8 @@ class XSSChecker
             }
         }
 
+        $this->outputDir = getenv(self::OUTPUT_DIR_ENV_VAR) ?: self::OUTPUT_DIR;
+
         $this->phpExecutable = getenv(self::PHP_ENV_VAR) ?? self::DEFAULT_PHP_EXECUTABLE;
         if (!getenv(self::PHP_ENV_VAR) || !file_exists($this->phpExecutable)) {
             echo "[!] PHP executable not found. Please set SYMWP_PHP environment variable to the path of your PHP executable.\n";
@@ -63,7 +69,7 @@ class XSSChecker
             }
             $output .= $result;
 
-            file_put_contents(self::OUTPUT_DIR . '/' . basename($this->harnessPath) . ".arg{$i}.out", $output);
+            file_put_contents($this->outputDir . '/' . basename($this->harnessPath) . ".arg{$i}.out", $output);
             echo "[*] Testing argv $i...\n";
 
             $results = array_merge($results, $this->detect_taint_exposure($result));
@@ -74,7 +80,15 @@ class XSSChecker
 
     private function run_harness(): string|bool|null
     {
-        $cmd = "$php $this->harnessPath " . implode(' ', array_map('escapeshellarg', $this->argvValues));
+        $workerSocket = getenv(HarnessWorker::SOCKET_ENV_VAR);
+        if ($workerSocket) {
+            $result = HarnessWorker::run($workerSocket, $this->harnessPath, $this->argvValues);
+            if (!is_null($result)) {
+                return $result;
+            }
+        }
+
+        $cmd = "$this->phpExecutable $this->harnessPath " . implode(' ', array_map('escapeshellarg', $this->argvValues));
         return shell_exec($cmd);
     }
 
@@ -120,9 +134,9 @@ class XSSChecker
 
     private function check_or_create_output_dir()
     {
-        if (!is_dir(self::OUTPUT_DIR)) {
-            if (!mkdir(self::OUTPUT_DIR, 0755, true)) {
-                echo "[!] Failed to create output directory: " . self::OUTPUT_DIR . "\n";
+        if (!is_dir($this->outputDir)) {
+            if (!mkdir($this->outputDir, 0755, true)) {
+                echo "[!] Failed to create output directory: " . $this->outputDir . "\n";
                 exit(1);
             }
         }
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import json
+import mmap
+import struct
+import argparse
+
+from pathlib import Path
+
+SYMBOL_CACHE_PATH = ".symbol_cache.json"
+SYMBOL_CACHE_VERSION = 1
+
+SHT_SYMTAB = 2
+SHT_NOTE = 7
+SHT_DYNSYM = 11
+STT_FUNC = 2
+SHN_UNDEF = 0
+NT_GNU_BUILD_ID = 3
+
+
+class ElfFile:
+    """
+    Minimal reader for the section headers, symbol tables and build-id of an ELF file.
+    """
+
+    def __init__(self, data: bytes):
+        if data[:4] != b"\x7fELF":
+            raise ValueError("not an ELF file")
+
+        self.data = data
+        self.is_64 = data[4] == 2
+        self.endian = "<" if data[5] == 1 else ">"
+
+        if self.is_64:
+            shoff, shentsize, shnum = (
+                struct.unpack_from(self.endian + "Q", data, 0x28)[0],
+                *struct.unpack_from(self.endian + "HH", data, 0x3A),
+            )
+            section_format = "IIQQQQIIQQ"
+        else:
+            shoff, shentsize, shnum = (
+                struct.unpack_from(self.endian + "I", data, 0x20)[0],
+                *struct.unpack_from(self.endian + "HH", data, 0x2E),
+            )
+            section_format = "IIIIIIIIII"
+
+        # (name, type, flags, addr, offset, size, link, info, addralign, entsize)
+        self.sections = [
+            struct.unpack_from(self.endian + section_format, data, shoff + i * shentsize)
+            for i in range(shnum)
+        ]
+
+    def get_build_id(self) -> str:
+        """
+        Returns:
+            str: Hex build-id from the GNU build-id note, or "" if there is none.
+        """
+        for section in self.sections:
+            if section[1] != SHT_NOTE:
+                continue
+            offset, end = section[4], section[4] + section[5]
+            while offset + 12 <= end:
+                namesz, descsz, note_type = struct.unpack_from(self.endian + "III", self.data, offset)
+                name_start = offset + 12
+                desc_start = name_start + (namesz + 3) // 4 * 4
+                if note_type == NT_GNU_BUILD_ID and self.data[name_start : name_start + 3] == b"GNU":
+                    return self.data[desc_start : desc_start + descsz].hex()
+                offset = desc_start + (descsz + 3) // 4 * 4
+        return ""
+
+    def find_symbols(self, names: list[str]) -> dict[str, int]:
+        """
+        Find the addresses of the given symbols in .symtab and .dynsym.
+        Function symbols take precedence over other symbols with the same name.
+        Args:
+            names (list[str]): Symbol names to look for.
+        Returns:
+            dict[str, int]: Address of every symbol that was found.
+        """
+        found = {}
+        found_funcs = set()
+
+        for section in self.sections:
+            if section[1] not in (SHT_SYMTAB, SHT_DYNSYM):
+                continue
+            strtab = self.sections[section[6]]
+            strtab_start, strtab_end = strtab[4], strtab[4] + strtab[5]
+
+            # Locate the names in the string table first, so the symbol scan only
+            # compares integers instead of decoding every name. Linkers share string
+            # tails ("malloc" may live inside "__libc_malloc"), so every occurrence
+            # of the name is a candidate offset.
+            name_offsets = {}
+            for name in names:
+                needle = name.encode() + b"\0"
+                pos = self.data.find(needle, strtab_start, strtab_end)
+                while pos != -1:
+                    name_offsets[pos - strtab_start] = name
+                    pos = self.data.find(needle, pos + 1, strtab_end)
+            if not name_offsets:
+                continue
+
+            if self.is_64:
+                # st_name, st_info, st_other, st_shndx, st_value, st_size
+                symbols = struct.iter_unpack(
+                    self.endian + "IBBHQQ",
+                    self.data[section[4] : section[4] + section[5]],
+                )
+                for st_name, st_info, _, st_shndx, st_value, _ in symbols:
+                    self.add_symbol(found, found_funcs, name_offsets.get(st_name), st_info, st_shndx, st_value)
+            else:
+                # st_name, st_value, st_size, st_info, st_other, st_shndx
+                symbols = struct.iter_unpack(
+                    self.endian + "IIIBBH",
+                    self.data[section[4] : section[4] + section[5]],
+                )
+                for st_name, st_value, _, st_info, _, st_shndx in symbols:
+                    self.add_symbol(found, found_funcs, name_offsets.get(st_name), st_info, st_shndx, st_value)
+
+        return found
+
+    @staticmethod
+    def add_symbol(
+        found: dict, found_funcs: set, name: str | None, info: int, shndx: int, value: int
+    ) -> None:
+        if name is None or shndx == SHN_UNDEF or value == 0 or name in found_funcs:
+            return
+        found[name] = value
+        if info & 0xF == STT_FUNC:
+            found_funcs.add(name)
+
+
+def load_symbol_cache(cache_path: str) -> dict:
+    try:
+        with open(cache_path) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get("version") != SYMBOL_CACHE_VERSION:
+        return {}
+    return cache.get("binaries", {})
+
+
+def save_symbol_cache(cache_path: str, binaries: dict) -> None:
+    tmp_path = f"{cache_path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"version": SYMBOL_CACHE_VERSION, "binaries": binaries}, f, indent=2)
+    os.replace(tmp_path, cache_path)
+
+
+def resolve_symbols(
+    binary_path: str, names: list[str], cache_path: str = SYMBOL_CACHE_PATH
+) -> dict[str, int]:
+    """
+    Resolve symbol addresses from the ELF symbol table of a binary.
+    Results are cached on disk, keyed by the binary's path, size, mtime and build-id,
+    so only symbols that were never resolved for this exact binary are looked up.
+    Args:
+        binary_path (str): Path to the ELF binary.
+        names (list[str]): Symbol names to resolve.
+        cache_path (str): Path to the JSON cache file, or "" to disable caching.
+    Returns:
+        dict[str, int]: Address of every symbol that was found.
+    """
+    path = str(Path(binary_path).resolve())
+    stat = os.stat(path)
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        elf = ElfFile(data)
+        key = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "build_id": elf.get_build_id()}
+
+        binaries = load_symbol_cache(cache_path) if cache_path else {}
+        entry = binaries.get(path)
+        if entry is None or entry.get("key") != key:
+            entry = {"key": key, "symbols": {}, "missing": []}
+
+        unknown = [
+            name for name in names if name not in entry["symbols"] and name not in entry["missing"]
+        ]
+        if unknown:
+            found = elf.find_symbols(unknown)
+            entry["symbols"].update({name: hex(address) for name, address in found.items()})
+            entry["missing"].extend(name for name in unknown if name not in found)
+            if cache_path:
+                binaries[path] = entry
+                save_symbol_cache(cache_path, binaries)
+
+    return {name: int(entry["symbols"][name], 16) for name in names if name in entry["symbols"]}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Resolve symbol addresses from the ELF symbol table of a binary."
+    )
+    parser.add_argument("binary", help="Path to the ELF binary, e.g. the compiled PHP.")
+    parser.add_argument("symbols", nargs="+", help="Symbol names to resolve.")
+    parser.add_argument(
+        "--cache",
+        type=str,
+        default=SYMBOL_CACHE_PATH,
+        help=f"Path to the symbol cache (default: {SYMBOL_CACHE_PATH}).",
+    )
+    args = parser.parse_args()
+
+    addresses = resolve_symbols(args.binary, args.symbols, args.cache)
+    for name in args.symbols:
+        if name in addresses:
+            print(f"{name} 0x{addresses[name]:x}")
+        else:
+            print(f"[-] Symbol not found: {name}", file=sys.stderr)
+
+    sys.exit(0 if len(addresses) == len(args.symbols) else 1)
+
+
+if __name__ == "__main__":
+    main()
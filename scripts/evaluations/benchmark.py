@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import json
+import time
+import shutil
+import zipfile
+import argparse
+import statistics
+import subprocess
+import urllib.request
+
+from pathlib import Path
+
+PIPELINE_RUNNER = str(Path(__file__).resolve().parent.parent / "pipeline_runner.py")
+RUN_MANIFEST_FILE = ".run_manifest.json"
+BENCHMARK_DIR = ".benchmark"
+RESULTS_VERSION = 2
+PLUGIN_DOWNLOAD_URL = "https://downloads.wordpress.org/plugin/{name}.{version}.zip"
+
+# A metric regresses if it grows by more than this fraction of the baseline
+DEFAULT_TOLERANCE = 0.25
+# Differences below this many seconds are noise, whatever the tolerance
+MIN_REGRESSION_SECONDS = 5.0
+
+# Metric of a summary -> statistic compared against the baseline
+COMPARED_METRICS = {
+    "time_to_bug": "mean",
+    "wall_time": "mean",
+    "peak_rss_kb": "max",
+}
+
+
+def get_entry_id(entry: dict) -> str:
+    return entry.get("id") or f"{entry['name']}-{entry['version']}"
+
+
+def get_plugin_folder(entry: dict) -> Path:
+    """
+    Get the folder of a corpus plugin, downloading its declared version from
+    wordpress.org if no path is given and it wasn't downloaded yet.
+    Args:
+        entry (dict): Corpus entry with name, version and optionally path.
+    Returns:
+        Path: Plugin folder, named after the plugin as the pipeline expects.
+    """
+    if "path" in entry:
+        return Path(entry["path"])
+
+    folder = Path(BENCHMARK_DIR) / "plugins" / f"{entry['name']}.{entry['version']}"
+    plugin_folder = folder / entry["name"]
+    if plugin_folder.exists():
+        return plugin_folder
+
+    url = PLUGIN_DOWNLOAD_URL.format(name=entry["name"], version=entry["version"])
+    print(f"[+] Downloading {url}...")
+    folder.mkdir(parents=True, exist_ok=True)
+    archive = folder / f"{entry['name']}.zip"
+    urllib.request.urlretrieve(url, archive)
+    with zipfile.ZipFile(archive) as f:
+        f.extractall(folder)
+    archive.unlink()
+    return plugin_folder
+
+
+def run_pipeline(cmd: list[str]) -> tuple[int, float, int]:
+    """
+    Run the pipeline and measure it.
+    Args:
+        cmd (list[str]): Pipeline command.
+    Returns:
+        tuple[int, float, int]: Exit status, wall time in seconds and peak RSS
+        in KiB of the pipeline and the processes it waited for.
+    """
+    start_time = time.time()
+    proc = subprocess.Popen(cmd)
+    try:
+        _, status, rusage = os.wait4(proc.pid, 0)
+    except KeyboardInterrupt:
+        proc.terminate()
+        proc.wait()
+        raise
+    # Popen would otherwise try to wait for the process again
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    return proc.returncode, time.time() - start_time, rusage.ru_maxrss
+
+
+def read_iteration(output_dir: Path) -> dict:
+    """
+    Read the results of a single iteration from its run manifest.
+    Args:
+        output_dir (Path): Output directory of the iteration.
+    Returns:
+        dict: Earliest time-to-bug (None if no bug was found), harness counts
+        and the total duration of every phase.
+    """
+    try:
+        with open(output_dir / RUN_MANIFEST_FILE) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+
+    run = manifest.get("run", {})
+    harnesses = manifest.get("harnesses", {})
+    durations = dict(run.get("durations", {}))
+    time_to_bug = None
+    statuses = {}
+    for entry in harnesses.values():
+        statuses[entry.get("status")] = statuses.get(entry.get("status"), 0) + 1
+        for phase, seconds in entry.get("durations", {}).items():
+            durations[phase] = durations.get(phase, 0.0) + seconds
+        # Harnesses cancelled by the first bug may still have confirmed one of their own
+        if "time_to_bug" in entry.get("results", {}):
+            value = entry["results"]["time_to_bug"]
+            time_to_bug = value if time_to_bug is None else min(time_to_bug, value)
+
+    return {
+        "time_to_bug": time_to_bug,
+        "harnesses": run.get("harnesses", len(harnesses)),
+        "harnesses_run": len(harnesses),
+        "statuses": statuses,
+        "durations": durations,
+    }
+
+
+def summarize(values: list[float]) -> dict | None:
+    """
+    Returns:
+        dict | None: Min, mean, max and sample variance of the values, or None if there are none.
+    """
+    if not values:
+        return None
+    return {
+        "count": len(values),
+        "min": min(values),
+        "mean": statistics.mean(values),
+        "max": max(values),
+        "variance": statistics.variance(values) if len(values) > 1 else 0.0,
+    }
+
+
+def benchmark_entry(entry: dict, iterations: int, args: list[str], runner: str) -> dict:
+    """
+    Run the pipeline on a corpus entry with --stop-if-found, once per iteration,
+    so wall time and peak memory are measured per iteration.
+    Args:
+        entry (dict): Corpus entry.
+        iterations (int): Number of iterations.
+        args (list[str]): Extra pipeline arguments.
+        runner (str): Path to pipeline_runner.py.
+    Returns:
+        dict: Results of every iteration and their summary.
+    """
+    entry_id = get_entry_id(entry)
+    plugin_folder = get_plugin_folder(entry)
+    output_dir = Path(BENCHMARK_DIR) / "output" / entry_id
+    # Results of a previous benchmark would be resumed or skipped otherwise
+    shutil.rmtree(output_dir, ignore_errors=True)
+
+    runs = []
+    for iteration in range(1, iterations + 1):
+        iteration_dir = output_dir / f"iteration_{iteration}"
+        cmd = [
+            sys.executable,
+            runner,
+            str(plugin_folder),
+            "--iterations",
+            "1",
+            "--stop-if-found",
+            "--output-dir",
+            str(iteration_dir),
+            *args,
+            *entry.get("args", []),
+        ]
+        if entry.get("include"):
+            cmd += ["--include", entry["include"]]
+
+        print(f"[+] Benchmarking {entry_id}, iteration {iteration}/{iterations}: {' '.join(cmd)}")
+        returncode, wall_time, peak_rss_kb = run_pipeline(cmd)
+        if returncode != 0:
+            print(f"[-] Pipeline exited with status {returncode} on {entry_id}.")
+
+        run = read_iteration(iteration_dir)
+        run.update(returncode=returncode, wall_time=wall_time, peak_rss_kb=peak_rss_kb)
+        runs.append(run)
+
+    phases = sorted({phase for run in runs for phase in run["durations"]})
+    return {
+        "name": entry["name"],
+        "version": entry["version"],
+        "label": entry.get("label", ""),
+        "returncode": next((run["returncode"] for run in runs if run["returncode"] != 0), 0),
+        "iterations": runs,
+        "summary": {
+            "found": sum(run["time_to_bug"] is not None for run in runs),
+            "time_to_bug": summarize(
+                [run["time_to_bug"] for run in runs if run["time_to_bug"] is not None]
+            ),
+            "harnesses": summarize([run["harnesses"] for run in runs]),
+            "durations": {
+                phase: summarize([run["durations"].get(phase, 0.0) for run in runs]) for phase in phases
+            },
+            "wall_time": summarize([run["wall_time"] for run in runs]),
+            "peak_rss_kb": summarize([run["peak_rss_kb"] for run in runs]),
+        },
+    }
+
+
+def is_regression(baseline: float, current: float, tolerance: float, absolute: float) -> bool:
+    return current > baseline * (1 + tolerance) and current - baseline > absolute
+
+
+def compare_results(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Compare benchmark results against a baseline.
+    Args:
+        results (dict): Current results.
+        baseline (dict): Baseline results.
+        tolerance (float): Allowed relative growth of a metric.
+    Returns:
+        list[str]: Description of every regression found.
+    """
+    regressions = []
+    for entry_id, base in baseline["results"].items():
+        current = results["results"].get(entry_id)
+        if current is None:
+            continue
+        base_summary, summary = base["summary"], current["summary"]
+
+        if summary["found"] < base_summary["found"]:
+            regressions.append(
+                f"{entry_id}: bug found in {summary['found']} iteration(s), baseline {base_summary['found']}"
+            )
+
+        metrics = [
+            (metric, statistic, base_summary.get(metric), summary.get(metric))
+            for metric, statistic in COMPARED_METRICS.items()
+        ]
+        for phase, phase_summary in base_summary.get("durations", {}).items():
+            metrics.append((f"durations.{phase}", "mean", phase_summary, summary["durations"].get(phase)))
+
+        for metric, statistic, base_value, value in metrics:
+            if not base_value or not value:
+                continue
+            # Memory has no noise floor in seconds
+            absolute = 0 if metric == "peak_rss_kb" else MIN_REGRESSION_SECONDS
+            if is_regression(base_value[statistic], value[statistic], tolerance, absolute):
+                regressions.append(
+                    f"{entry_id}: {metric} {statistic} {value[statistic]:.2f}, baseline {base_value[statistic]:.2f}"
+                )
+
+    return regressions
+
+
+def load_json(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_json(path: str, data: dict) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run the pipeline on a declared corpus of plugin versions and record time-to-bug, harness counts, phase durations and peak memory."
+    )
+    parser.add_argument(
+        "corpus",
+        nargs="?",
+        help='Corpus JSON file: {"iterations": N, "args": [...], "plugins": [{"name", "version", "label", "include", "path", "args"}]}.',
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=str,
+        default="benchmark-results.json",
+        help="Results file to write (default: benchmark-results.json).",
+    )
+    parser.add_argument("--iterations", type=int, default=0, help="Override the iterations of the corpus.")
+    parser.add_argument(
+        "--runner",
+        type=str,
+        default=PIPELINE_RUNNER,
+        help=f"Path to the pipeline runner (default: {PIPELINE_RUNNER}).",
+    )
+    parser.add_argument("--baseline", type=str, default="", help="Results file to compare against.")
+    parser.add_argument(
+        "--compare",
+        type=str,
+        default="",
+        help="Compare this results file against --baseline without running the corpus.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help=f"Allowed relative growth of a metric before it counts as a regression (default: {DEFAULT_TOLERANCE}).",
+    )
+    args = parser.parse_args()
+
+    # Checked before running the corpus, results of other versions have other statistics
+    loaded = {}
+    for path in (args.compare, args.baseline):
+        if path:
+            loaded[path] = load_json(path)
+            version = loaded[path].get("version")
+            if version != RESULTS_VERSION:
+                parser.error(
+                    f"{path} holds results version {version}, this script writes version "
+                    f"{RESULTS_VERSION}; run the benchmark again to compare against it"
+                )
+
+    if args.compare:
+        results = loaded[args.compare]
+    elif args.corpus:
+        corpus = load_json(args.corpus)
+        iterations = args.iterations or corpus.get("iterations", 5)
+        results = {
+            "version": RESULTS_VERSION,
+            "corpus": args.corpus,
+            "created": time.time(),
+            "iterations": iterations,
+            "args": corpus.get("args", []),
+            "results": {},
+        }
+        for entry in corpus["plugins"]:
+            results["results"][get_entry_id(entry)] = benchmark_entry(
+                entry, iterations, corpus.get("args", []), args.runner
+            )
+            # Written after every entry, so an interrupted benchmark keeps its results
+            save_json(args.output, results)
+        print(f"[+] Results written to {args.output}")
+    else:
+        parser.error("a corpus or --compare is required")
+
+    for entry_id, result in results["results"].items():
+        time_to_bug = result["summary"]["time_to_bug"]
+        if time_to_bug:
+            print(
+                f"[+] {entry_id}: found {result['summary']['found']}/{len(result['iterations'])}, time-to-bug "
+                f"min {time_to_bug['min']:.2f}s, mean {time_to_bug['mean']:.2f}s, max {time_to_bug['max']:.2f}s, "
+                f"variance {time_to_bug['variance']:.2f}"
+            )
+        else:
+            print(f"[-] {entry_id}: no bug found")
+
+    if args.baseline:
+        regressions = compare_results(results, loaded[args.baseline], args.tolerance)
+        for regression in regressions:
+            print(f"[-] Regression: {regression}")
+        if regressions:
+            sys.exit(1)
+        print("[+] No regression against the baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 import io
+import sys
+import json
 
 data_string = """
 Plugin,Test Version,CVE ID,v2 1st run,v2 2nd run,v2 3rd run,v2 4th run,v2 5th run,v2 Avg.,V2 Min.,v2 Max.
@@ -18,11 +20,44 @@ Plugin,Test Version,CVE ID,v2 1st run,v2 2nd run,v2 3rd run,v2 4th run,v2 5th ru
 #12 site-mailer,1.2.6(latest),0day,274.08,309.83,364.08,321.82,459.24,345.81,274.08,459.24
 #13 site-mailer,1.2.6(latest),0day,,1711.12,1377.47,1287.74,1258.75,1408.77,1258.75,1711.12
 """
-df = pd.read_csv(io.StringIO(data_string))
-df.rename(
-    columns={"v2 Avg.": "v2 Avg", "V2 Min.": "v2 Min", "v2 Max.": "v2 Max"},
-    inplace=True,
-)
+
+
+def read_benchmark_results(path):
+    """
+    Build the chart data from a results file written by benchmark.py.
+    Entries that never found their bug are left out.
+    """
+    with open(path) as f:
+        results = json.load(f)
+
+    rows = []
+    for index, (entry_id, result) in enumerate(results["results"].items(), start=1):
+        time_to_bug = result["summary"]["time_to_bug"]
+        if not time_to_bug:
+            print(f"[-] No time-to-bug for {entry_id}, skipping.")
+            continue
+        rows.append(
+            {
+                "Plugin": f"#{index} {result['name']}",
+                "Test Version": result["version"],
+                "CVE ID": result["label"] or entry_id,
+                "v2 Avg": time_to_bug["mean"],
+                "v2 Min": time_to_bug["min"],
+                "v2 Max": time_to_bug["max"],
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+# python time-to-bug-graph.py [benchmark-results.json]
+if len(sys.argv) > 1:
+    df = read_benchmark_results(sys.argv[1])
+else:
+    df = pd.read_csv(io.StringIO(data_string))
+    df.rename(
+        columns={"v2 Avg.": "v2 Avg", "V2 Min.": "v2 Min", "v2 Max.": "v2 Max"},
+        inplace=True,
+    )
 
 df["x_label"] = df["Plugin"] + " (" + df["CVE ID"] + ")"
 lower_error = df["v2 Avg"] - df["v2 Min"]
@@ -1,6 +1,11 @@
 <?php
 
 const OUTPUT_FOLDER = '.harness';
+const PARSE_CACHE_FILE = '.parse_cache.json';
+const PARSE_CACHE_VERSION = 1;
+const HARNESS_METADATA_SUFFIX = '.meta.json';
+// Per-harness loader traced by LoaderTracer.php, copied into each S2E project
+const MINIMAL_BASE_LOADER = 'minimal-base-wordpress-loader.php';
 const AVOID_FOLDERS = ['vendor', 'tests'];
 
 const WP_REST_REQUEST = 'WP_REST_Request';
@@ -14,6 +19,22 @@ const WP_REST_REQUEST_SET_PARAMS_METHODS = [
     WP_REST_REQUEST_SET_BODY_PARAMS,
     WP_REST_REQUEST_SET_BODY,
 ];
+const WP_REST_REQUEST_GET_PARAMS_METHODS = [
+    'get_query_params' => WP_REST_REQUEST_SET_QUERY_PARAMS,
+    'get_body_params' => WP_REST_REQUEST_SET_BODY_PARAMS,
+    'get_json_params' => WP_REST_REQUEST_SET_BODY,
+];
+const USER_INPUT_SUPERGLOBALS = ['$_GET', '$_POST', '$_REQUEST', '$_COOKIE', '$_FILES', '$_SERVER', '$_ENV'];
+const FILTER_INPUT_SUPERGLOBALS = [
+    'INPUT_GET' => '$_GET',
+    'INPUT_POST' => '$_POST',
+    'INPUT_COOKIE' => '$_COOKIE',
+    'INPUT_SERVER' => '$_SERVER',
+    'INPUT_ENV' => '$_ENV',
+];
+const XSS_SINK_FUNCTIONS = ['printf', 'vprintf'];
+const SQLI_SINK_METHODS = ['query', 'prepare', 'get_results', 'get_row', 'get_var', 'get_col'];
+const SANITIZER_PREFIXES = ['esc_', 'sanitize_', 'wp_kses'];
 const SKIP_FUNCTION_CALLS = [
     'defined',
     'class_exists',
@@ -73,9 +94,8 @@ function get_plugin_entry_file(string $dir): string
     return '';
 }
 
-function extract_functions_and_methods(string $content): array
+function extract_functions_and_methods(array $tokens): array
 {
-    $tokens = token_get_all($content);
     $functions = [];
     $methods = [];
     $count = count($tokens);
@@ -151,7 +171,8 @@ function extract_functions_and_methods(string $content): array
         // function or method
         if ($tokens[$i][0] === T_FUNCTION) {
             $name = '';
-            $body = '';
+            $hasBody = false;
+            $collector = new_token_collector();
             $params = [];
             $functionCalls = [];
             $braceCount = 0;
@@ -251,7 +272,12 @@ function extract_functions_and_methods(string $content): array
                         continue;
                     }
 
+                    // Interpolations such as {$_GET['key']} still read user input
                     if ($inHeredoc) {
+                        if ($start) {
+                            collect_user_input($tokens, $i, $collector);
+                            collect_sink_feature($tokens, $i, $collector);
+                        }
                         continue;
                     }
                 }
@@ -268,7 +294,9 @@ function extract_functions_and_methods(string $content): array
                 }
 
                 if ($start) {
-                    $body .= is_array($tokens[$i]) ? $tokens[$i][1] : $tokens[$i];
+                    $hasBody = true;
+                    collect_user_input($tokens, $i, $collector);
+                    collect_sink_feature($tokens, $i, $collector);
                     if ($braceCount === 0) {
                         $start = false;
                         break;
@@ -276,7 +304,7 @@ function extract_functions_and_methods(string $content): array
                 }
             }
 
-            if ($name && $body) {
+            if ($name && $hasBody) {
                 if ($inClass) {
                     // Also consider __CONSTRUCT__ as a default function call if it's a method
                     $functionCalls[] = __CONSTRUCT__;
@@ -285,7 +313,8 @@ function extract_functions_and_methods(string $content): array
                         'method' => $name,
                         'params' => $params,
                         'functionCalls' => $functionCalls,
-                        'body' => $body,
+                        'inputs' => get_collected_user_inputs($collector),
+                        'features' => get_collected_sink_features($collector),
                         'visibility' => $visibility,
                         'is_static' => $isStatic,
                     ];
@@ -294,7 +323,8 @@ function extract_functions_and_methods(string $content): array
                         'name' => $name,
                         'params' => $params,
                         'functionCalls' => $functionCalls,
-                        'body' => $body
+                        'inputs' => get_collected_user_inputs($collector),
+                        'features' => get_collected_sink_features($collector),
                     ];
                 }
             }
@@ -318,165 +348,481 @@ function extract_functions_and_methods(string $content): array
     return [$functions, $methods];
 }
 
-function extract_user_input_vars(string $body): array
+/**
+ * Match the tokens following $i against $pattern, skipping whitespace and
+ * comments. Pattern entries are single-character tokens or token types.
+ * Returns the matched tokens, or null if they don't match.
+ */
+function match_next_tokens(array $tokens, int $i, array $pattern): ?array
 {
-    $inputs = [];
-    $patterns = ['\$_GET', '\$_POST', '\$_REQUEST', '\$_COOKIE', '\$_FILES', '\$_SERVER', '\$_ENV'];
+    $matched = [];
+    foreach ($pattern as $expected) {
+        do {
+            $i++;
+        } while (isset($tokens[$i]) && is_in_token_array($tokens[$i], [T_WHITESPACE, T_COMMENT, T_DOC_COMMENT]));
 
-    foreach ($patterns as $pattern) {
-        if (preg_match_all("/{$pattern}\s*\[\s*['\"]([^'\"]+)['\"]\s*\]/", $body, $matches)) {
-            foreach ($matches[1] as $match) {
-                $patternKey = str_replace('\\', '', $pattern);
+        if (
+            !isset($tokens[$i]) ||
+            (is_int($expected) ? !is_token($tokens[$i], $expected) : $tokens[$i] !== $expected)
+        ) {
+            return null;
+        }
+        $matched[] = $tokens[$i];
+    }
+    return $matched;
+}
 
-                // simple check to skip non user-defined $_SERVER variables
-                if (
-                    $patternKey === '$_SERVER' &&
-                    !str_starts_with($match, "HTTP_") &&
-                    $match !== 'QUERY_STRING' &&
-                    $match !== 'REQUEST_METHOD' &&
-                    $match !== 'PHP_SELF' &&
-                    $match !== 'REQUEST_URI' &&
-                    $match !== 'PATH_INFO'
-                ) {
-                    continue;
-                }
+/**
+ * Value of a quoted string literal used as an input key, or null if the key
+ * is empty or contains quotes.
+ */
+function get_input_key(array $token): ?string
+{
+    $key = substr($token[1], 1, -1);
+    return $key === '' || strpbrk($key, "'\"") !== false ? null : $key;
+}
 
-                if (!in_array($match, $inputs[$patternKey] ?? [])) {
-                    $inputs[$patternKey][] = $match;
-                }
+function new_token_collector(): array
+{
+    return ['inputs' => [], 'vars' => [], 'features' => [], 'sanitizes' => false];
+}
+
+/**
+ * Record the user input accessed at token $i, if any, into $collector. It is
+ * called for every token of a body, so all input sources are collected in the
+ * same pass that extracts the body.
+ */
+function collect_user_input(array $tokens, int $i, array &$collector): void
+{
+    $token = $tokens[$i];
+    if (!is_array($token)) {
+        return;
+    }
+
+    $super = null;
+    $key = null;
+
+    if ($token[0] === T_VARIABLE) {
+        // $params = $request->get_query_params();
+        $assignment = match_next_tokens($tokens, $i, ['=', T_VARIABLE, T_OBJECT_OPERATOR, T_STRING]);
+        if (
+            $assignment !== null &&
+            $assignment[1][1] === '$request' &&
+            isset(WP_REST_REQUEST_GET_PARAMS_METHODS[$assignment[3][1]])
+        ) {
+            $collector['vars'][$token[1]] = WP_REST_REQUEST_GET_PARAMS_METHODS[$assignment[3][1]];
+            return;
+        }
+
+        $subscript = match_next_tokens($tokens, $i, ['[', T_CONSTANT_ENCAPSED_STRING, ']']);
+        if ($subscript === null) {
+            return;
+        }
+        $key = get_input_key($subscript[1]);
+
+        if (in_array($token[1], USER_INPUT_SUPERGLOBALS)) {
+            // $_GET['key']
+            $super = $token[1];
+
+            // simple check to skip non user-defined $_SERVER variables
+            if (
+                $super === '$_SERVER' &&
+                $key !== null &&
+                !str_starts_with($key, "HTTP_") &&
+                !in_array($key, ['QUERY_STRING', 'REQUEST_METHOD', 'PHP_SELF', 'REQUEST_URI', 'PATH_INFO'])
+            ) {
+                return;
             }
+        } elseif (isset($collector['vars'][$token[1]])) {
+            // $params['key'], where $params holds the parameters of the request
+            $super = $collector['vars'][$token[1]];
+        } elseif ($token[1] === '$request') {
+            // $request['key']
+            // Be conservative: only include if variable is named `$request`
+            $super = WP_REST_REQUEST_SET_PARAM;
+        }
+    } elseif ($token[0] === T_STRING && $token[1] === 'filter_input') {
+        // filter_input(INPUT_GET, 'key')
+        $call = match_next_tokens($tokens, $i, ['(', T_STRING, ',', T_CONSTANT_ENCAPSED_STRING]);
+        if ($call !== null && isset(FILTER_INPUT_SUPERGLOBALS[$call[1][1]])) {
+            $super = FILTER_INPUT_SUPERGLOBALS[$call[1][1]];
+            $key = get_input_key($call[3]);
+        }
+    } elseif ($token[0] === T_OBJECT_OPERATOR) {
+        // TODO: those patterns are not perfect and may not cover all cases.
+        // They may be false positives or false negatives. Implement a more robust solution later.
+        $method = match_next_tokens($tokens, $i, [T_STRING]);
+        if ($method === null) {
+            return;
+        }
+
+        if ($method[0][1] === 'get_param') {
+            // ->get_param('key')
+            $call = match_next_tokens($tokens, $i, [T_STRING, '(', T_CONSTANT_ENCAPSED_STRING, ')']);
+            $super = WP_REST_REQUEST_SET_PARAM;
+            $key = $call === null ? null : get_input_key($call[2]);
+        } elseif ($method[0][1] === 'get_query_params' || $method[0][1] === 'get_json_params') {
+            // ->get_query_params()['key'], ->get_json_params()['key']
+            $call = match_next_tokens($tokens, $i, [T_STRING, '(', ')', '[', T_CONSTANT_ENCAPSED_STRING, ']']);
+            $super = $method[0][1] === 'get_query_params' ? WP_REST_REQUEST_SET_PARAM : WP_REST_REQUEST_SET_BODY;
+            $key = $call === null ? null : get_input_key($call[4]);
         }
     }
 
-    // Find user-input from filter_input()
-    $filterInputIndexTable = [
-        'INPUT_GET' => '$_GET',
-        'INPUT_POST' => '$_POST',
-        'INPUT_COOKIE' => '$_COOKIE',
-        'INPUT_SERVER' => '$_SERVER',
-        'INPUT_ENV' => '$_ENV',
-    ];
-    if (preg_match_all("/filter_input\s*\(\s*([^,\s]+)\s*,\s*['\"]([^'\"]+)['\"][^)]*\)/", $body, $matches)) {
-        $index = $filterInputIndexTable[$matches[1][0]];
-        $inputs[$index][] = $matches[2][0];
+    if ($super !== null && $key !== null) {
+        $collector['inputs'][$super][$key] = true;
     }
+}
 
-    // TODO: those three patterns are not perfect and may not cover all cases.
-    // They may be false positives or false negatives. Implement a more robust solution later.
+/**
+ * Record whether token $i prints output, runs a query or sanitizes a value.
+ * Reached sinks are kept as a set of 'xss' and 'sqli', and calls to escaping
+ * or sanitizing functions as the 'sanitizes' flag of the body.
+ */
+function collect_sink_feature(array $tokens, int $i, array &$collector): void
+{
+    $token = $tokens[$i];
+    if (!is_array($token)) {
+        return;
+    }
 
-    // ->get_param('key')
-    if (preg_match_all("/->get_param\s*\(\s*['\"]([^'\"]+)['\"]\s*\)/", $body, $matches)) {
-        foreach ($matches[1] as $match) {
-            $inputs[WP_REST_REQUEST_SET_PARAM][] = $match;
+    if (in_array($token[0], [T_ECHO, T_PRINT, T_OPEN_TAG_WITH_ECHO])) {
+        // echo, print and <?=
+        $collector['features']['xss'] = true;
+    } elseif ($token[0] === T_OBJECT_OPERATOR) {
+        // $wpdb->query(...), $wpdb->prepare(...)
+        $call = match_next_tokens($tokens, $i, [T_STRING, '(']);
+        if ($call !== null && in_array($call[0][1], SQLI_SINK_METHODS)) {
+            $collector['features']['sqli'] = true;
+        }
+    } elseif ($token[0] === T_STRING && match_next_tokens($tokens, $i, ['(']) !== null) {
+        if (in_array($token[1], XSS_SINK_FUNCTIONS)) {
+            $collector['features']['xss'] = true;
+        }
+        foreach (SANITIZER_PREFIXES as $prefix) {
+            if (str_starts_with($token[1], $prefix)) {
+                $collector['sanitizes'] = true;
+                break;
+            }
         }
     }
+}
 
-    // ->get_query_params()['key']
-    if (preg_match_all("/->get_query_params\s*\(\s*\)\s*\[\s*['\"]([^'\"]+)['\"]\s*\]/", $body, $matches)) {
-        foreach ($matches[1] as $match) {
-            $inputs[WP_REST_REQUEST_SET_PARAM][] = $match;
+/**
+ * User inputs gathered by collect_user_input(), ordered by input source.
+ */
+function get_collected_user_inputs(array $collector): array
+{
+    $inputs = [];
+    foreach (array_merge(USER_INPUT_SUPERGLOBALS, WP_REST_REQUEST_SET_PARAMS_METHODS) as $super) {
+        if (isset($collector['inputs'][$super])) {
+            $inputs[$super] = array_map('strval', array_keys($collector['inputs'][$super]));
         }
     }
+    return $inputs;
+}
 
-    // $request['key']
-    // Be conservative: only include if variable is named `$request`
-    if (preg_match_all("/\\\$request\s*\[\s*['\"]([^'\"]+)['\"]\s*\]/", $body, $matches)) {
-        foreach ($matches[1] as $key => $value) {
-            $inputs[WP_REST_REQUEST_SET_PARAM][] = $value;
-        }
+/**
+ * Sinks reached by a body, mapped to whether the body also sanitizes, which is
+ * as close to the sink as a token scan gets.
+ */
+function get_collected_sink_features(array $collector): array
+{
+    return array_map(fn() => $collector['sanitizes'], $collector['features']);
+}
+
+/**
+ * Merge the sink features of a callee. A sink stays sanitized only if it is
+ * sanitized everywhere it is reached.
+ */
+function merge_sink_features(array &$target, array $source): void
+{
+    foreach ($source as $sink => $sanitized) {
+        $target[$sink] = ($target[$sink] ?? true) && $sanitized;
+    }
+}
+
+/**
+ * Collect the user inputs and sink features of all the given tokens.
+ */
+function collect_tokens(array $tokens): array
+{
+    $collector = new_token_collector();
+    foreach ($tokens as $i => $_) {
+        collect_user_input($tokens, $i, $collector);
+        collect_sink_feature($tokens, $i, $collector);
     }
+    return $collector;
+}
 
-    // ->get_json_params()['key']
-    if (preg_match_all("/->get_json_params\s*\(\s*\)\s*\[\s*['\"]([^'\"]+)['\"]\s*\]/", $body, $matches)) {
-        foreach ($matches[1] as $match) {
-            $inputs[WP_REST_REQUEST_SET_BODY][] = $match;
+function merge_user_input_sets(array &$target, array $source): bool
+{
+    $changed = false;
+    foreach ($source as $super => $vars) {
+        foreach ($vars as $var => $_) {
+            if (!isset($target[$super][$var])) {
+                $target[$super][$var] = true;
+                $changed = true;
+            }
         }
     }
+    return $changed;
+}
 
-    $inputs = array_merge_recursive($inputs, extract_user_input_vars_from_wp_rest_request($body));
+function to_user_input_set(array $inputs): array
+{
+    $set = [];
+    foreach ($inputs as $super => $vars) {
+        foreach ($vars as $var) {
+            $set[$super][$var] = true;
+        }
+    }
+    return $set;
+}
 
+function from_user_input_set(array $set): array
+{
+    $inputs = [];
+    foreach ($set as $super => $vars) {
+        $inputs[$super] = array_map('strval', array_keys($vars));
+    }
     return $inputs;
 }
 
-function extract_user_input_vars_from_wp_rest_request(string $body): array
+/**
+ * Build the call graph of all functions and methods of the plugin.
+ * Calls are resolved by name through indexes instead of scanning every
+ * definition: functions globally, methods in the same class first, then in
+ * the same file, then anywhere in the plugin if the name is unique.
+ * Constructors are only resolved within the same class.
+ */
+function build_call_graph(array $definitions): array
 {
-    $tokens = token_get_all("<?php\n" . $body);
-    $paramVars = [];
-    $count = count($tokens);
-    $inputs = [];
+    $functionIndex = [];
+    $methodIndex = [];
+    $classMethodIndex = [];
+    $fileMethodIndex = [];
+
+    foreach ($definitions as $id => $definition) {
+        if ($definition['kind'] === 'function') {
+            $functionIndex[$definition['name']] ??= $id;
+        } else {
+            $methodIndex[$definition['method']][] = $id;
+            $classMethodIndex[$definition['class']][$definition['method']] ??= $id;
+            $fileMethodIndex[$definition['file']][$definition['method']] ??= $id;
+        }
+    }
 
-    // Step 1: Find "$params = $request->get_query_params();"
-    for ($i = 0; $i < $count - 6; $i++) {
-        if (
-            is_token($tokens[$i], T_VARIABLE) &&
-            $tokens[$i + 2] === '=' &&
-            is_token($tokens[$i + 4], T_VARIABLE) && $tokens[$i + 4][1] === '$request' &&
-            is_token($tokens[$i + 5], T_OBJECT_OPERATOR) &&
-            is_token($tokens[$i + 6], T_STRING) &&
-            (
-                $tokens[$i + 6][1] === 'get_query_params' ||
-                $tokens[$i + 6][1] === 'get_body_params' ||
-                $tokens[$i + 6][1] === 'get_json_params'
-            )
-        ) {
-            if ($tokens[$i + 6][1] === 'get_query_params') {
-                $super = WP_REST_REQUEST_SET_QUERY_PARAMS;
-            } else if ($tokens[$i + 6][1] === 'get_body_params') {
-                $super = WP_REST_REQUEST_SET_BODY_PARAMS;
-            } else if ($tokens[$i + 6][1] === 'get_json_params') {
-                $super = WP_REST_REQUEST_SET_BODY;
-            } else {
-                echo "Error: Unknown method {$tokens[$i + 6][1]}.\n";
+    $graph = [];
+    foreach ($definitions as $id => $definition) {
+        $callees = [];
+        foreach (array_unique($definition['functionCalls']) as $call) {
+            if (isset($functionIndex[$call])) {
+                $callees[$functionIndex[$call]] = true;
+            }
+
+            if ($call === __CONSTRUCT__) {
+                if ($definition['kind'] === 'method' && isset($classMethodIndex[$definition['class']][$call])) {
+                    $callees[$classMethodIndex[$definition['class']][$call]] = true;
+                }
                 continue;
             }
-            $paramVars[] = [
-                'var' => $tokens[$i][1],
-                'method' => $super,
-            ];
+
+            if ($definition['kind'] === 'method' && isset($classMethodIndex[$definition['class']][$call])) {
+                $callees[$classMethodIndex[$definition['class']][$call]] = true;
+            } elseif (isset($fileMethodIndex[$definition['file']][$call])) {
+                $callees[$fileMethodIndex[$definition['file']][$call]] = true;
+            } elseif (isset($methodIndex[$call]) && count($methodIndex[$call]) === 1) {
+                $callees[$methodIndex[$call][0]] = true;
+            }
         }
+        unset($callees[$id]);
+        $graph[$id] = array_keys($callees);
     }
 
-    // Step 2: Track accesses to those vars
-    for ($i = 0; $i < $count - 3; $i++) {
-        if (
-            is_token($tokens[$i], T_VARIABLE) &&
-            in_array($tokens[$i][1], array_column($paramVars, 'var'))
-        ) {
-            // $params['page']
-            if (
-                $tokens[$i + 1] === '[' &&
-                is_token($tokens[$i + 2], T_CONSTANT_ENCAPSED_STRING)
-            ) {
-                $paramVar = array_filter($paramVars, fn($var) => $var['var'] === $tokens[$i][1]);
-                if (empty($paramVar)) {
-                    echo "Error: Unknown variable {$tokens[$i][1]}.\n";
-                    continue;
-                }
-                $paramVar = array_values($paramVar)[0];
-                $super = $paramVar['method'];
-                $key = trim($tokens[$i + 2][1], "'\"");
-                if (!isset($inputs[$super]) || !in_array($key, $inputs[$super])) {
-                    $inputs[$super][] = $key;
+    return $graph;
+}
+
+/**
+ * Find the strongly connected components of the call graph (iterative Tarjan).
+ * Components are returned callees first, so they can be processed in order.
+ */
+function find_strongly_connected_components(array $graph): array
+{
+    $index = 0;
+    $indexes = [];
+    $lowlinks = [];
+    $stack = [];
+    $onStack = [];
+    $components = [];
+
+    foreach (array_keys($graph) as $root) {
+        if (isset($indexes[$root])) {
+            continue;
+        }
+
+        // Each frame is [node, position of the next callee to visit]
+        $frames = [[$root, 0]];
+        $indexes[$root] = $lowlinks[$root] = $index++;
+        $stack[] = $root;
+        $onStack[$root] = true;
+
+        while ($frames) {
+            [$node, $position] = $frames[count($frames) - 1];
+
+            if ($position < count($graph[$node])) {
+                $frames[count($frames) - 1][1]++;
+                $callee = $graph[$node][$position];
+                if (!isset($indexes[$callee])) {
+                    $indexes[$callee] = $lowlinks[$callee] = $index++;
+                    $stack[] = $callee;
+                    $onStack[$callee] = true;
+                    $frames[] = [$callee, 0];
+                } elseif (isset($onStack[$callee])) {
+                    $lowlinks[$node] = min($lowlinks[$node], $indexes[$callee]);
                 }
                 continue;
             }
-            // $params
-            // TODO: How to generate suitable array for $params?
+
+            array_pop($frames);
+            if ($frames) {
+                $parent = $frames[count($frames) - 1][0];
+                $lowlinks[$parent] = min($lowlinks[$parent], $lowlinks[$node]);
+            }
+
+            if ($lowlinks[$node] === $indexes[$node]) {
+                $component = [];
+                do {
+                    $member = array_pop($stack);
+                    unset($onStack[$member]);
+                    $component[] = $member;
+                } while ($member !== $node);
+                $components[] = $component;
+            }
         }
     }
 
-    return $inputs;
+    return $components;
+}
+
+/**
+ * Propagate user inputs and sink features from callees to callers, so each
+ * definition gets the inputs and features of everything it (transitively)
+ * calls. Every component is visited once, after all the components it calls.
+ */
+function propagate_user_inputs(array &$definitions, array $graph): void
+{
+    $componentOf = [];
+    $componentInputs = [];
+    $componentFeatures = [];
+
+    foreach (find_strongly_connected_components($graph) as $componentId => $component) {
+        $inputs = [];
+        $features = [];
+        foreach ($component as $id) {
+            $componentOf[$id] = $componentId;
+            merge_user_input_sets($inputs, to_user_input_set($definitions[$id]['inputs']));
+            merge_sink_features($features, $definitions[$id]['features']);
+        }
+        foreach ($component as $id) {
+            foreach ($graph[$id] as $callee) {
+                if ($componentOf[$callee] !== $componentId) {
+                    merge_user_input_sets($inputs, $componentInputs[$componentOf[$callee]]);
+                    merge_sink_features($features, $componentFeatures[$componentOf[$callee]]);
+                }
+            }
+        }
+        $componentInputs[$componentId] = $inputs;
+        $componentFeatures[$componentId] = $features;
+    }
+
+    foreach ($definitions as $id => $definition) {
+        // Keep the definition's own inputs first
+        $inputs = to_user_input_set($definition['inputs']);
+        merge_user_input_sets($inputs, $componentInputs[$componentOf[$id]]);
+        $definitions[$id]['inputs'] = from_user_input_set($inputs);
+        $definitions[$id]['features'] = $componentFeatures[$componentOf[$id]];
+    }
+}
+
+/**
+ * Parse files, sharded across $jobs forked workers if pcntl is available.
+ * Each worker serializes the summaries of its shard to a temporary file, and
+ * the parent merges them back in the original file order.
+ */
+function parse_php_files(array $files, int $jobs): array
+{
+    $jobs = min($jobs, count($files));
+    if ($jobs <= 1 || !function_exists('pcntl_fork')) {
+        $summaries = [];
+        foreach ($files as $file) {
+            $summaries[$file] = parse_php_file(file_get_contents($file));
+        }
+        return $summaries;
+    }
+
+    $workers = [];
+    for ($job = 0; $job < $jobs; $job++) {
+        // round-robin, so big files in one directory don't end up in a single shard
+        $shard = [];
+        for ($i = $job; $i < count($files); $i += $jobs) {
+            $shard[] = $files[$i];
+        }
+
+        $resultPath = tempnam(sys_get_temp_dir(), 'harness-generator-');
+        $pid = pcntl_fork();
+        if ($pid === -1) {
+            echo "Failed to fork, parsing remaining files sequentially.\n";
+            unlink($resultPath);
+            break;
+        }
+        if ($pid === 0) {
+            $summaries = [];
+            foreach ($shard as $file) {
+                $summaries[$file] = parse_php_file(file_get_contents($file));
+            }
+            file_put_contents($resultPath, serialize($summaries));
+            exit(0);
+        }
+        $workers[] = ['pid' => $pid, 'shard' => $shard, 'result' => $resultPath];
+    }
+
+    $results = [];
+    foreach ($workers as $worker) {
+        pcntl_waitpid($worker['pid'], $status);
+        $summaries = false;
+        if (pcntl_wifexited($status) && pcntl_wexitstatus($status) === 0) {
+            $summaries = unserialize(file_get_contents($worker['result']));
+        }
+        unlink($worker['result']);
+
+        if (!is_array($summaries)) {
+            echo "A parser worker failed, its files are parsed again.\n";
+            continue;
+        }
+        $results += $summaries;
+    }
+
+    $summaries = [];
+    foreach ($files as $file) {
+        $summaries[$file] = $results[$file] ?? parse_php_file(file_get_contents($file));
+    }
+    return $summaries;
 }
 
 function common_harness_header(HarnessType $type): string
 {
-    global $plugin_entry_file, $use_wp_loader;
+    global $plugin_entry_file, $use_wp_loader, $use_minimal_loader;
 
+    $base_loader = '';
     if ($use_wp_loader) {
         $wordpress_loader = './WordPress/wp-load.php';
     } else {
         if ($type === HarnessType::symbolic) {
             $wordpress_loader = 'symbolic-wordpress-loader.php';
+            if ($use_minimal_loader) {
+                $base_loader = "\$symwp_base_loader = '" . MINIMAL_BASE_LOADER . "';\n";
+            }
         } elseif ($type === HarnessType::concrete) {
             $wordpress_loader = 'concrete-wordpress-loader.php';
         } else {
@@ -488,7 +834,7 @@ function common_harness_header(HarnessType $type): string
     $output = <<<EOT
 <?php
 // This harness file is auto-generated at $timestamp. Do not edit.
-require '$wordpress_loader';
+{$base_loader}require '$wordpress_loader';
 require_once '$plugin_entry_file';
 do_action('plugins_loaded');
 
@@ -514,12 +860,120 @@ function get_dash_file_path(string $filepath): string
     return $result;
 }
 
-function remove_all_php_files_from_folder(string $outputDir): void
+function remove_stale_harnesses(string $outputDir, array $harnesses): void
 {
     if (!is_dir($outputDir)) {
         return;
     }
-    array_map('unlink', glob("$outputDir/*.php"));
+    foreach (glob("$outputDir/*.php") as $path) {
+        if (!isset($harnesses[$path])) {
+            unlink($path);
+        }
+    }
+    foreach (glob("$outputDir/*" . HARNESS_METADATA_SUFFIX) as $path) {
+        if (!isset($harnesses[substr($path, 0, -strlen(HARNESS_METADATA_SUFFIX))])) {
+            unlink($path);
+        }
+    }
+}
+
+/**
+ * Static features of a harness, used by the pipeline to run the most
+ * promising harnesses first.
+ */
+function get_harness_metadata(string $type, array $inputs, array $features): array
+{
+    return [
+        'type' => $type,
+        'inputs' => array_sum(array_map('count', $inputs)),
+        'reaches_xss_sink' => isset($features['xss']),
+        'reaches_sqli_sink' => isset($features['sqli']),
+        // Every reached sink is sanitized where it is reached
+        'sanitized' => $features !== [] && !in_array(false, $features, true),
+    ];
+}
+
+/**
+ * Write a harness and its metadata sidecar unless identical ones (apart
+ * from the timestamp) are already there, so unchanged harnesses keep their
+ * bytes and mtime.
+ */
+function write_harness(string $outputPath, string $harness, array $metadata): void
+{
+    global $written_harnesses;
+
+    $written_harnesses[$outputPath] = true;
+
+    $metadataPath = $outputPath . HARNESS_METADATA_SUFFIX;
+    $json = json_encode($metadata, JSON_PRETTY_PRINT) . "\n";
+    if (!is_file($metadataPath) || file_get_contents($metadataPath) !== $json) {
+        file_put_contents($metadataPath, $json);
+    }
+
+    $timestampPattern = '/^\/\/ This harness file is auto-generated at .*$/m';
+    if (is_file($outputPath)) {
+        $existing = file_get_contents($outputPath);
+        if (preg_replace($timestampPattern, '', $existing) === preg_replace($timestampPattern, '', $harness)) {
+            return;
+        }
+    }
+
+    file_put_contents($outputPath, $harness);
+}
+
+function load_parse_cache(string $cachePath): array
+{
+    if (!is_file($cachePath)) {
+        return [];
+    }
+
+    $cache = json_decode(file_get_contents($cachePath), true);
+    if (
+        !is_array($cache) ||
+        ($cache['version'] ?? null) !== PARSE_CACHE_VERSION ||
+        ($cache['generator'] ?? null) !== sha1_file(__FILE__) ||
+        // token ids differ between PHP versions
+        ($cache['php'] ?? null) !== PHP_VERSION
+    ) {
+        return [];
+    }
+
+    return $cache['files'] ?? [];
+}
+
+function save_parse_cache(string $cachePath, array $files): void
+{
+    $json = json_encode([
+        'version' => PARSE_CACHE_VERSION,
+        'generator' => sha1_file(__FILE__),
+        'php' => PHP_VERSION,
+        'files' => $files,
+    ]);
+    if ($json === false) {
+        echo "Failed to save parse cache: " . json_last_error_msg() . "\n";
+        return;
+    }
+
+    file_put_contents("$cachePath.tmp", $json);
+    rename("$cachePath.tmp", $cachePath);
+}
+
+/**
+ * Extract the functions and methods of a file with their user inputs and
+ * sink features, and those of the file itself if it runs code at the top level.
+ */
+function parse_php_file(string $code): array
+{
+    $tokens = token_get_all($code);
+    [$functions, $methods] = extract_functions_and_methods($tokens);
+    $inline = is_inline_php_file($tokens) ? collect_tokens($tokens) : new_token_collector();
+
+    return [
+        'functions' => $functions,
+        'methods' => $methods,
+        'inline_inputs' => get_collected_user_inputs($inline),
+        'inline_features' => get_collected_sink_features($inline),
+    ];
 }
 
 function get_wp_request_method(array $inputs): string
@@ -621,7 +1075,7 @@ function generate_function_harness(string $filepath, array $function, array $inp
         $args = append_function_params_to_harness($harness, $function['params'], $argIndex);
         $harness .= "{$funcname}({$args});\n";
 
-        file_put_contents($outputPath, $harness);
+        write_harness($outputPath, $harness, get_harness_metadata('function', $inputs, $function['features']));
     }
 }
 
@@ -660,13 +1114,12 @@ function generate_method_harness(string $filepath, array $method, array $inputs,
             }
         }
 
-        file_put_contents($outputPath, $harness);
+        write_harness($outputPath, $harness, get_harness_metadata('method', $inputs, $method['features']));
     }
 }
 
-function is_inline_php_file(string $code): bool
+function is_inline_php_file(array $tokens): bool
 {
-    $tokens = token_get_all($code);
     $depth = 0;
 
     foreach ($tokens as $i => $token) {
@@ -711,7 +1164,7 @@ function is_inline_php_file(string $code): bool
     return false;
 }
 
-function generate_inline_harness(string $filepath, array $inputs, string $outputDir): void
+function generate_inline_harness(string $filepath, array $inputs, array $features, string $outputDir): void
 {
     $basename = get_dash_file_path($filepath);
 
@@ -725,159 +1178,128 @@ function generate_inline_harness(string $filepath, array $inputs, string $output
 
         $harness .= "require_once '$filepath';\n";
 
-        file_put_contents($outputPath, $harness);
+        write_harness($outputPath, $harness, get_harness_metadata('inline', $inputs, $features));
     }
 }
 
-if ($argc < 2) {
-    echo "Usage: php {$argv[0]} <target_directory> [--use-wp-loader]\n";
-    exit(1);
-}
-$targetDir = rtrim($argv[1], '/\\');
-$outputDir = "$targetDir/" . OUTPUT_FOLDER;
-
-// Parse arguments
-$use_wp_loader = false;
-if ($argc > 2 && $argv[2] === '--use-wp-loader') {
-    $use_wp_loader = true;
-}
-
-foreach (HarnessType::cases() as $type) {
-    $dir = $outputDir . DIRECTORY_SEPARATOR . $type->name;
-    if (!is_dir($dir)) {
-        if (!mkdir($dir, 0755, true)) {
-            echo "Failed to create output directory: $dir\n";
+if ($argv && $argv[0] && realpath($argv[0]) === __FILE__) {
+    if ($argc < 2) {
+        echo "Usage: php {$argv[0]} <target_directory> [--use-wp-loader] [--minimal-loader] [--jobs=N]\n";
+        exit(1);
+    }
+    $targetDir = rtrim($argv[1], '/\\');
+    $outputDir = "$targetDir/" . OUTPUT_FOLDER;
+
+    // Parse arguments
+    $use_wp_loader = false;
+    $use_minimal_loader = false;
+    $jobs = 1;
+    foreach (array_slice($argv, 2) as $arg) {
+        if ($arg === '--use-wp-loader') {
+            $use_wp_loader = true;
+        } elseif ($arg === '--minimal-loader') {
+            $use_minimal_loader = true;
+        } elseif (str_starts_with($arg, '--jobs=')) {
+            $jobs = max(1, (int) substr($arg, strlen('--jobs=')));
+        } else {
+            echo "Unknown argument: $arg\n";
             exit(1);
         }
-    } else {
-        remove_all_php_files_from_folder($dir);
     }
-}
 
-$phpFiles = extract_php_files($targetDir);
-$plugin_entry_file = get_plugin_entry_file($targetDir);
-if ($plugin_entry_file === '') {
-    echo "No plugin entry file found. Please ensure the plugin header is present in one of the files.\n";
-    exit(1);
-}
-
-$inline_count = 0;
-$function_count = 0;
-$method_count = 0;
-foreach ($phpFiles as $phpFile) {
-    $code = file_get_contents($phpFile);
-
-    [$functions, $methods] = extract_functions_and_methods($code);
-
-    // directly generate harness for inline PHP files
-    if (is_inline_php_file($code)) {
-        $inputs = extract_user_input_vars($code);
-        if (!empty($inputs)) {
-            generate_inline_harness($phpFile, $inputs, $outputDir);
-            $inline_count++;
+    foreach (HarnessType::cases() as $type) {
+        $dir = $outputDir . DIRECTORY_SEPARATOR . $type->name;
+        if (!is_dir($dir)) {
+            if (!mkdir($dir, 0755, true)) {
+                echo "Failed to create output directory: $dir\n";
+                exit(1);
+            }
         }
     }
 
-    // extract user input variables from functions and methods
-    foreach ($functions as $index => $function) {
-        $inputs = extract_user_input_vars($function['body']);
-        $functions[$index]['inputs'] = $inputs;
-    }
-    foreach ($methods as $index => $method) {
-        $inputs = extract_user_input_vars($method['body']);
-        $methods[$index]['inputs'] = $inputs;
+    $phpFiles = extract_php_files($targetDir);
+    $plugin_entry_file = get_plugin_entry_file($targetDir);
+    if ($plugin_entry_file === '') {
+        echo "No plugin entry file found. Please ensure the plugin header is present in one of the files.\n";
+        exit(1);
     }
 
-    // merge inputs from function calls until "Fixed Point" is reached
-    $changed = true;
-    while ($changed) {
-        $changed = false;
-
-        foreach ($functions as $index => $function) {
-            foreach ($function['functionCalls'] as $call) {
-                $callee = null;
-
-                foreach ($functions as $f) {
-                    if ($f['name'] === $call) {
-                        $callee = $f;
-                        break;
-                    }
-                }
-                foreach ($methods as $m) {
-                    if ($m['method'] === $call) {
-                        $callee = $m;
-                        break;
-                    }
-                }
-
-                if ($callee) {
-                    $oldCount = count($functions[$index]['inputs']);
-                    $functions[$index]['inputs'] = array_merge(
-                        $functions[$index]['inputs'],
-                        $callee['inputs'],
-                    );
-
-                    if (count($functions[$index]['inputs']) !== $oldCount) {
-                        $changed = true;
-                    }
-                }
-            }
+    $inline_count = 0;
+    $function_count = 0;
+    $method_count = 0;
+    $definitions = [];
+    $written_harnesses = [];
+
+    // summaries of unchanged files are reused from the previous run
+    $parseCachePath = $outputDir . DIRECTORY_SEPARATOR . PARSE_CACHE_FILE;
+    $parseCache = load_parse_cache($parseCachePath);
+    $hashes = [];
+    $changedFiles = [];
+    foreach ($phpFiles as $phpFile) {
+        $hashes[$phpFile] = sha1_file($phpFile);
+        if (($parseCache[$phpFile]['hash'] ?? null) !== $hashes[$phpFile]) {
+            $changedFiles[] = $phpFile;
         }
+    }
+    $parsed = parse_php_files($changedFiles, $jobs);
+    $parsed_count = count($parsed);
+
+    $summaries = [];
+    foreach ($phpFiles as $phpFile) {
+        if (isset($parsed[$phpFile])) {
+            $summary = $parsed[$phpFile];
+            $summary['hash'] = $hashes[$phpFile];
+        } else {
+            $summary = $parseCache[$phpFile];
+        }
+        $summaries[$phpFile] = $summary;
 
-        foreach ($methods as $index => $method) {
-            foreach ($method['functionCalls'] as $call) {
-                $callee = null;
-
-                foreach ($functions as $f) {
-                    if ($f['name'] === $call) {
-                        $callee = $f;
-                        break;
-                    }
-                }
-                foreach ($methods as $m) {
-                    if ($m['method'] === $call) {
-                        $callee = $m;
-                        break;
-                    }
-                }
-
-                if ($callee) {
-                    $oldCount = count($methods[$index]['inputs']);
-                    $methods[$index]['inputs'] = array_merge(
-                        $methods[$index]['inputs'],
-                        $callee['inputs'],
-                    );
+        // directly generate harness for inline PHP files
+        if (!empty($summary['inline_inputs'])) {
+            generate_inline_harness($phpFile, $summary['inline_inputs'], $summary['inline_features'], $outputDir);
+            $inline_count++;
+        }
 
-                    if (count($methods[$index]['inputs']) !== $oldCount) {
-                        $changed = true;
-                    }
-                }
-            }
+        foreach ($summary['functions'] as $function) {
+            $function['kind'] = 'function';
+            $function['file'] = $phpFile;
+            $definitions[] = $function;
+        }
+        foreach ($summary['methods'] as $method) {
+            $method['kind'] = 'method';
+            $method['file'] = $phpFile;
+            $definitions[] = $method;
         }
     }
+    save_parse_cache($parseCachePath, $summaries);
+    echo "Parsed " . $parsed_count . " of " . count($phpFiles) . " files.\n";
 
-    foreach ($functions as $function) {
-        if (empty($function['inputs'])) {
+    // merge inputs and sink features from (transitive) callees across the whole plugin
+    propagate_user_inputs($definitions, build_call_graph($definitions));
+
+    foreach ($definitions as $definition) {
+        if (empty($definition['inputs'])) {
             continue;
         }
-        generate_function_harness($phpFile, $function, $function['inputs'], $outputDir);
-        $function_count++;
+        if ($definition['kind'] === 'function') {
+            generate_function_harness($definition['file'], $definition, $definition['inputs'], $outputDir);
+            $function_count++;
+        } else {
+            generate_method_harness($definition['file'], $definition, $definition['inputs'], $outputDir);
+            $method_count++;
+        }
     }
 
-    foreach ($methods as $method) {
-        if (empty($method['inputs'])) {
-            continue;
-        }
-        generate_method_harness($phpFile, $method, $method['inputs'], $outputDir);
-        $method_count++;
+    foreach (HarnessType::cases() as $type) {
+        remove_stale_harnesses($outputDir . DIRECTORY_SEPARATOR . $type->name, $written_harnesses);
     }
-}
 
-if (($inline_count + $function_count + $method_count) === 0) {
-    echo "No harnesses generated for plugin \"$targetDir\".";
-} else {
-    echo "Successfully generated harnesses for plugin \"$targetDir\".\n";
-    echo "Inline: $inline_count\n";
-    echo "Function: $function_count\n";
-    echo "Method: $method_count\n";
+    if (($inline_count + $function_count + $method_count) === 0) {
+        echo "No harnesses generated for plugin \"$targetDir\".";
+    } else {
+        echo "Successfully generated harnesses for plugin \"$targetDir\".\n";
+        echo "Inline: $inline_count\n";
+        echo "Function: $function_count\n";
+        echo "Method: $method_count\n";
+    }
 }
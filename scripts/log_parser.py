@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+
+import re
+import sys
+import json
+import argparse
+
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
+
+XSS_PAYLOAD_MARKER = "XSS_PAYLOAD_MARKER"
+
+# Tracker plugins write their test cases to *.testcases.jsonl in the S2E output
+TEST_CASE_FILE_SUFFIX = ".testcases.jsonl"
+LOG_FILE_NAME = "stdout.txt"
+
+# Test case lines of EchoFunctionTracker and SqliteFunctionTracker, which SinkTracker
+# replaced. SinkTracker only writes records, so these only match archived logs.
+XSS_TEST_CASE_PREFIX = b"EchoFunctionTracker: Test case:"
+SQLI_TEST_CASE_PREFIX = b"SqliteFunctionTracker: Test case:"
+FATAL_ERROR_MARKER = b"Fatal error"
+
+XSS_ARG_RE = re.compile(rb"v\d+_arg\d+_\d+(?:\(exploitable\))? = {[^}]*}; \(string\) \"([^)]*)\"")
+SQLI_ARG_RE = re.compile(rb"v\d+_arg\d+_\d+ = {[^}]*}; \(string\) \"([^)]*)\"")
+EXPLOITABLE_RE = re.compile(rb"v(\d+)_arg\d+_\d+(?:\(exploitable\))")
+
+
+class TestCase(NamedTuple):
+    kind: str
+    args: tuple[str, ...]
+
+
+class MaxArityArgs:
+    """
+    Set of test case arguments that only keeps the tuples with the most arguments.
+    Logs may be cut in the middle of a test case, so shorter tuples are incomplete.
+    """
+
+    def __init__(self):
+        self.arity = -1
+        self.args = set()
+        # Number of tuples accepted so far, it never decreases
+        self.seen = 0
+
+    def add(self, args: tuple) -> bool:
+        """
+        Args:
+            args (tuple): Arguments of a test case.
+        Returns:
+            bool: True if the arguments were not known and have the current max arity.
+        """
+        if len(args) < self.arity or args in self.args:
+            return False
+        if len(args) > self.arity:
+            self.arity = len(args)
+            self.args = set()
+        self.args.add(args)
+        self.seen += 1
+        return True
+
+    def __len__(self) -> int:
+        return len(self.args)
+
+    def __iter__(self):
+        return iter(self.args)
+
+
+def decode_arg(raw: bytes) -> str:
+    return raw.decode(errors="ignore")
+
+
+def parse_log_line(raw_line: bytes) -> TestCase | None:
+    """
+    Parse the test case printed by the legacy tracker plugins in a single log line.
+    Lines are filtered by substring before any regex runs.
+    Args:
+        raw_line (bytes): Log line.
+    Returns:
+        TestCase | None: Test case of the line, or None if it doesn't print one.
+    """
+    if XSS_TEST_CASE_PREFIX in raw_line:
+        matches = XSS_ARG_RE.findall(raw_line)
+        if not matches:
+            return None
+        args = [decode_arg(match) for match in matches]
+        for index in EXPLOITABLE_RE.findall(raw_line):
+            if int(index) < len(args):
+                args[int(index)] = XSS_PAYLOAD_MARKER
+        return TestCase("xss", tuple(args))
+
+    if SQLI_TEST_CASE_PREFIX in raw_line:
+        matches = SQLI_ARG_RE.findall(raw_line)
+        if not matches:
+            return None
+        return TestCase("sqli", tuple(decode_arg(match) for match in matches))
+
+    return None
+
+
+def parse_record(raw_line: bytes) -> TestCase | None:
+    """
+    Parse a single JSON line record written by SinkTracker.
+    Inputs are kept byte for byte up to the first NUL, so strings with
+    parentheses or non-printable bytes are not lost.
+    Args:
+        raw_line (bytes): JSON line of the record.
+    Returns:
+        TestCase | None: Test case of the record, or None if it is malformed.
+    """
+    try:
+        record = json.loads(raw_line)
+        kind = record["kind"]
+        inputs = record["inputs"]
+        args = []
+        for value in inputs:
+            if kind == "xss" and value.get("exploitable"):
+                args.append(XSS_PAYLOAD_MARKER)
+                continue
+            raw = bytes.fromhex(value["bytes"]).split(b"\0", 1)[0]
+            args.append(raw.decode(errors="surrogateescape"))
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return None
+    return TestCase(kind, tuple(args))
+
+
+def iter_test_cases(lines: Iterable[bytes], parse=parse_log_line) -> Iterator[TestCase]:
+    """
+    Yield the test cases of log lines or records as they are read.
+    Args:
+        lines (Iterable[bytes]): Lines of a log or record file.
+        parse (Callable[[bytes], TestCase | None]): Parser of a single line.
+    Yields:
+        TestCase: Test case of every line that has one.
+    """
+    for raw_line in lines:
+        test_case = parse(raw_line)
+        if test_case is not None:
+            yield test_case
+
+
+def iter_project_test_cases(project_path: Path) -> Iterator[TestCase]:
+    """
+    Yield the test cases of an S2E project or output directory. Records are
+    used if the plugins wrote any, the logs otherwise, which only happens for
+    projects archived before SinkTracker.
+    Args:
+        project_path (Path): Project directory, output directory or single file.
+    Yields:
+        TestCase: Every test case found.
+    """
+    if project_path.is_file():
+        files = [project_path]
+    else:
+        files = sorted(project_path.rglob(f"*{TEST_CASE_FILE_SUFFIX}"))
+        if not files:
+            files = sorted(project_path.rglob(LOG_FILE_NAME))
+
+    for path in files:
+        parse = parse_record if path.name.endswith(TEST_CASE_FILE_SUFFIX) else parse_log_line
+        with open(path, "rb") as f:
+            yield from iter_test_cases(f, parse)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Extract the test cases of archived S2E project logs and records."
+    )
+    parser.add_argument(
+        "paths", nargs="+", help="S2E project directories, output directories or log files."
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Print every test case as it is read, instead of the complete ones at the end.",
+    )
+    args = parser.parse_args()
+
+    for path in args.paths:
+        if not Path(path).exists():
+            print(f"[-] {path} does not exist.", file=sys.stderr)
+            continue
+
+        found = {"xss": MaxArityArgs(), "sqli": MaxArityArgs()}
+        for test_case in iter_project_test_cases(Path(path)):
+            if test_case.kind not in found:
+                continue
+            if args.all:
+                print(json.dumps({"path": path, "kind": test_case.kind, "args": test_case.args}))
+            else:
+                found[test_case.kind].add(test_case.args)
+
+        if not args.all:
+            for kind, test_cases in found.items():
+                for test_case in sorted(test_cases):
+                    print(json.dumps({"path": path, "kind": kind, "args": test_case}))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,43 +1,168 @@
 #!/usr/bin/env python3
 
+import io
 import os
 import re
+import json
+import hashlib
+import resource
 import shutil
 import subprocess
 import sys
 import signal
 import time
 import argparse
+import fcntl
+import tarfile
+import tempfile
+import threading
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from subprocess import TimeoutExpired, CalledProcessError
+from subprocess import TimeoutExpired
+
+from elf_symbols import resolve_symbols
+from log_parser import (
+    FATAL_ERROR_MARKER,
+    TEST_CASE_FILE_SUFFIX,
+    MaxArityArgs,
+    parse_record,
+)
 
 HARNESS_GEN_SCRIPT = "harness_generator.php"
 XSS_CHECKER = "XSSChecker.php"
 SQLI_CHECKER = "SQLiChecker.php"
+HARNESS_WORKER = "HarnessWorker.php"
+LOADER_TRACER = "LoaderTracer.php"
+BASE_LOADER = "base-wordpress-loader.php"
+MINIMAL_BASE_LOADER = "minimal-base-wordpress-loader.php"
+LOADER_TRACER_TIMEOUT_SECONDS = 600
 
 S2E_BOOTSTRAP_TEMPLATE_PATH = "bootstrap_template.sh"
 S2E_COMMAND = "s2e"
-OBJDUMP_COMMAND = "objdump"
+# libs2e builds of the S2E environment, holding the tracker plugins
+S2E_LIBS2E_GLOB = "install/share/libs2e/libs2e-*.so"
+SYMBOL_CACHE_PATH = ".symbol_cache.json"
 
 S2E_PROJECTS_DIR = "projects"
+ASSETS_DIR = ".assets"
+# Where the guest unpacks the guest snapshot, see bootstrap_template.sh
+GUEST_SNAPSHOT_ROOT = "/var/tmp/symwp"
+# Held while an opcache is built at GUEST_SNAPSHOT_ROOT on the host
+OPCACHE_BUILD_LOCK = "/var/tmp/symwp.lock"
 HARNESS_DIR = ".harness/symbolic"
+HARNESS_METADATA_SUFFIX = ".meta.json"
+LOADER_DIR = ".harness/loaders"
+# Harnesses calling a function directly are the quickest to reach their sinks
+HARNESS_TYPE_PRIORITY = {"function": 0, "method": 1, "inline": 2}
 OUTPUT_DIR = "SymWP"
 
-XSS_PAYLOAD_MARKER = "XSS_PAYLOAD_MARKER"
-
 FATAL_ERROR_THRESHOLD = 10000
 
-CHECK_INTERVAL_SECONDS = 10
+CHECK_INTERVAL_SECONDS = 1
+# Children are reaped with wait4 by polling, as Popen.wait does with a timeout
+WAIT_POLL_SECONDS = 0.05
+# With --adaptive-budget, S2E itself may run up to this many times --timeout
+ADAPTIVE_BUDGET_MAX_FACTOR = 4
 
 ENV_SYMWP_PHP = "SYMWP_PHP"
-
-ECHO_FUNCTION_TRACKER_ADDRESS = ""
-SQLITE_FUNCTION_TRACKER_ADDRESS = ""
-
+# opcache.so of the PHP build, defaults to modules/opcache.so of php-src
+ENV_SYMWP_OPCACHE = "SYMWP_OPCACHE"
+# Scripts are only cached in files, so they load like they would be compiled
+# in the guest: no shared memory interned strings, no optimizer and no JIT
+OPCACHE_INI = f"""zend_extension={GUEST_SNAPSHOT_ROOT}/opcache.so
+opcache.enable_cli=1
+opcache.file_cache={GUEST_SNAPSHOT_ROOT}/opcache
+opcache.file_cache_only=1
+opcache.validate_timestamps=0
+opcache.optimization_level=0
+opcache.jit=disable
+opcache.jit_buffer_size=0
+"""
+
+# PHP functions tracked by the SinkTracker plugin:
+# symbol -> (sink kind, argument layout, argument index)
+SINKS = {
+    "php_output_write": ("xss", "buffer", 0),
+    "sqlite_handle_preparer": ("sqli", "zend_string", 1),
+}
+SINK_ADDRESSES = {}
+# Per call site and state counters of SinkTracker, merged into <harness>.sinkstats.json
+SINK_STATS_FILE = "SinkTracker.stats.json"
+SINK_STATS_INTERVAL_SECONDS = 10
+SINK_STATS_SUFFIX = ".sinkstats.json"
+
+PLUGIN_FOLDER = ""
 STOP_IF_FOUND = False
 ITERATIONS = 1
 USE_WP_LOADER = False
+USE_GUEST_SNAPSHOT = False
+USE_MINIMAL_LOADER = False
+USE_OPCACHE = False
+MAX_TEST_CASES_PER_CALL_SITE = 0
+SKIP_UNCHANGED = False
+RESUME = False
+ADAPTIVE_BUDGET = False
+PLATEAU_MINUTES = 5.0
+GENERATOR_JOBS = 1
+ON_EXPLOITABLE = "continue"
+CORES_PER_PROJECT = 16
+MAX_CONCURRENCY = 1
+
+# Set when the running harnesses of an iteration should be cancelled, either
+# because one of them found a confirmed bug or because the user interrupted us.
+STOP_EVENT = threading.Event()
+STOP_LOCK = threading.Lock()
+
+# Seconds given back by harnesses that plateaued, shared with the harnesses still making
+# progress in the same iteration
+TIME_BANK_SECONDS = 0.0
+TIME_BANK_LOCK = threading.Lock()
+# Shared archives and tracker addresses must only be prepared once.
+ASSETS_LOCK = threading.Lock()
+
+# Dynamic checker outputs, keyed by (checker, harness content hash, checker inputs
+# hash, argv tuple), so that every distinct test case is only replayed once per run.
+VERDICT_CACHE = {}
+VERDICT_CACHE_LOCK = threading.Lock()
+VERDICT_CACHE_PATH = ""
+VERDICT_CACHE_VERSION = 2
+# True if verdicts were added since the cache was last saved
+VERDICT_CACHE_DIRTY = False
+FILE_HASHES = {}
+# Plugin name -> hash of everything but the harness a harness result depends on
+RUN_SETTINGS_HASHES = {}
+# Plugin name -> hash of everything but the harness and test case a verdict depends on
+CHECKER_INPUTS_HASHES = {}
+
+# Hashes of the harnesses completed in each output directory, see --skip-unchanged
+RUN_MANIFEST_FILE = ".run_manifest.json"
+RUN_MANIFEST_VERSION = 1
+RUN_MANIFESTS = {}
+RUN_MANIFESTS_LOCK = threading.Lock()
+# Harness count and durations of the steps shared by all harnesses of the run
+RUN_INFO = {}
+
+# Timed phases are appended as JSON lines next to the .args/.dynamic outputs
+SPAN_FILE_SUFFIX = ".spans.jsonl"
+RUN_SPAN_FILE = "pipeline.spans.jsonl"
+SPANS_LOCK = threading.Lock()
+# Echoed by the bootstrap right before PHP starts, splits guest bootstrap from exploration
+TARGET_START_MARKER = b"SymWP: target started"
+# Sent by minimal loaders through s2ecmd when a symbolic path calls a function they left out
+MINIMAL_LOADER_MISS_MARKER = b"SymWP: minimal loader misses "
+
+# Bounded pool shared by all harnesses to run checker invocations concurrently
+CHECKER_JOBS = 1
+CHECKER_POOL = None
+ENV_CHECKER_OUTPUT_DIR = "SYMWP_CHECKER_OUTPUT_DIR"
+
+# Persistent PHP worker that boots WordPress once and forks per checked harness run
+USE_HARNESS_WORKER = False
+HARNESS_WORKER_PROC = None
+HARNESS_WORKER_SOCKET = ""
+ENV_HARNESS_WORKER = "SYMWP_HARNESS_WORKER"
 
 
 def parse_args() -> None:
@@ -46,6 +171,11 @@ def parse_args() -> None:
     Sets global variables for timeout, argv length, and core count.
     """
     global TIMEOUT_MINUTES, ARGV_LENGTH, CORE, INCLUDE, STOP_IF_FOUND, ITERATIONS, USE_WP_LOADER
+    global CORES_PER_PROJECT, MAX_CONCURRENCY, CHECK_INTERVAL_SECONDS, VERDICT_CACHE_PATH
+    global CHECKER_JOBS, USE_HARNESS_WORKER, USE_GUEST_SNAPSHOT, MAX_TEST_CASES_PER_CALL_SITE
+    global USE_MINIMAL_LOADER, USE_OPCACHE
+    global ON_EXPLOITABLE, SKIP_UNCHANGED, GENERATOR_JOBS, RESUME, ADAPTIVE_BUDGET, PLATEAU_MINUTES
+    global OUTPUT_DIR, PLUGIN_FOLDER
 
     parser = argparse.ArgumentParser(
         description="Run symbolic & dynamic analysis on a WordPress plugin."
@@ -70,7 +200,31 @@ def parse_args() -> None:
         "-c",
         type=int,
         default=16,
-        help="Number of cores to use for S2E (default: 16).",
+        help="Total number of cores to use for S2E (default: 16).",
+    )
+    parser.add_argument(
+        "--cores-per-project",
+        type=int,
+        default=0,
+        help="Number of cores given to each S2E project (default: all of --core).",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        "-j",
+        type=int,
+        default=0,
+        help="Maximum number of S2E projects running at once (default: as many as --core allows).",
+    )
+    parser.add_argument(
+        "--adaptive-budget",
+        action="store_true",
+        help="End harnesses early once they stop finding new states, sinks or test cases, and give the saved time to harnesses that still make progress.",
+    )
+    parser.add_argument(
+        "--plateau-window",
+        type=float,
+        default=PLATEAU_MINUTES,
+        help=f"Minutes without progress after which --adaptive-budget ends a harness (default: {PLATEAU_MINUTES:g}).",
     )
     parser.add_argument(
         "--include",
@@ -84,6 +238,64 @@ def parse_args() -> None:
         action="store_true",
         help="Stop S2E analysis early if vulnerabilities are found.",
     )
+    parser.add_argument(
+        "--check-interval",
+        type=float,
+        default=CHECK_INTERVAL_SECONDS,
+        help=f"Seconds between log checks with --stop-if-found (default: {CHECK_INTERVAL_SECONDS}).",
+    )
+    parser.add_argument(
+        "--verdict-cache",
+        type=str,
+        default="",
+        help="Persist dynamic checker verdicts to this JSON file and reuse them across runs.",
+    )
+    parser.add_argument(
+        "--checker-jobs",
+        type=int,
+        default=1,
+        help="Number of dynamic checker invocations running at once (default: 1).",
+    )
+    parser.add_argument(
+        "--harness-worker",
+        action="store_true",
+        help="Replay test cases through a persistent PHP worker that loads WordPress once (requires pcntl).",
+    )
+    parser.add_argument(
+        "--max-test-cases-per-call-site",
+        type=int,
+        default=0,
+        help="Maximum number of test cases the trackers report per call site (default: 0, unlimited).",
+    )
+    parser.add_argument(
+        "--on-exploitable",
+        choices=["continue", "kill", "no-fork"],
+        default=ON_EXPLOITABLE,
+        help="What the trackers do with states reaching an output call site that already produced an exploitable test case, query call sites are left to the SQLi checker (default: continue).",
+    )
+    parser.add_argument(
+        "--generator-jobs",
+        type=int,
+        default=1,
+        help="Number of processes scanning plugin files in the harness generator (default: 1, requires pcntl).",
+    )
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help="Skip harnesses whose bytes are unchanged since a previous completed run.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume an interrupted run from the run manifest in the output directory, re-running only pending or failed harnesses.",
+    )
+    parser.add_argument(
+        "--output-dir",
+        "-o",
+        type=str,
+        default=OUTPUT_DIR,
+        help=f"Directory to write the results into (default: {OUTPUT_DIR}).",
+    )
     parser.add_argument(
         "--iterations",
         type=int,
@@ -95,15 +307,62 @@ def parse_args() -> None:
         action="store_true",
         help="Use original wp-loader.php instead of custom loaders.",
     )
+    parser.add_argument(
+        "--guest-snapshot",
+        action="store_true",
+        help="Ship PHP, WordPress and the loaders as one prebuilt guest snapshot, so only the harness and plugin are transferred per run.",
+    )
+    parser.add_argument(
+        "--opcache",
+        action="store_true",
+        help="Ship an opcache file cache of WordPress, the loaders and the plugin built on the host, so the guest PHP doesn't compile them (implies --guest-snapshot).",
+    )
+    parser.add_argument(
+        "--minimal-loader",
+        action="store_true",
+        help="Load only the WordPress files each harness needs in S2E, as traced from a concrete run.",
+    )
 
     args = parser.parse_args()
     TIMEOUT_MINUTES = args.timeout
     ARGV_LENGTH = args.argv_length
     CORE = args.core
     INCLUDE = args.include.replace("/", "-").replace(".", "-")
+    PLUGIN_FOLDER = args.plugin_folder
     STOP_IF_FOUND = args.stop_if_found
     ITERATIONS = args.iterations
+    OUTPUT_DIR = args.output_dir
     USE_WP_LOADER = args.use_wp_loader
+    CHECK_INTERVAL_SECONDS = args.check_interval
+    VERDICT_CACHE_PATH = args.verdict_cache
+    CHECKER_JOBS = max(1, args.checker_jobs)
+    USE_HARNESS_WORKER = args.harness_worker
+    USE_GUEST_SNAPSHOT = args.guest_snapshot
+    USE_MINIMAL_LOADER = args.minimal_loader
+    USE_OPCACHE = args.opcache
+    if USE_OPCACHE and not USE_GUEST_SNAPSHOT:
+        print("[+] --opcache implies --guest-snapshot.")
+        USE_GUEST_SNAPSHOT = True
+    if USE_MINIMAL_LOADER and USE_WP_LOADER:
+        print("[-] --minimal-loader has no effect with --use-wp-loader.")
+        USE_MINIMAL_LOADER = False
+    MAX_TEST_CASES_PER_CALL_SITE = max(0, args.max_test_cases_per_call_site)
+    ON_EXPLOITABLE = args.on_exploitable
+    SKIP_UNCHANGED = args.skip_unchanged
+    RESUME = args.resume
+    ADAPTIVE_BUDGET = args.adaptive_budget
+    PLATEAU_MINUTES = max(0.1, args.plateau_window)
+    GENERATOR_JOBS = max(1, args.generator_jobs)
+
+    CORES_PER_PROJECT = args.cores_per_project or CORE
+    if CORES_PER_PROJECT > CORE:
+        print(
+            f"[-] --cores-per-project ({CORES_PER_PROJECT}) exceeds --core ({CORE}), using {CORE}."
+        )
+        CORES_PER_PROJECT = CORE
+    MAX_CONCURRENCY = max(1, CORE // CORES_PER_PROJECT)
+    if args.max_concurrency > 0:
+        MAX_CONCURRENCY = min(MAX_CONCURRENCY, args.max_concurrency)
 
 
 def is_all_dependencies_present() -> bool:
@@ -111,11 +370,15 @@ def is_all_dependencies_present() -> bool:
     Check if all required dependencies are present.
     Returns True if all dependencies are found, otherwise False.
     """
-    global PHP_EXECUTABLE
+    global PHP_EXECUTABLE, OPCACHE_EXTENSION
     dependencies = [
         HARNESS_GEN_SCRIPT,
         XSS_CHECKER,
         SQLI_CHECKER,
+        HARNESS_WORKER,
+        LOADER_TRACER,
+        "elf_symbols.py",
+        "log_parser.py",
         S2E_BOOTSTRAP_TEMPLATE_PATH,
     ]
 
@@ -127,7 +390,6 @@ def is_all_dependencies_present() -> bool:
 
     commands = [
         [S2E_COMMAND],
-        [OBJDUMP_COMMAND, "-v"],
     ]
     for command in commands:
         try:
@@ -151,6 +413,15 @@ def is_all_dependencies_present() -> bool:
 
     PHP_EXECUTABLE = os.getenv(ENV_SYMWP_PHP)
 
+    if USE_OPCACHE and PHP_EXECUTABLE:
+        OPCACHE_EXTENSION = os.getenv(
+            ENV_SYMWP_OPCACHE,
+            str(Path(PHP_EXECUTABLE).resolve().parents[2] / "modules" / "opcache.so"),
+        )
+        if not Path(OPCACHE_EXTENSION).exists():
+            print(f"[-] Missing opcache extension: {OPCACHE_EXTENSION} (set {ENV_SYMWP_OPCACHE}).")
+            is_all_present = False
+
     return is_all_present
 
 
@@ -164,9 +435,102 @@ def generate_harnesses(plugin_folder: str) -> None:
     cmd = [PHP_EXECUTABLE, HARNESS_GEN_SCRIPT, plugin_folder]
     if USE_WP_LOADER:
         cmd.append("--use-wp-loader")
+    if USE_MINIMAL_LOADER:
+        cmd.append("--minimal-loader")
+    if GENERATOR_JOBS > 1:
+        cmd.append(f"--jobs={GENERATOR_JOBS}")
     subprocess.run(cmd, check=True)
 
 
+def get_minimal_loader(harness_path: str) -> Path | None:
+    """
+    Get the minimal base loader of a harness, tracing it from a concrete run of
+    the harness if it is missing or older than the harness or the base loader.
+    Args:
+        harness_path (str): Path to the symbolic harness file.
+    Returns:
+        Path | None: Path to the minimal loader, or None if tracing failed.
+    """
+    harness = Path(harness_path)
+    concrete_harness = Path(harness_path.replace("/symbolic/", "/concrete/"))
+    loader = harness.parent.parent.parent / LOADER_DIR / harness.name
+
+    if loader.exists() and loader.stat().st_mtime >= max(
+        concrete_harness.stat().st_mtime, Path(BASE_LOADER).stat().st_mtime
+    ):
+        return loader
+
+    print(f"[+] Tracing the WordPress files needed by {concrete_harness}...")
+    try:
+        subprocess.run(
+            [PHP_EXECUTABLE, LOADER_TRACER, str(concrete_harness), str(loader), BASE_LOADER],
+            check=True,
+            timeout=LOADER_TRACER_TIMEOUT_SECONDS,
+        )
+    except (subprocess.CalledProcessError, TimeoutExpired):
+        print(f"[-] Failed to trace a minimal loader for {harness_path}, using the full loader.")
+        return None
+    return loader
+
+
+def use_full_loader(harness_path: str, functions: set) -> None:
+    """
+    Replace the minimal loader of a harness with the base loader, so the next
+    runs load every WordPress file. It stays until the harness changes.
+    Args:
+        harness_path (str): Path to the symbolic harness file.
+        functions (set): Functions the minimal loader missed.
+    """
+    harness = Path(harness_path)
+    loader = harness.parent.parent.parent / LOADER_DIR / harness.name
+    print(
+        f"[-] The minimal loader of {harness_path} misses {', '.join(sorted(functions))}, "
+        "running it again with the full loader."
+    )
+    shutil.copy(BASE_LOADER, loader)
+
+
+def get_harness_priority(harness: Path) -> tuple:
+    """
+    Get the sort key of a harness from the metadata sidecar written by the generator.
+    Harnesses reaching more sinks come first, then unsanitized ones, then those
+    with fewer inputs to solve for. Harnesses without metadata come last.
+    Args:
+        harness (Path): Path to the symbolic harness file.
+    Returns:
+        tuple: Sort key, lower runs first.
+    """
+    try:
+        with open(harness.with_name(harness.name + HARNESS_METADATA_SUFFIX)) as f:
+            metadata = json.load(f)
+    except (OSError, ValueError):
+        return (1, 0, False, 0, 0, harness.name)
+
+    sinks = int(metadata.get("reaches_xss_sink", False)) + int(
+        metadata.get("reaches_sqli_sink", False)
+    )
+    return (
+        0,
+        -sinks,
+        metadata.get("sanitized", False),
+        metadata.get("inputs", 0),
+        HARNESS_TYPE_PRIORITY.get(metadata.get("type"), len(HARNESS_TYPE_PRIORITY)),
+        harness.name,
+    )
+
+
+def prioritize_harnesses(harnesses: list[Path]) -> list[Path]:
+    """
+    Order harnesses so the ones most likely to reach a sink run first, which
+    lowers the time-to-bug with --stop-if-found.
+    Args:
+        harnesses (list[Path]): Symbolic harnesses to analyze.
+    Returns:
+        list[Path]: Harnesses in scheduling order.
+    """
+    return sorted(harnesses, key=get_harness_priority)
+
+
 def get_argv_count(harness_path: str) -> int:
     """
     Get the number of symbolic arguments expected by the harness.
@@ -183,32 +547,227 @@ def get_argv_count(harness_path: str) -> int:
 
 def get_function_addresses() -> None:
     """
-    Get the addresses of the functions to be monitored by the plugins.
-    This function uses objdump to find the addresses of specific functions in the PHP binary.
+    Get the addresses of the sink functions to be monitored by the plugins.
+    The addresses are read from the ELF symbol table of the PHP binary and cached
+    in SYMBOL_CACHE_PATH until the binary changes.
     """
-    global ECHO_FUNCTION_TRACKER_ADDRESS, SQLITE_FUNCTION_TRACKER_ADDRESS
-
     try:
-        output = subprocess.check_output(
-            [OBJDUMP_COMMAND, "-d", PHP_EXECUTABLE], text=True
-        )
-        for line in output.splitlines():
-            if "php_output_write>:" in line:
-                ECHO_FUNCTION_TRACKER_ADDRESS = line.split()[0]
-            elif "sqlite_handle_preparer>:" in line:
-                SQLITE_FUNCTION_TRACKER_ADDRESS = line.split()[0]
-    except CalledProcessError as e:
+        addresses = resolve_symbols(PHP_EXECUTABLE, list(SINKS), SYMBOL_CACHE_PATH)
+    except (OSError, ValueError) as e:
         print(f"[-] Error getting function addresses: {e}")
+        sys.exit(1)
 
-    if not ECHO_FUNCTION_TRACKER_ADDRESS or not SQLITE_FUNCTION_TRACKER_ADDRESS:
-        print(
-            "[-] Could not find function addresses for EchoFunctionTracker or SqliteFunctionTracker."
-        )
+    missing = [symbol for symbol in SINKS if symbol not in addresses]
+    if missing:
+        print(f"[-] Could not find function addresses for {', '.join(missing)}.")
         sys.exit(1)
 
+    SINK_ADDRESSES.update(addresses)
+
+
+def get_tree_hash(root: str) -> str:
+    """
+    Get a content hash of a directory tree, covering file paths, modes and contents.
+    Args:
+        root (str): Path to the directory.
+    Returns:
+        str: Hex digest of the tree.
+    """
+    digest = hashlib.sha256()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            path = os.path.join(dirpath, filename)
+            if not os.path.isfile(path):
+                continue
+            mode = os.stat(path).st_mode & 0o777
+            digest.update(f"{os.path.relpath(path, root)}\0{mode:o}\0".encode())
+            digest.update(get_file_hash(path).encode())
+    return digest.hexdigest()
+
+
+def get_asset(name: str) -> Path:
+    """
+    Get the archive of a directory from the content-addressed asset store.
+    The archive is only built if no archive exists for the current content of
+    the tree, and archives of older contents are removed.
+    Args:
+        name (str): Name of the directory, e.g. "WordPress" or the plugin name.
+    Returns:
+        Path: Path to the archive.
+    """
+    tree_hash = get_tree_hash(name)[:16]
+    assets_dir = Path(ASSETS_DIR)
+    asset = assets_dir / f"{name}-{tree_hash}.tar.gz"
+    if asset.exists():
+        return asset
+
+    print(f"[+] Building archive for {name}...")
+    assets_dir.mkdir(parents=True, exist_ok=True)
+    tmp_base = assets_dir / f"{name}-{tree_hash}.tmp"
+    tmp_archive = shutil.make_archive(str(tmp_base), "gztar", "./", name)
+    os.replace(tmp_archive, asset)
+
+    for old_asset in assets_dir.glob(f"{name}-*.tar.gz"):
+        if old_asset != asset and re.fullmatch(
+            rf"{re.escape(name)}-[0-9a-f]{{16}}\.tar\.gz", old_asset.name
+        ):
+            old_asset.unlink()
+
+    return asset
+
+
+def get_guest_snapshot() -> tuple[str, Path]:
+    """
+    Get the guest snapshot bundle from the asset store, building it if needed.
+    The bundle is a gzipped tarball with PHP, WordPress and the loaders,
+    identified by the content of all of them.
+    Returns:
+        tuple[str, Path]: Snapshot ID and path to the bundle.
+    """
+    loaders = []
+    if not USE_WP_LOADER:
+        loaders = [
+            "base-wordpress-loader.php",
+            "symbolic-wordpress-loader.php",
+            "concrete-wordpress-loader.php",
+        ]
+
+    digest = hashlib.sha256()
+    digest.update(get_file_hash(PHP_EXECUTABLE).encode())
+    digest.update(get_tree_hash("WordPress").encode())
+    for loader in loaders:
+        digest.update(f"{loader}\0{get_file_hash(loader)}".encode())
+    if USE_OPCACHE:
+        digest.update(get_file_hash(OPCACHE_EXTENSION).encode())
+        digest.update(OPCACHE_INI.encode())
+    snapshot_id = digest.hexdigest()[:16]
+
+    assets_dir = Path(ASSETS_DIR)
+    bundle = assets_dir / f"guest-{snapshot_id}.tar.gz"
+    if bundle.exists():
+        return snapshot_id, bundle
+
+    print(f"[+] Building guest snapshot {snapshot_id}...")
+    assets_dir.mkdir(parents=True, exist_ok=True)
+    tmp_bundle = assets_dir / f"guest-{snapshot_id}.tar.gz.tmp"
+    with tarfile.open(tmp_bundle, "w:gz") as tar:
+        tar.add(PHP_EXECUTABLE, arcname="php")
+        tar.add("WordPress")
+        for loader in loaders:
+            tar.add(loader)
+        if USE_OPCACHE:
+            tar.add(OPCACHE_EXTENSION, arcname="opcache.so")
+            ini = tarfile.TarInfo("conf.d/opcache.ini")
+            ini.size = len(OPCACHE_INI.encode())
+            tar.addfile(ini, io.BytesIO(OPCACHE_INI.encode()))
+    os.replace(tmp_bundle, bundle)
+
+    for old_bundle in assets_dir.glob("guest-*.tar.gz"):
+        if old_bundle != bundle:
+            old_bundle.unlink()
+
+    return snapshot_id, bundle
+
+
+def get_opcache(plugin_name: str, snapshot_id: str, snapshot_bundle: Path) -> Path | None:
+    """
+    Get the opcache file cache of a plugin from the asset store, building it if needed.
+    Opcache keys the cached scripts by their full path, so the snapshot and the
+    plugin are unpacked where the guest has them and compiled there with the
+    same PHP, extension and settings. Builds of all pipeline processes on the
+    host take turns under OPCACHE_BUILD_LOCK, and each removes the directory it
+    created. A directory that already exists is never touched.
+    Args:
+        plugin_name (str): Name of the plugin.
+        snapshot_id (str): ID of the guest snapshot.
+        snapshot_bundle (Path): Path to the guest snapshot bundle.
+    Returns:
+        Path | None: Path to the archive of the cache, or None if it can't be built.
+    """
+    digest = hashlib.sha256(f"{snapshot_id}\0{get_tree_hash(plugin_name)}".encode())
+    cache_id = digest.hexdigest()[:16]
+    assets_dir = Path(ASSETS_DIR)
+    asset = assets_dir / f"opcache-{plugin_name}-{cache_id}.tar"
+    if asset.exists():
+        return asset
+
+    root = Path(GUEST_SNAPSHOT_ROOT)
+    with open(OPCACHE_BUILD_LOCK, "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        # Built by another pipeline process while this one waited
+        if asset.exists():
+            return asset
+        try:
+            root.mkdir()
+        except FileExistsError:
+            print(f"[-] {root} already exists, remove it to build the opcache of {plugin_name}. Running without opcache.")
+            return None
+
+        print(f"[+] Building opcache for {plugin_name}...")
+        try:
+            with tarfile.open(snapshot_bundle) as tar:
+                tar.extractall(root)
+            shutil.copytree(plugin_name, root / "plugins" / plugin_name, symlinks=True)
+            (root / "opcache").mkdir()
+
+            # Scripts that don't compile with this PHP are compiled (and fail) in the guest as before
+            compile_script = (
+                "$files = new RecursiveIteratorIterator(new RecursiveDirectoryIterator('.'));"
+                "foreach ($files as $file) {"
+                " if ($file->isFile() && $file->getExtension() === 'php') {"
+                " try { @opcache_compile_file($file->getPathname()); } catch (Throwable $e) {}"
+                " } }"
+            )
+            subprocess.run(
+                [PHP_EXECUTABLE, "-r", compile_script],
+                cwd=root,
+                env={**os.environ, "PHP_INI_SCAN_DIR": str(root / "conf.d")},
+                check=True,
+                stdout=subprocess.DEVNULL,
+            )
+
+            tmp_asset = assets_dir / f"opcache-{plugin_name}-{cache_id}.tar.tmp"
+            with tarfile.open(tmp_asset, "w") as tar:
+                tar.add(root / "opcache", arcname="opcache")
+            os.replace(tmp_asset, asset)
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    for old_asset in assets_dir.glob(f"opcache-{plugin_name}-*.tar"):
+        if old_asset != asset:
+            old_asset.unlink()
+
+    return asset
+
+
+def link_asset(asset: Path, dest: Path) -> None:
+    """
+    Link an asset into a project, falling back to a symlink and then to a copy
+    if hardlinks aren't supported.
+    Args:
+        asset (Path): Path to the asset in the store.
+        dest (Path): Path of the asset in the project.
+    """
+    if dest.is_symlink() or dest.exists():
+        dest.unlink()
+    try:
+        os.link(asset, dest)
+        return
+    except OSError:
+        pass
+    try:
+        dest.symlink_to(asset.resolve())
+    except OSError:
+        shutil.copy(asset, dest)
+
 
 def setup_s2e_project(
-    plugin_name: str, harness_path: str, argv_count: int, project_name: str
+    plugin_name: str,
+    harness_path: str,
+    argv_count: int,
+    project_name: str,
+    spans: "SpanLog" = None,
 ) -> None:
     """
     Set up a new S2E project with the given harness and symbolic arguments.
@@ -217,28 +776,29 @@ def setup_s2e_project(
         harness_path (str): Path to the harness file.
         argv_count (int): Number of symbolic arguments.
         project_name (str): Name of the S2E project.
+        spans (SpanLog): Spans of the harness, to time project creation and assets.
     """
-    global ECHO_FUNCTION_TRACKER_ADDRESS, SQLITE_FUNCTION_TRACKER_ADDRESS
-
     print(f"[+] Setting up S2E project for {project_name}...")
     proj_path = Path(S2E_PROJECTS_DIR) / project_name
+    spans = spans or SpanLog(None)
 
     # Run S2E command to new project
     print(f"[+] Generating new project...")
-    subprocess.run(
-        [
-            S2E_COMMAND,
-            "new_project",
-            "-f",
-            "-n",
-            project_name,
-            PHP_EXECUTABLE,
-            harness_path,
-        ],
-        check=True,
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-    )
+    with spans.span("new_project"):
+        subprocess.run(
+            [
+                S2E_COMMAND,
+                "new_project",
+                "-f",
+                "-n",
+                project_name,
+                PHP_EXECUTABLE,
+                harness_path,
+            ],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
 
     print(f"[+] Rewriting configs...")
     bootstrap_path = proj_path / "bootstrap.sh"
@@ -246,10 +806,24 @@ def setup_s2e_project(
     with open(bootstrap_path, "r") as f:
         lines = f.readlines()
 
+    snapshot_id = ""
+    opcache = None
+    if USE_GUEST_SNAPSHOT:
+        with spans.span("assets"), ASSETS_LOCK:
+            snapshot_id, snapshot_bundle = get_guest_snapshot()
+            if USE_OPCACHE:
+                opcache = get_opcache(plugin_name, snapshot_id, snapshot_bundle)
+
     sym_args = " ".join(str(i) for i in range(2, argv_count + 1))
     new_lines = []
     for line in lines:
-        if "S2E_SYM_ARGS=" in line:
+        if line.startswith('GUEST_SNAPSHOT=""'):
+            new_lines.append(f'GUEST_SNAPSHOT="{snapshot_id}"\n')
+        elif line.startswith('OPCACHE=""') and opcache is not None:
+            new_lines.append(f'OPCACHE="{opcache.name}"\n')
+        elif line.startswith('MINIMAL_LOADER=""') and USE_MINIMAL_LOADER:
+            new_lines.append(f'MINIMAL_LOADER="{MINIMAL_BASE_LOADER}"\n')
+        elif "S2E_SYM_ARGS=" in line:
             new_lines.append(
                 line.replace('S2E_SYM_ARGS=""', f'S2E_SYM_ARGS="{sym_args}"')
             )
@@ -264,52 +838,73 @@ def setup_s2e_project(
             new_lines.append(line)
             new_lines.append(f'${{S2ECMD}} get "{plugin_name}.tar.gz"\n')
             new_lines.append(f"tar -xzf {plugin_name}.tar.gz\n")
+            if opcache is not None:
+                new_lines.append(f'load_opcache "{plugin_name}"\n')
         else:
             new_lines.append(line)
 
     with open(bootstrap_path, "w") as f:
         f.writelines(new_lines)
 
-    if not ECHO_FUNCTION_TRACKER_ADDRESS or not SQLITE_FUNCTION_TRACKER_ADDRESS:
-        get_function_addresses()
+    with ASSETS_LOCK:
+        if not SINK_ADDRESSES:
+            get_function_addresses()
 
     # enable plugins in s2e-config.lua
     s2e_config_path = proj_path / "s2e-config.lua"
     with open(s2e_config_path, "a") as f:
         f.write('\nadd_plugin("FunctionMonitor")\n')
-        f.write(
-            f'add_plugin("EchoFunctionTracker")\npluginsConfig.EchoFunctionTracker = {{\n    addressToTrack = 0x{ECHO_FUNCTION_TRACKER_ADDRESS},\n}}\n'
-        )
-        f.write(
-            f'add_plugin("SqliteFunctionTracker")\npluginsConfig.SqliteFunctionTracker = {{\n    addressToTrack = 0x{SQLITE_FUNCTION_TRACKER_ADDRESS},\n}}\n'
-        )
+        f.write('add_plugin("SinkTracker")\npluginsConfig.SinkTracker = {\n')
+        f.write(f'    testCaseFile = "SinkTracker{TEST_CASE_FILE_SUFFIX}",\n')
+        f.write(f"    maxTestCasesPerCallSite = {MAX_TEST_CASES_PER_CALL_SITE},\n")
+        f.write(f'    onExploitable = "{ON_EXPLOITABLE}",\n')
+        f.write(f'    statsFile = "{SINK_STATS_FILE}",\n')
+        f.write(f"    statsInterval = {SINK_STATS_INTERVAL_SECONDS},\n")
+        f.write("    sinks = {\n")
+        for symbol, (kind, layout, arg) in SINKS.items():
+            f.write(
+                f"        {symbol} = {{ address = 0x{SINK_ADDRESSES[symbol]:x}, "
+                f'kind = "{kind}", layout = "{layout}", arg = {arg} }},\n'
+            )
+        f.write("    },\n}\n")
 
     print(f"[+] Copying files...")
-    plugin_zip = f"{plugin_name}.tar.gz"
-    if not Path(plugin_zip).exists():
-        shutil.make_archive(plugin_name, "gztar", "./", plugin_name)
-    shutil.copy(f"{plugin_name}.tar.gz", proj_path)
+    with spans.span("assets"):
+        with ASSETS_LOCK:
+            plugin_zip = get_asset(plugin_name)
+            wordpress_zip = None if USE_GUEST_SNAPSHOT else get_asset("WordPress")
+        link_asset(plugin_zip, proj_path / f"{plugin_name}.tar.gz")
+        if USE_GUEST_SNAPSHOT:
+            link_asset(snapshot_bundle, proj_path / snapshot_bundle.name)
+            if opcache is not None:
+                link_asset(opcache, proj_path / opcache.name)
+        else:
+            link_asset(wordpress_zip, proj_path / "WordPress.tar.gz")
 
-    wordpress_zip = "WordPress.tar.gz"
-    if not Path(wordpress_zip).exists():
-        shutil.make_archive("WordPress", "gztar", "./", "WordPress")
-    shutil.copy(wordpress_zip, proj_path)
+        harness_dest = proj_path / "harness.php"
+        shutil.copy(harness_path, harness_dest)
+        shutil.move(
+            f"{proj_path}/{Path(harness_path).name}.symranges",
+            f"{proj_path}/harness.symranges",
+        )
 
-    harness_dest = proj_path / "harness.php"
-    shutil.copy(harness_path, harness_dest)
-    shutil.move(
-        f"{proj_path}/{Path(harness_path).name}.symranges",
-        f"{proj_path}/harness.symranges",
-    )
+        if USE_MINIMAL_LOADER:
+            # Harnesses generated with --minimal-loader always load this file
+            minimal_loader = get_minimal_loader(harness_path) or Path(BASE_LOADER)
+            shutil.copy(minimal_loader, proj_path / MINIMAL_BASE_LOADER)
 
-    if not USE_WP_LOADER:
-        shutil.copy("base-wordpress-loader.php", proj_path)
-        shutil.copy("symbolic-wordpress-loader.php", proj_path)
-        shutil.copy("concrete-wordpress-loader.php", proj_path)
+        if not USE_WP_LOADER and not USE_GUEST_SNAPSHOT:
+            shutil.copy(BASE_LOADER, proj_path)
+            shutil.copy("symbolic-wordpress-loader.php", proj_path)
+            shutil.copy("concrete-wordpress-loader.php", proj_path)
 
 
 def run_s2e(
-    project_name: str, project_path: str, harness_path: str = None
+    project_name: str,
+    project_path: str,
+    harness_path: str = None,
+    reader: "SymbolicArgsReader" = None,
+    span: dict | None = None,
 ) -> tuple[bool, float]:
     """
     Run the S2E analysis on the specified project.
@@ -317,6 +912,8 @@ def run_s2e(
         project_name (str): Name of the S2E project.
         project_path (Path): Path to the S2E project directory.
         harness_path (str): Path to the harness file (needed for early stopping).
+        reader (SymbolicArgsReader): Reader of the project logs (needed for early stopping).
+        span (dict | None): Span to record the resources of S2E into.
     Returns:
         tuple[bool, float]: (True if stopped early due to vulnerability, time-to-bug in seconds)
     """
@@ -331,6 +928,11 @@ def run_s2e(
 
     early_stop = False
     time_to_bug = 0.0
+    proc = None
+    rusage = None
+    s2e_timeout_minutes = TIMEOUT_MINUTES
+    if ADAPTIVE_BUDGET:
+        s2e_timeout_minutes *= ADAPTIVE_BUDGET_MAX_FACTOR
     try:
         with open(str(project_path) + "/stdout.txt", "w") as f:
             proc = subprocess.Popen(
@@ -339,9 +941,9 @@ def run_s2e(
                     "run",
                     "-n",
                     "-t",
-                    str(TIMEOUT_MINUTES),
+                    str(s2e_timeout_minutes),
                     "-c",
-                    str(CORE),
+                    str(CORES_PER_PROJECT),
                     project_name,
                 ],
                 stdout=f,
@@ -349,67 +951,442 @@ def run_s2e(
                 preexec_fn=os.setsid,  # Ensure we can kill the process group
             )
 
-            # If stop-if-found is enabled, monitor logs periodically
-            if STOP_IF_FOUND and harness_path:
-                timeout_end = time.time() + TIMEOUT_MINUTES * 60
-
-                while time.time() < timeout_end:
-                    # Check if process is still running
-                    if proc.poll() is not None:
+            # S2E's timeout is not accurate, so we need to make sure it's not running too long
+            timeout_end = time.time() + TIMEOUT_MINUTES * 60
+            max_timeout_end = time.time() + s2e_timeout_minutes * 60
+            plateau = Plateau(reader) if ADAPTIVE_BUDGET and reader else None
+            while True:
+                if time.time() >= timeout_end:
+                    extension = 0.0
+                    if plateau is not None and not plateau.reached():
+                        extension = withdraw_time_budget(max_timeout_end - timeout_end)
+                    if extension <= 0:
                         break
+                    timeout_end += extension
+                    print(
+                        f"[+] {project_name} is still making progress, extending its budget by {extension/60:.2f} minutes."
+                    )
 
-                    # Wait for check interval or process completion
-                    try:
-                        proc.wait(timeout=CHECK_INTERVAL_SECONDS)
-                        break  # Process completed normally
-                    except TimeoutExpired:
-                        # Process still running, check for vulnerabilities
-                        if check_for_vulnerabilities_during_execution(
-                            str(project_path), harness_path
-                        ):
-                            time_to_bug = time.time() - start_time
-                            print(
-                                f"[!] Stopping S2E analysis due to vulnerability found."
-                            )
-                            print(
-                                f"[!] Time-to-bug: {time_to_bug:.2f} seconds ({time_to_bug/60:.2f} minutes)"
-                            )
-                            os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
-                            early_stop = True
-                            break
-
-                # Final timeout check
-                if time.time() >= timeout_end and proc.poll() is None:
-                    os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
-            else:
-                # S2E's timeout is not accurate, so we need to make sure it's not running too long
-                proc.wait(timeout=TIMEOUT_MINUTES * 60)
-
-    except TimeoutExpired:
-        os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
-    except KeyboardInterrupt:
-        print("[-] User interrupted the process.")
-        os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
+                # Wait for check interval or process completion
+                rusage = wait_process(proc, CHECK_INTERVAL_SECONDS)
+                if rusage is not None:
+                    break  # Process completed normally
+
+                # A sibling harness found a bug or the user interrupted the run
+                if STOP_EVENT.is_set():
+                    print(f"[-] Cancelling S2E analysis of {project_name}.")
+                    break
+
+                # Outputs are read once per poll, so test cases seen by the plateau
+                # detection are still checked and the other way around
+                symbolic_args = None
+                if reader and (STOP_IF_FOUND or plateau is not None or USE_MINIMAL_LOADER):
+                    symbolic_args = reader.read()
+
+                # The rest of the run would miss the paths through that function
+                if reader and reader.loader_misses:
+                    print(f"[-] Stopping S2E analysis of {project_name}, its minimal loader misses a function.")
+                    break
+
+                # If stop-if-found is enabled, monitor logs periodically
+                if (
+                    STOP_IF_FOUND
+                    and harness_path
+                    and symbolic_args is not None
+                    and check_for_vulnerabilities_during_execution(reader, symbolic_args, harness_path, span)
+                ):
+                    with STOP_LOCK:
+                        # Only the first confirmed bug of an iteration counts
+                        early_stop = not STOP_EVENT.is_set()
+                        STOP_EVENT.set()
+                    if early_stop:
+                        time_to_bug = time.time() - start_time
+                        print(f"[!] Stopping S2E analysis due to vulnerability found.")
+                        print(
+                            f"[!] Time-to-bug: {time_to_bug:.2f} seconds ({time_to_bug/60:.2f} minutes)"
+                        )
+                    break
+
+                if plateau is not None and plateau.update():
+                    saved = max(0.0, timeout_end - time.time())
+                    deposit_time_budget(saved)
+                    print(
+                        f"[+] No new states, sinks or test cases in {project_name} for {PLATEAU_MINUTES:g} minutes, "
+                        f"stopping and giving {saved/60:.2f} minutes to other harnesses."
+                    )
+                    break
+
+    # Ctrl-C reaches the main thread only, which cancels this run through STOP_EVENT
+    finally:
+        if proc is not None and proc.returncode is None:
+            os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
+            rusage = wait_process(proc)
+        if rusage is not None:
+            add_child_usage(span, rusage)
 
     return early_stop, time_to_bug
 
 
-def remove_incomplete_args(args: set) -> set:
+def deposit_time_budget(seconds: float) -> None:
     """
-    Logs may not complete, delete those not have enough args.
+    Give the unused time of a harness that plateaued to the other harnesses.
     Args:
-        args (set): Set of tuples containing symbolic arguments.
+        seconds (float): Number of seconds the harness didn't use.
+    """
+    global TIME_BANK_SECONDS
+    with TIME_BANK_LOCK:
+        TIME_BANK_SECONDS += seconds
+
+
+def withdraw_time_budget(limit: float) -> float:
+    """
+    Take up to one plateau window of the time saved by other harnesses.
+    Args:
+        limit (float): Maximum number of seconds the caller can still use.
+    Returns:
+        float: Number of seconds granted, 0 if the bank is empty.
+    """
+    global TIME_BANK_SECONDS
+    with TIME_BANK_LOCK:
+        seconds = max(0.0, min(TIME_BANK_SECONDS, PLATEAU_MINUTES * 60, limit))
+        TIME_BANK_SECONDS -= seconds
+    return seconds
+
+
+def wait_process(proc: subprocess.Popen, timeout: float | None = None) -> resource.struct_rusage | None:
+    """
+    Reap a child process with wait4. Unlike Popen.wait and getrusage(RUSAGE_CHILDREN),
+    this gets the resources of that child alone (and of the processes it reaped),
+    not of the children of harnesses running at the same time.
+    Args:
+        proc (subprocess.Popen): Child process to reap.
+        timeout (float | None): Seconds to wait for it to exit, None to wait until it does.
     Returns:
-        set: Filtered set of tuples with only complete arguments.
+        resource.struct_rusage | None: Resource usage of the child, or None if it still runs.
+    """
+    deadline = None if timeout is None else time.time() + timeout
+    while True:
+        pid, status, rusage = os.wait4(proc.pid, 0 if deadline is None else os.WNOHANG)
+        if pid != 0:
+            # Popen would otherwise try to wait for the process again
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            return rusage
+        if time.time() >= deadline:
+            return None
+        time.sleep(WAIT_POLL_SECONDS)
+
+
+def add_child_usage(span: dict | None, rusage: resource.struct_rusage) -> None:
+    """
+    Add the resource usage of a reaped child process to a span.
+    Args:
+        span (dict | None): Fields of a running span, None if the caller isn't timed.
+        rusage (resource.struct_rusage): Resource usage returned by wait_process.
+    """
+    if span is None:
+        return
+    # Checkers of a harness are reaped by several threads of the checker pool
+    with SPANS_LOCK:
+        span["children_cpu"] += rusage.ru_utime + rusage.ru_stime
+        span["children_max_rss_kb"] = max(span["children_max_rss_kb"], rusage.ru_maxrss)
+
+
+class SpanLog:
+    """
+    Spans of the phases of a harness (or of the whole run), written as JSON
+    lines. Besides the CPU time of the current thread, a span records the CPU
+    time and max RSS of the child processes reaped for it, see add_child_usage.
+    """
+
+    def __init__(self, path: Path | None, **fields):
+        self.path = path
+        self.fields = fields
+        # Total seconds per phase, for the run manifest
+        self.durations = {}
+
+    def write(self, phase: str, **fields) -> None:
+        """
+        Args:
+            phase (str): Name of the phase.
+            **fields: Fields of the span, at least its start and duration.
+        """
+        self.durations[phase] = self.durations.get(phase, 0.0) + fields["duration"]
+        if self.path is None:
+            return
+        record = {"phase": phase, **self.fields, **fields}
+        with SPANS_LOCK:
+            with open(self.path, "a") as f:
+                f.write(json.dumps(record) + "\n")
+
+    @contextmanager
+    def span(self, phase: str, **fields):
+        """
+        Time the body of the with statement as a phase. Fields can be added to
+        the yielded dict until the phase ends, its start and duration are set
+        once it ends.
+        Args:
+            phase (str): Name of the phase.
+            **fields: Extra fields of the span, e.g. log bytes parsed.
+        """
+        start = time.time()
+        thread_cpu = time.thread_time()
+        fields["failed"] = True
+        fields["children_cpu"] = 0.0
+        fields["children_max_rss_kb"] = 0
+        try:
+            yield fields
+            fields["failed"] = False
+        finally:
+            fields["start"] = start
+            fields["duration"] = time.time() - start
+            fields["thread_cpu"] = time.thread_time() - thread_cpu
+            self.write(phase, **fields)
+
+    def split_s2e(self, s2e_span: dict, target_start: int | None) -> None:
+        """
+        Split the S2E span into the guest bootstrap and the symbolic exploration,
+        at the time the guest logged right before starting PHP.
+        Args:
+            s2e_span (dict): Fields of the ended S2E span.
+            target_start (int | None): Seconds from the start of S2E until PHP started.
+        """
+        if target_start is None:
+            return
+        bootstrap = min(float(target_start), s2e_span["duration"])
+        self.write(
+            "guest_bootstrap", start=s2e_span["start"], duration=bootstrap, within="s2e"
+        )
+        self.write(
+            "exploration",
+            start=s2e_span["start"] + bootstrap,
+            duration=s2e_span["duration"] - bootstrap,
+            within="s2e",
+        )
+
+
+class Plateau:
+    """
+    Track whether a running S2E project still finds new states, sinks or test cases.
+    """
+
+    def __init__(self, reader: "SymbolicArgsReader"):
+        self.reader = reader
+        self.progress = None
+        self.last_progress_time = time.time()
+
+    def update(self) -> bool:
+        """
+        Update the progress from the project outputs the reader read last.
+        Returns:
+            bool: True if nothing new appeared during the last plateau window.
+        """
+        progress = self.reader.progress()
+        if progress != self.progress:
+            self.progress = progress
+            self.last_progress_time = time.time()
+        return self.reached()
+
+    def reached(self) -> bool:
+        return time.time() - self.last_progress_time >= PLATEAU_MINUTES * 60
+
+
+class SymbolicArgsReader:
+    """
+    Incrementally extract symbolic arguments from the outputs of an S2E project.
+    Test cases are read from the JSON lines records of SinkTracker; logs are
+    followed for fatal errors and progress only. Per-file byte offsets are
+    remembered between calls, so only newly appended lines are parsed. Only the
+    test cases with the most arguments are kept.
     """
-    max = -1
-    if len(args) > 0:
-        for arg in args:
-            if len(arg) > max:
-                max = len(arg)
-        args = [arg for arg in args if len(arg) == max]
 
-    return args
+    def __init__(self, project_path: str, args: dict | None = None):
+        self.project_path = Path(project_path)
+        # file -> ((st_dev, st_ino), offset of the first unparsed byte)
+        self.offsets = {}
+        # Test cases of an earlier run of the harness are kept, see analyze_harness
+        self.args = args or {"xss": MaxArityArgs(), "sqli": MaxArityArgs()}
+        self.error_counter = 0
+        # Highest state id and call sites with test cases seen in the logs
+        self.max_state = 0
+        self.sinks = set()
+        # True if the last read() found test cases that were not seen before
+        self.changed = False
+        # Bytes of logs and records parsed so far
+        self.bytes_read = 0
+        # Seconds from the start of S2E until the guest started PHP, if logged
+        self.target_start = None
+        # Functions called on symbolic paths that the minimal loader left out
+        self.loader_misses = set()
+
+    def count(self) -> int:
+        return sum(args.seen for args in self.args.values())
+
+    def progress(self) -> tuple[int, int, int]:
+        """
+        Returns:
+            tuple[int, int, int]: Number of states, sinks with test cases and test cases found so far.
+        """
+        return self.max_state, len(self.sinks), self.count()
+
+    def read(self) -> dict | None:
+        """
+        Parse the records and log lines appended since the last call.
+        Returns:
+            dict: Dictionary containing sets of symbolic arguments for XSS and SQLi,
+            or None if there are too many fatal errors.
+        """
+        known = self.count()
+
+        for record_file in self.project_path.rglob(f"*{TEST_CASE_FILE_SUFFIX}"):
+            self.read_file(record_file, self.parse_record)
+
+        for log_file in self.project_path.rglob("stdout.txt"):
+            if not self.read_file(log_file, self.parse_line):
+                print("[-] Too many fatal errors, stopping analysis.")
+                return None
+
+        self.changed = self.count() != known
+
+        return {
+            "xss": list(self.args["xss"]),
+            "sqli": list(self.args["sqli"]),
+        }
+
+    def read_file(self, path: Path, parse) -> bool:
+        """
+        Parse the complete lines appended to a single file.
+        Args:
+            path (Path): Path to the log or record file.
+            parse (Callable[[bytes], bool]): Parser of a single line.
+        Returns:
+            bool: False if the parser asked to stop.
+        """
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return True
+
+        identity = (stat.st_dev, stat.st_ino)
+        previous_identity, offset = self.offsets.get(path, (None, 0))
+        # The file was replaced or truncated, start over
+        if previous_identity != identity or stat.st_size < offset:
+            offset = 0
+        if stat.st_size == offset:
+            self.offsets[path] = (identity, offset)
+            return True
+
+        with open(path, "rb") as f:
+            f.seek(offset)
+            for raw_line in f:
+                # Leave partially written lines for the next call
+                if not raw_line.endswith(b"\n"):
+                    break
+                offset += len(raw_line)
+                self.bytes_read += len(raw_line)
+                if not parse(raw_line):
+                    self.offsets[path] = (identity, offset)
+                    return False
+
+        self.offsets[path] = (identity, offset)
+        return True
+
+    def parse_record(self, raw_line: bytes) -> bool:
+        """
+        Collect the test case of a single record written by SinkTracker.
+        Args:
+            raw_line (bytes): JSON line of the record.
+        Returns:
+            bool: Always True.
+        """
+        test_case = parse_record(raw_line)
+        if test_case is not None and test_case.kind in self.args:
+            self.args[test_case.kind].add(test_case.args)
+        return True
+
+    def parse_line(self, raw_line: bytes) -> bool:
+        """
+        Count fatal errors and follow the progress of S2E in a single log line.
+        Args:
+            raw_line (bytes): Log line.
+        Returns:
+            bool: False if the number of fatal errors exceeds the threshold.
+        """
+        if FATAL_ERROR_MARKER in raw_line:
+            self.error_counter += 1
+
+            """
+            There may have some fatal error during symbolic execution.
+            The "possible" resason is that concurrent execution of S2E
+            may cause I/O errors. So, we only stop the analysis if the
+            number of fatal errors exceeds a threshold.
+            """
+            return self.error_counter < FATAL_ERROR_THRESHOLD
+
+        # S2E prefixes messages with the seconds since it started
+        if self.target_start is None and TARGET_START_MARKER in raw_line:
+            seconds = raw_line.split(b" ", 1)[0]
+            if seconds.isdigit():
+                self.target_start = int(seconds)
+
+        # S2E prefixes messages with "[State N]", state ids only grow as states fork
+        state_start = raw_line.find(b"[State ")
+        if state_start != -1:
+            state_end = raw_line.find(b"]", state_start)
+            state = raw_line[state_start + 7 : state_end]
+            if state.isdigit():
+                self.max_state = max(self.max_state, int(state))
+
+        miss_start = raw_line.find(MINIMAL_LOADER_MISS_MARKER)
+        if miss_start != -1:
+            function = raw_line[miss_start + len(MINIMAL_LOADER_MISS_MARKER) :].split(b"(", 1)[0]
+            self.loader_misses.add(function.decode(errors="ignore"))
+
+        sink_start = raw_line.find(b"] Test case at ")
+        if sink_start != -1:
+            self.sinks.add(raw_line[sink_start + 15 :].split(b" ", 1)[0])
+
+        return True
+
+
+def collect_sink_stats(project_path: Path, stats_path: Path) -> None:
+    """
+    Merge the sink stats dumped by every S2E process of the last run of a
+    project, summing the counters of each call site.
+    Args:
+        project_path (Path): Path to the S2E project directory.
+        stats_path (Path): Path of the merged stats.
+    """
+    stats_files = sorted((Path(project_path) / "s2e-last").rglob(SINK_STATS_FILE))
+    if not stats_files:
+        return
+
+    merged = {"constraints_added": 0, "invalid_constraints": 0, "call_sites": [], "states": []}
+    call_sites = {}
+    for stats_file in stats_files:
+        try:
+            with open(stats_file) as f:
+                stats = json.load(f)
+        except (OSError, ValueError):
+            continue
+        merged["constraints_added"] += stats.get("constraints_added", 0)
+        merged["invalid_constraints"] += stats.get("invalid_constraints", 0)
+        for call_site in stats.get("call_sites", []):
+            key = (call_site["sink"], call_site["pc"])
+            total = call_sites.setdefault(key, {"sink": key[0], "pc": key[1]})
+            for name, value in call_site.items():
+                if name in total and name.startswith("max_"):
+                    total[name] = max(total[name], value)
+                elif name not in ("sink", "pc"):
+                    total[name] = total.get(name, 0) + value
+        merged["states"].extend(stats.get("states", []))
+
+    merged["call_sites"] = sorted(
+        call_sites.values(), key=lambda call_site: call_site.get("solver_us", 0), reverse=True
+    )
+    tmp_path = stats_path.with_name(stats_path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(merged, f)
+    os.replace(tmp_path, stats_path)
 
 
 def extract_symbolic_args(project_path: str) -> dict | None:
@@ -420,105 +1397,267 @@ def extract_symbolic_args(project_path: str) -> dict | None:
     Returns:
         dict: Dictionary containing sets of symbolic arguments for XSS and SQLi.
     """
-    xss_args = set()
-    sqli_args = set()
-    in_error = False
-    error_counter = 0
-
-    for log_file in Path(project_path).rglob("stdout.txt"):
-        with open(log_file, "r", errors="ignore") as f:
-            for line in f:
-                if "Fatal error" in line:
-                    error_counter += 1
-                    in_error = True
-
-                    """
-                    There may have some fatal error during symbolic execution.
-                    The "possible" resason is that concurrent execution of S2E
-                    may cause I/O errors. So, we only stop the analysis if the
-                    number of fatal errors exceeds a threshold.
-                    """
-                    if error_counter >= FATAL_ERROR_THRESHOLD:
-                        print("[-] Too many fatal errors, stopping analysis.")
-                        return None
-
-                    continue
-
-                xss_matches = re.findall(
-                    r"v\d+_arg\d+_\d+(?:\(exploitable\))? = {[^}]*}; \(string\) \"([^)]*)\"",
-                    line,
-                )
-                if xss_matches and "EchoFunctionTracker: Test case:" in line:
-                    exploitable_indexes = re.findall(
-                        r"v(\d+)_arg\d+_\d+(?:\(exploitable\))", line
-                    )
-                    for index in exploitable_indexes:
-                        if int(index) < len(xss_matches):
-                            xss_matches[int(index)] = XSS_PAYLOAD_MARKER
-                    xss_args.add(tuple(xss_matches))
-                    continue
-
-                sqli_matches = re.findall(
-                    r"v\d+_arg\d+_\d+ = {[^}]*}; \(string\) \"([^)]*)\"", line
-                )
-                if sqli_matches and "SqliteFunctionTracker: Test case:" in line:
-                    sqli_args.add(tuple(sqli_matches))
-                    continue
+    return SymbolicArgsReader(project_path).read()
 
-    xss_args = remove_incomplete_args(xss_args)
-    sqli_args = remove_incomplete_args(sqli_args)
 
-    return {
-        "xss": xss_args,
-        "sqli": sqli_args,
+def get_file_hash(path: str) -> str:
+    """
+    Get the SHA-256 of a file, memoized by path, size and modification time.
+    Args:
+        path (str): Path to the file.
+    Returns:
+        str: Hex digest of the file content.
+    """
+    stat = os.stat(path)
+    key = (str(path), stat.st_size, stat.st_mtime_ns)
+    if key not in FILE_HASHES:
+        with open(path, "rb") as f:
+            FILE_HASHES[key] = hashlib.sha256(f.read()).hexdigest()
+    return FILE_HASHES[key]
+
+
+def load_verdict_cache() -> None:
+    """
+    Load the dynamic checker verdicts saved by a previous run, if any.
+    """
+    if not VERDICT_CACHE_PATH or not Path(VERDICT_CACHE_PATH).exists():
+        return
+
+    try:
+        with open(VERDICT_CACHE_PATH) as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[-] Ignoring unreadable verdict cache {VERDICT_CACHE_PATH}: {e}")
+        return
+
+    if data.get("version") != VERDICT_CACHE_VERSION:
+        print(f"[-] Ignoring verdict cache {VERDICT_CACHE_PATH} from another version.")
+        return
+
+    for verdict in data.get("verdicts", []):
+        key = (verdict["checker"], verdict["harness"], verdict["inputs"], tuple(verdict["args"]))
+        VERDICT_CACHE[key] = verdict["output"]
+    print(f"[+] Loaded {len(VERDICT_CACHE)} cached verdicts from {VERDICT_CACHE_PATH}")
+
+
+def save_verdict_cache() -> None:
+    """
+    Save the dynamic checker verdicts to disk if --verdict-cache is given and
+    new verdicts were added. Must be called with VERDICT_CACHE_LOCK held.
+    """
+    global VERDICT_CACHE_DIRTY
+
+    if not VERDICT_CACHE_PATH or not VERDICT_CACHE_DIRTY:
+        return
+
+    data = {
+        "version": VERDICT_CACHE_VERSION,
+        "verdicts": [
+            {"checker": checker, "harness": harness, "inputs": inputs, "args": list(args), "output": output}
+            for (checker, harness, inputs, args), output in VERDICT_CACHE.items()
+        ],
     }
+    tmp_path = f"{VERDICT_CACHE_PATH}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, VERDICT_CACHE_PATH)
+    VERDICT_CACHE_DIRTY = False
+
+
+def drain_output(stream) -> None:
+    """
+    Read and discard a stream until it is closed.
+    """
+    for _ in stream:
+        pass
+
 
+def start_harness_worker() -> None:
+    """
+    Start the persistent harness worker used by the dynamic checkers.
+    Checkers fall back to a fresh PHP process per run if the worker can't start.
+    """
+    global HARNESS_WORKER_PROC, HARNESS_WORKER_SOCKET
+
+    socket_path = os.path.join(tempfile.gettempdir(), f"symwp-worker-{os.getpid()}.sock")
+    loader = "./WordPress/wp-load.php" if USE_WP_LOADER else "concrete-wordpress-loader.php"
+
+    print(f"[+] Starting harness worker on {socket_path}...")
+    proc = subprocess.Popen(
+        [PHP_EXECUTABLE, HARNESS_WORKER, socket_path, loader],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    # The worker prints a single line once WordPress is loaded and it is listening
+    line = proc.stdout.readline()
+    if "listening" not in line:
+        print(f"[-] Harness worker failed to start: {line.strip()}")
+        proc.kill()
+        proc.wait()
+        return
 
-def run_dynamic_checker(harness_path: str, symbolic_args: dict) -> str:
+    # Forked children inherit the pipe and would block once it is full, so keep draining it
+    threading.Thread(target=drain_output, args=(proc.stdout,), daemon=True).start()
+
+    HARNESS_WORKER_PROC = proc
+    HARNESS_WORKER_SOCKET = socket_path
+
+
+def stop_harness_worker() -> None:
+    """
+    Stop the persistent harness worker if it is running.
+    """
+    global HARNESS_WORKER_PROC, HARNESS_WORKER_SOCKET
+
+    if HARNESS_WORKER_PROC is None:
+        return
+
+    HARNESS_WORKER_PROC.terminate()
+    HARNESS_WORKER_PROC.wait()
+    if Path(HARNESS_WORKER_SOCKET).exists():
+        os.unlink(HARNESS_WORKER_SOCKET)
+    HARNESS_WORKER_PROC = None
+    HARNESS_WORKER_SOCKET = ""
+
+
+def get_checker_inputs_hash(plugin_name: str) -> str:
+    """
+    Get the hash of everything besides the harness and the test case that a
+    dynamic checker verdict depends on: the plugin, WordPress, PHP, the concrete
+    loaders, the checkers and the harness worker. Computed once per plugin.
+    Must be called with ASSETS_LOCK held.
+    Args:
+        plugin_name (str): Name of the plugin.
+    Returns:
+        str: Hex digest of the checker inputs.
+    """
+    if plugin_name in CHECKER_INPUTS_HASHES:
+        return CHECKER_INPUTS_HASHES[plugin_name]
+
+    files = [PHP_EXECUTABLE, XSS_CHECKER, SQLI_CHECKER, HARNESS_WORKER]
+    if not USE_WP_LOADER:
+        files += [BASE_LOADER, "concrete-wordpress-loader.php"]
+
+    inputs = {
+        "plugin": get_tree_hash(plugin_name),
+        "wordpress": get_tree_hash("WordPress"),
+        "files": {path: get_file_hash(path) if Path(path).exists() else "" for path in files},
+        "use_wp_loader": USE_WP_LOADER,
+    }
+    digest = hashlib.sha256(json.dumps(inputs, sort_keys=True).encode())
+    CHECKER_INPUTS_HASHES[plugin_name] = digest.hexdigest()
+    return CHECKER_INPUTS_HASHES[plugin_name]
+
+
+def run_checker(
+    checker: str, harness_path: str, inputs_hash: str, arg: tuple, span: dict | None = None
+) -> str | None:
+    """
+    Run a dynamic checker on a single test case, reusing the cached verdict if any.
+    Args:
+        checker (str): Path to the checker script.
+        harness_path (str): Path to the harness file.
+        inputs_hash (str): Hash of the checker inputs, see get_checker_inputs_hash.
+        arg (tuple): Symbolic arguments of the test case.
+        span (dict | None): Span to record the resources of the checker into.
+    Returns:
+        str | None: Output of the checker, or None if it failed to run.
+    """
+    key = (Path(checker).name, get_file_hash(harness_path), inputs_hash, tuple(arg))
+    with VERDICT_CACHE_LOCK:
+        if key in VERDICT_CACHE:
+            return VERDICT_CACHE[key]
+
+    # Every job writes its outputs into its own directory so concurrent runs don't collide,
+    # only the verdict on stdout is kept
+    digest = hashlib.sha1(repr(tuple(arg)).encode()).hexdigest()[:12]
+    output_dir = Path(f".{Path(checker).stem}_output") / Path(harness_path).name / digest
+    os.makedirs(output_dir, exist_ok=True)
+    env = dict(os.environ, **{ENV_CHECKER_OUTPUT_DIR: str(output_dir)})
+    if HARNESS_WORKER_SOCKET:
+        env[ENV_HARNESS_WORKER] = HARNESS_WORKER_SOCKET
+
+    try:
+        with subprocess.Popen(
+            [PHP_EXECUTABLE, checker, harness_path, *arg],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            env=env,
+        ) as proc:
+            output = proc.stdout.read()
+            add_child_usage(span, wait_process(proc))
+    except (subprocess.SubprocessError, OSError):
+        return None
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+    if proc.returncode != 0:
+        return None
+
+    global VERDICT_CACHE_DIRTY
+    with VERDICT_CACHE_LOCK:
+        VERDICT_CACHE[key] = output
+        VERDICT_CACHE_DIRTY = True
+
+    return output
+
+
+def run_dynamic_checker(harness_path: str, symbolic_args: dict, span: dict | None = None) -> str:
     """
     Run dynamic analysis on the harness using symbolic arguments.
+    Test cases already checked during this run are not replayed again, and the
+    others run concurrently on the checker pool (see --checker-jobs). Results are
+    reported in sorted order so the report stays stable.
     Args:
         harness_path (str): Path to the harness file.
         symbolic_args (dict): Dictionary containing sets of symbolic arguments for XSS and SQLi.
+        span (dict | None): Span to record the resources of the checkers into.
     Returns:
         str: Result of the dynamic analysis.
     """
     print(
         f"[+] Running dynamic analysis on {Path(harness_path).name} with symbolic args: {symbolic_args}"
     )
+    xss_args = sorted(symbolic_args.get("xss", []))
+    sqli_args = sorted(symbolic_args.get("sqli", []))
+
+    # Harnesses are generated into <plugin>/.harness/concrete
+    plugin_name = str(Path(harness_path).parent.parent.parent)
+    with ASSETS_LOCK:
+        inputs_hash = get_checker_inputs_hash(plugin_name)
+
+    global CHECKER_POOL
+    with VERDICT_CACHE_LOCK:
+        if CHECKER_POOL is None:
+            CHECKER_POOL = ThreadPoolExecutor(max_workers=CHECKER_JOBS)
+    xss_outputs = CHECKER_POOL.map(
+        lambda arg: run_checker(XSS_CHECKER, harness_path, inputs_hash, arg, span), xss_args
+    )
+    sqli_outputs = CHECKER_POOL.map(
+        lambda arg: run_checker(SQLI_CHECKER, harness_path, inputs_hash, arg, span), sqli_args
+    )
+
     result = ""
-    if "xss" in symbolic_args and len(symbolic_args["xss"]) > 0:
+    if len(xss_args) > 0:
         result = "[+] XSSChecker:\n"
-        for arg in symbolic_args["xss"]:
+        for arg, output in zip(xss_args, xss_outputs):
             result += f"[*] Testing {arg}\n"
-            try:
-                result += subprocess.run(
-                    [PHP_EXECUTABLE, XSS_CHECKER, harness_path, *arg],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                ).stdout
-            except:
-                result += "Error running XSS_CHECKER\n"
+            result += output if output is not None else "Error running XSS_CHECKER\n"
     else:
         result += "[-] No XSS arguments found.\n"
 
-    if "sqli" in symbolic_args and len(symbolic_args["sqli"]) > 0:
+    if len(sqli_args) > 0:
         result += "[+] SQLiChecker:\n"
-        for arg in symbolic_args["sqli"]:
+        for arg, output in zip(sqli_args, sqli_outputs):
             result += f"[*] Testing {arg}\n"
-            try:
-                result += subprocess.run(
-                    [PHP_EXECUTABLE, SQLI_CHECKER, harness_path, *arg],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                ).stdout
-            except:
-                result += "Error running SQLiChecker\n"
+            result += output if output is not None else "Error running SQLiChecker\n"
     else:
         result += "[-] No SQLi arguments found.\n"
 
+    # Saved once per harness rather than per verdict, the whole cache is rewritten
+    with VERDICT_CACHE_LOCK:
+        save_verdict_cache()
+
     return result
 
 
@@ -545,18 +1684,20 @@ def has_vulnerability(dynamic_result: str) -> bool:
 
 
 def check_for_vulnerabilities_during_execution(
-    project_path: str, harness_path: str
+    reader: SymbolicArgsReader, symbolic_args: dict, harness_path: str, span: dict | None = None
 ) -> bool:
     """
     Check for vulnerabilities during S2E execution by monitoring logs.
     Args:
-        project_path (str): Path to the S2E project directory.
+        reader (SymbolicArgsReader): Incremental reader of the S2E project logs.
+        symbolic_args (dict): Symbolic arguments returned by the last reader.read().
         harness_path (str): Path to the harness file.
+        span (dict | None): Span to record the resources of the checkers into.
     Returns:
         bool: True if vulnerabilities are found, False otherwise.
     """
-    symbolic_args = extract_symbolic_args(project_path)
-    if symbolic_args is None:
+    # Nothing new since the last check
+    if not reader.changed:
         return False
 
     # Check if we have any test cases
@@ -568,7 +1709,7 @@ def check_for_vulnerabilities_during_execution(
     if not Path(concrete_harness_path).exists():
         return False
 
-    dynamic_result = run_dynamic_checker(concrete_harness_path, symbolic_args)
+    dynamic_result = run_dynamic_checker(concrete_harness_path, symbolic_args, span)
 
     # Check if actual vulnerabilities were found
     if has_vulnerability(dynamic_result):
@@ -579,38 +1720,356 @@ def check_for_vulnerabilities_during_execution(
     return False
 
 
-def main():
-    global INCLUDE
+def get_run_settings_hash(plugin_name: str) -> str:
+    """
+    Get the hash of everything besides the harnesses that changes the results of
+    a harness: the plugin, WordPress, PHP and the loaders, the tracker build, the
+    checkers and the options changing exploration. Computed once per plugin.
+    Must be called with ASSETS_LOCK held.
+    Args:
+        plugin_name (str): Name of the plugin.
+    Returns:
+        str: Hex digest of the inputs and settings.
+    """
+    if plugin_name in RUN_SETTINGS_HASHES:
+        return RUN_SETTINGS_HASHES[plugin_name]
 
-    parse_args()
+    files = [
+        PHP_EXECUTABLE,
+        S2E_BOOTSTRAP_TEMPLATE_PATH,
+        XSS_CHECKER,
+        SQLI_CHECKER,
+        HARNESS_WORKER,
+        *sorted(str(path) for path in Path(".").glob(S2E_LIBS2E_GLOB)),
+    ]
+    if not USE_WP_LOADER:
+        files += [
+            BASE_LOADER,
+            "symbolic-wordpress-loader.php",
+            "concrete-wordpress-loader.php",
+        ]
+    if USE_MINIMAL_LOADER:
+        # Minimal loaders are traced from the concrete harness and the base loader
+        files.append(LOADER_TRACER)
+    if USE_OPCACHE:
+        files.append(OPCACHE_EXTENSION)
+
+    inputs = {
+        "plugin": get_tree_hash(plugin_name),
+        "wordpress": get_tree_hash("WordPress"),
+        "files": {path: get_file_hash(path) if Path(path).exists() else "" for path in files},
+    }
+    settings = {
+        "timeout": TIMEOUT_MINUTES,
+        "argv_length": ARGV_LENGTH,
+        "stop_if_found": STOP_IF_FOUND,
+        "check_interval": CHECK_INTERVAL_SECONDS if STOP_IF_FOUND else None,
+        "cores_per_project": CORES_PER_PROJECT,
+        "adaptive_budget": ADAPTIVE_BUDGET,
+        "plateau_window": PLATEAU_MINUTES if ADAPTIVE_BUDGET else None,
+        "use_wp_loader": USE_WP_LOADER,
+        "minimal_loader": USE_MINIMAL_LOADER,
+        "guest_snapshot": USE_GUEST_SNAPSHOT,
+        "opcache": OPCACHE_INI if USE_OPCACHE else None,
+        "max_test_cases_per_call_site": MAX_TEST_CASES_PER_CALL_SITE,
+        "on_exploitable": ON_EXPLOITABLE,
+        "sinks": SINKS,
+    }
+    digest = hashlib.sha256(json.dumps([inputs, settings], sort_keys=True).encode())
+    RUN_SETTINGS_HASHES[plugin_name] = digest.hexdigest()
+    return RUN_SETTINGS_HASHES[plugin_name]
 
-    if not is_all_dependencies_present():
+
+def get_harness_hash(plugin_name: str, harness_path: str, concrete_harness_path: str) -> str:
+    """
+    Get the hash of the symbolic and concrete harness pair and everything they run with.
+    Args:
+        plugin_name (str): Name of the plugin.
+        harness_path (str): Path to the symbolic harness file.
+        concrete_harness_path (str): Path to the concrete harness file.
+    Returns:
+        str: Hex digest of both harnesses, the analysis inputs and settings.
+    """
+    digest = hashlib.sha256(get_file_hash(harness_path).encode())
+    if Path(concrete_harness_path).exists():
+        digest.update(get_file_hash(concrete_harness_path).encode())
+    with ASSETS_LOCK:
+        digest.update(get_run_settings_hash(plugin_name).encode())
+    return digest.hexdigest()
+
+
+def get_run_manifest(output_dir: str) -> dict:
+    """
+    Get the run manifest of an output directory, loading it on first use.
+    Must be called with RUN_MANIFESTS_LOCK held.
+    Args:
+        output_dir (str): Directory the results are written into.
+    Returns:
+        dict: Harness file name -> manifest entry with its status, hashes and results.
+    """
+    if output_dir not in RUN_MANIFESTS:
+        harnesses = {}
+        try:
+            with open(Path(output_dir) / RUN_MANIFEST_FILE) as f:
+                manifest = json.load(f)
+            if manifest.get("version") == RUN_MANIFEST_VERSION:
+                harnesses = manifest.get("harnesses", {})
+        except (OSError, ValueError):
+            pass
+        RUN_MANIFESTS[output_dir] = harnesses
+    return RUN_MANIFESTS[output_dir]
+
+
+def get_harness_entry(output_dir: str, harness_name: str) -> dict:
+    with RUN_MANIFESTS_LOCK:
+        return dict(get_run_manifest(output_dir).get(harness_name, {}))
+
+
+def update_harness_entry(output_dir: str, harness_name: str, **fields) -> None:
+    """
+    Update the manifest entry of a harness and write the manifest to disk.
+    Args:
+        output_dir (str): Directory the results are written into.
+        harness_name (str): File name of the symbolic harness.
+        **fields: Entry fields to set, e.g. status, hash or results.
+    """
+    with RUN_MANIFESTS_LOCK:
+        harnesses = get_run_manifest(output_dir)
+        entry = harnesses.setdefault(harness_name, {})
+        entry.update(fields)
+        entry["updated"] = time.time()
+
+        path = Path(output_dir) / RUN_MANIFEST_FILE
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {"version": RUN_MANIFEST_VERSION, "run": RUN_INFO, "harnesses": harnesses},
+                f,
+                indent=2,
+            )
+        os.replace(tmp_path, path)
+
+
+def is_harness_completed(output_dir: str, harness_name: str, harness_hash: str) -> bool:
+    entry = get_harness_entry(output_dir, harness_name)
+    return entry.get("status") == "completed" and entry.get("hash") == harness_hash
+
+
+def get_recorded_time_to_bug(output_dir: str) -> float | None:
+    """
+    Get the time-to-bug recorded in the run manifest, if a harness stopped the run early.
+    Args:
+        output_dir (str): Directory the results are written into.
+    Returns:
+        float | None: Time-to-bug in seconds, or None if no harness stopped early.
+    """
+    with RUN_MANIFESTS_LOCK:
+        for entry in get_run_manifest(output_dir).values():
+            if entry.get("status") == "completed" and "time_to_bug" in entry.get("results", {}):
+                return entry["results"]["time_to_bug"]
+    return None
+
+
+def analyze_harness(
+    plugin_name: str, harness: Path, iteration: int, output_dir: str
+) -> bool:
+    """
+    Run the whole symbolic & dynamic analysis for a single harness.
+    Args:
+        plugin_name (str): Name of the plugin.
+        harness (Path): Path to the symbolic harness file.
+        iteration (int): Current iteration number.
+        output_dir (str): Directory to write the results into.
+    Returns:
+        bool: True if this harness found the first confirmed bug of the iteration.
+    """
+    if STOP_EVENT.is_set():
+        return False
+
+    harness_path = str(harness)
+    concrete_harness_path = harness_path.replace("/symbolic/", "/concrete/")
+    project_name = f"{plugin_name}_{harness.stem}"
+    if ITERATIONS > 1:
+        project_name = f"{plugin_name}_{harness.stem}_iter{iteration}"
+    argv_count = get_argv_count(harness_path)
+
+    if INCLUDE and INCLUDE not in harness_path:
+        print(f'[-] Skipping {harness_path} as it does not match the include "{INCLUDE}".')
+        return False
+
+    if argv_count == 0:
+        print(f"[-] No symbolic arguments found in {harness_path}. Skipping.")
+        return False
+
+    harness_hash = get_harness_hash(plugin_name, harness_path, concrete_harness_path)
+    if (RESUME or SKIP_UNCHANGED) and is_harness_completed(output_dir, harness.name, harness_hash):
+        print(f"[+] Skipping {harness_path} as it is unchanged since its last completed run.")
+        return False
+    print(f"[+] Harness: {harness_path}, Symbolic argv count: {argv_count}")
+
+    update_harness_entry(
+        output_dir,
+        harness.name,
+        status="running",
+        hash=harness_hash,
+        inputs={
+            "symbolic": get_file_hash(harness_path),
+            "concrete": get_file_hash(concrete_harness_path)
+            if Path(concrete_harness_path).exists()
+            else "",
+        },
+        project=project_name,
+        results={},
+        durations={},
+    )
+
+    spans = SpanLog(
+        Path(output_dir) / f"{harness.name}{SPAN_FILE_SUFFIX}",
+        harness=harness.name,
+        iteration=iteration,
+        project=project_name,
+    )
+    reader = None
+    try:
+        while True:
+            setup_s2e_project(plugin_name, harness_path, argv_count, project_name, spans)
+            project_path = Path(S2E_PROJECTS_DIR) / project_name
+            # new_project -f drops the outputs of a run with the minimal loader, not its test cases
+            reader = SymbolicArgsReader(project_path, reader.args if reader else None)
+            with spans.span("s2e") as s2e_span:
+                early_stopped, time_to_bug = run_s2e(
+                    project_name, project_path, harness_path, reader, s2e_span
+                )
+                # Parsed while S2E runs, for --stop-if-found, --adaptive-budget and --minimal-loader
+                s2e_span["log_bytes"] = reader.bytes_read
+            if not reader.loader_misses or early_stopped or STOP_EVENT.is_set():
+                break
+            # The full loader never misses a function, so this runs again at most once
+            use_full_loader(harness_path, reader.loader_misses)
+        collect_sink_stats(project_path, Path(output_dir) / f"{harness.name}{SINK_STATS_SUFFIX}")
+    except Exception:
+        update_harness_entry(
+            output_dir, harness.name, status="failed", durations=dict(spans.durations)
+        )
+        raise
+
+    # Save time-to-bug information if early stopping occurred
+    if early_stopped and STOP_IF_FOUND:
         print(
-            "[-] Some dependencies are missing. Please check the required scripts and PHP executable."
+            "[!] Early stopping enabled and vulnerability found. Stopping analysis of remaining harnesses."
         )
-        sys.exit(1)
+        with open(f"{output_dir}/{Path(harness_path).name}.time_to_bug", "w") as f:
+            f.write(
+                f"Time-to-bug: {time_to_bug:.2f} seconds ({time_to_bug/60:.2f} minutes)\n"
+            )
+            f.write(f"Harness: {harness_path}\n")
+            f.write(f"Project: {project_name}\n")
+            f.write(f"Iteration: {iteration}\n")
+        spans.split_s2e(s2e_span, reader.target_start)
+        update_harness_entry(
+            output_dir,
+            harness.name,
+            status="completed",
+            results={"time_to_bug": time_to_bug},
+            durations=dict(spans.durations),
+        )
+        return True
 
-    plugin_folder = sys.argv[1]
-    plugin_folder_path = Path(plugin_folder)
-    plugin_name = plugin_folder_path.name
-    harness_dir = plugin_folder_path / HARNESS_DIR
+    # Cancelled because a sibling harness found a bug first
+    if STOP_EVENT.is_set():
+        spans.split_s2e(s2e_span, reader.target_start)
+        update_harness_entry(
+            output_dir, harness.name, status="pending", durations=dict(spans.durations)
+        )
+        return False
 
-    if not plugin_folder_path.exists():
-        print(f"[-] Plugin folder {plugin_folder} does not exist.")
-        sys.exit(1)
+    with spans.span("parse") as parse_span:
+        bytes_read = reader.bytes_read
+        symbolic_args = reader.read()
+        parse_span["log_bytes"] = reader.bytes_read - bytes_read
+    spans.split_s2e(s2e_span, reader.target_start)
+    if symbolic_args is None:
+        update_harness_entry(
+            output_dir, harness.name, status="failed", durations=dict(spans.durations)
+        )
+        return False
 
-    generate_harnesses(plugin_folder)
+    with spans.span("checker") as checker_span:
+        checker_span["test_cases"] = len(symbolic_args["xss"]) + len(symbolic_args["sqli"])
+        result = run_dynamic_checker(concrete_harness_path, symbolic_args, checker_span)
+    with open(f"{output_dir}/{Path(harness_path).name}.args", "w") as f:
+        f.write("XSS: ")
+        f.write(", ".join(str(arg) for arg in symbolic_args["xss"]))
+        f.write("\nSQLi: ")
+        f.write(", ".join(str(arg) for arg in symbolic_args["sqli"]))
+    with open(f"{output_dir}/{Path(harness_path).name}.dynamic", "w") as f:
+        f.write(result)
+    update_harness_entry(
+        output_dir,
+        harness.name,
+        status="completed",
+        results={
+            "xss_args": len(symbolic_args["xss"]),
+            "sqli_args": len(symbolic_args["sqli"]),
+            "vulnerable": has_vulnerability(result),
+        },
+        durations=dict(spans.durations),
+    )
 
-    if not harness_dir.exists():
-        os.makedirs(harness_dir)
+    print(result)
+    return False
 
-    if not Path(OUTPUT_DIR).exists():
-        os.makedirs(OUTPUT_DIR)
 
-    harnesses = list((harness_dir).rglob("*.php"))
-    print(f"[+] {len(harnesses)} harnesses generated in {harness_dir}")
+def run_harnesses(
+    plugin_name: str, harnesses: list[Path], iteration: int, output_dir: str
+) -> bool:
+    """
+    Analyze harnesses concurrently, splitting the --core budget across S2E projects.
+    Args:
+        plugin_name (str): Name of the plugin.
+        harnesses (list[Path]): Symbolic harnesses to analyze, in scheduling order.
+        iteration (int): Current iteration number.
+        output_dir (str): Directory to write the results into.
+    Returns:
+        bool: True if the iteration stopped early due to a vulnerability found.
+    """
+    global TIME_BANK_SECONDS
+
+    STOP_EVENT.clear()
+    # Time saved in an earlier iteration would make the iterations incomparable
+    with TIME_BANK_LOCK:
+        TIME_BANK_SECONDS = 0.0
+    print(
+        f"[+] Running up to {MAX_CONCURRENCY} S2E project(s) at once with {CORES_PER_PROJECT} core(s) each."
+    )
 
-    # Run analysis for specified number of iterations
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENCY) as executor:
+        futures = [
+            executor.submit(analyze_harness, plugin_name, harness, iteration, output_dir)
+            for harness in harnesses
+        ]
+        try:
+            stopped_early = False
+            for future in futures:
+                stopped_early = future.result() or stopped_early
+        except BaseException as e:
+            if isinstance(e, KeyboardInterrupt):
+                print("[-] User interrupted the process, cancelling running harnesses.")
+            STOP_EVENT.set()
+            for future in futures:
+                future.cancel()
+            raise
+
+    return stopped_early
+
+
+def run_iterations(plugin_name: str, harnesses: list[Path]) -> None:
+    """
+    Run the analysis of all harnesses for the configured number of iterations.
+    Args:
+        plugin_name (str): Name of the plugin.
+        harnesses (list[Path]): Symbolic harnesses to analyze.
+    """
     for iteration in range(1, ITERATIONS + 1):
         print(f"\n[+] ======= ITERATION {iteration}/{ITERATIONS} =======")
 
@@ -621,66 +2080,20 @@ def main():
             if not Path(current_output_dir).exists():
                 os.makedirs(current_output_dir)
 
-        iteration_stopped_early = False
-
-        for harness in harnesses:
-            harness_path = str(harness)
-            concrete_harness_path = harness_path.replace("/symbolic/", "/concrete/")
-            project_name = f"{plugin_name}_{harness.stem}"
-            if ITERATIONS > 1:
-                project_name = f"{plugin_name}_{harness.stem}_iter{iteration}"
-            argv_count = get_argv_count(harness_path)
-
-            if INCLUDE and INCLUDE not in harness_path:
+        if RESUME and STOP_IF_FOUND:
+            time_to_bug = get_recorded_time_to_bug(current_output_dir)
+            if time_to_bug is not None:
                 print(
-                    f'[-] Skipping {harness_path} as it does not match the include "{INCLUDE}".'
+                    f"[+] Iteration {iteration} already stopped early after {time_to_bug:.2f} seconds, skipping."
                 )
                 continue
 
-            if argv_count == 0:
-                print(f"[-] No symbolic arguments found in {harness_path}. Skipping.")
-                continue
-            print(f"[+] Harness: {harness_path}, Symbolic argv count: {argv_count}")
-
-            setup_s2e_project(plugin_name, harness_path, argv_count, project_name)
-            project_path = Path(S2E_PROJECTS_DIR) / project_name
-            early_stopped, time_to_bug = run_s2e(
-                project_name, project_path, harness_path
+        try:
+            iteration_stopped_early = run_harnesses(
+                plugin_name, harnesses, iteration, current_output_dir
             )
-
-            # Save time-to-bug information if early stopping occurred
-            if early_stopped and STOP_IF_FOUND:
-                print(
-                    "[!] Early stopping enabled and vulnerability found. Stopping analysis of remaining harnesses."
-                )
-                with open(
-                    f"{current_output_dir}/{Path(harness_path).name}.time_to_bug", "w"
-                ) as f:
-                    f.write(
-                        f"Time-to-bug: {time_to_bug:.2f} seconds ({time_to_bug/60:.2f} minutes)\n"
-                    )
-                    f.write(f"Harness: {harness_path}\n")
-                    f.write(f"Project: {project_name}\n")
-                    f.write(f"Iteration: {iteration}\n")
-                iteration_stopped_early = True
-                break
-
-            symbolic_args = extract_symbolic_args(project_path)
-            if symbolic_args is None:
-                break
-
-            result = run_dynamic_checker(concrete_harness_path, symbolic_args)
-            with open(f"{current_output_dir}/{Path(harness_path).name}.args", "w") as f:
-                f.write("XSS: ")
-                f.write(", ".join(str(arg) for arg in symbolic_args["xss"]))
-                f.write("\nSQLi: ")
-                f.write(", ".join(str(arg) for arg in symbolic_args["sqli"]))
-            with open(
-                f"{current_output_dir}/{Path(harness_path).name}.dynamic", "w"
-            ) as f:
-                f.write(result)
-
-            print(result)
+        except KeyboardInterrupt:
+            sys.exit(1)
 
         if iteration_stopped_early:
             print(
@@ -692,5 +2105,50 @@ def main():
     print(f"\n[+] All {ITERATIONS} iteration(s) completed.")
 
 
+def main():
+    parse_args()
+
+    if not is_all_dependencies_present():
+        print(
+            "[-] Some dependencies are missing. Please check the required scripts and PHP executable."
+        )
+        sys.exit(1)
+
+    plugin_folder = PLUGIN_FOLDER
+    plugin_folder_path = Path(plugin_folder)
+    plugin_name = plugin_folder_path.name
+    harness_dir = plugin_folder_path / HARNESS_DIR
+
+    if not plugin_folder_path.exists():
+        print(f"[-] Plugin folder {plugin_folder} does not exist.")
+        sys.exit(1)
+
+    if not Path(OUTPUT_DIR).exists():
+        os.makedirs(OUTPUT_DIR)
+
+    run_spans = SpanLog(Path(OUTPUT_DIR) / RUN_SPAN_FILE, plugin=plugin_name)
+    with run_spans.span("generate"):
+        generate_harnesses(plugin_folder)
+
+    if not harness_dir.exists():
+        os.makedirs(harness_dir)
+
+    load_verdict_cache()
+
+    harnesses = prioritize_harnesses(list((harness_dir).rglob("*.php")))
+    print(f"[+] {len(harnesses)} harnesses generated in {harness_dir}")
+    RUN_INFO.update(harnesses=len(harnesses), durations=run_spans.durations)
+
+    if USE_HARNESS_WORKER:
+        start_harness_worker()
+
+    try:
+        run_iterations(plugin_name, harnesses)
+    finally:
+        stop_harness_worker()
+        if CHECKER_POOL is not None:
+            CHECKER_POOL.shutdown(cancel_futures=True)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+
+import sys
+import json
+import argparse
+
+from pathlib import Path
+
+# Written by pipeline_runner.py next to the .args/.dynamic outputs
+SPAN_FILE_SUFFIX = ".spans.jsonl"
+SINK_STATS_SUFFIX = ".sinkstats.json"
+
+
+def iter_files(paths: list[str], suffix: str):
+    for path in paths:
+        path = Path(path)
+        if not path.exists():
+            print(f"[-] {path} does not exist.", file=sys.stderr)
+            continue
+        if path.is_file():
+            if path.name.endswith(suffix):
+                yield path
+        else:
+            yield from sorted(path.rglob(f"*{suffix}"))
+
+
+def iter_spans(paths: list[str]):
+    """
+    Yield the spans of output directories or single span files.
+    Args:
+        paths (list[str]): Output directories or span files.
+    Yields:
+        dict: Every span that could be parsed.
+    """
+    for span_file in iter_files(paths, SPAN_FILE_SUFFIX):
+        with open(span_file) as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+
+def add_span(totals: dict, key: str, span: dict) -> None:
+    total = totals.setdefault(
+        key,
+        {
+            "spans": 0,
+            "duration": 0.0,
+            "max": 0.0,
+            "thread_cpu": 0.0,
+            "children_cpu": 0.0,
+            "children_max_rss_kb": 0,
+            "log_bytes": 0,
+        },
+    )
+    total["spans"] += 1
+    total["duration"] += span.get("duration", 0.0)
+    total["max"] = max(total["max"], span.get("duration", 0.0))
+    total["thread_cpu"] += span.get("thread_cpu", 0.0)
+    total["children_cpu"] += span.get("children_cpu", 0.0)
+    total["children_max_rss_kb"] = max(total["children_max_rss_kb"], span.get("children_max_rss_kb", 0))
+    total["log_bytes"] += span.get("log_bytes", 0)
+
+
+def summarize_spans(spans) -> dict:
+    """
+    Sum the spans per phase, per iteration and per harness. Phases measured
+    within another one (e.g. the guest bootstrap within S2E) are summed per
+    phase only, so they don't count twice.
+    Args:
+        spans (Iterable[dict]): Spans written by pipeline_runner.py.
+    Returns:
+        dict: Totals per phase, iteration and harness, and the total of all phases.
+    """
+    summary = {"total": 0.0, "phases": {}, "iterations": {}, "harnesses": {}}
+    for span in spans:
+        add_span(summary["phases"], span["phase"], span)
+        if "within" in span:
+            continue
+        summary["total"] += span.get("duration", 0.0)
+        if "iteration" in span:
+            add_span(summary["iterations"], str(span["iteration"]), span)
+        if "harness" in span:
+            add_span(summary["harnesses"], span["harness"], span)
+    return summary
+
+
+def print_table(title: str, totals: dict, total: float, limit: int = 0) -> None:
+    rows = sorted(totals.items(), key=lambda item: item[1]["duration"], reverse=True)
+    if limit:
+        rows = rows[:limit]
+    print(
+        f"\n{title:<40} {'spans':>6} {'total s':>10} {'share':>7} {'max s':>9} "
+        f"{'thread cpu s':>13} {'cpu s':>9} {'max rss MiB':>12} {'log MiB':>9}"
+    )
+    for key, row in rows:
+        share = f"{row['duration'] / total:.1%}" if total else "-"
+        print(
+            f"{key[:40]:<40} {row['spans']:>6} {row['duration']:>10.1f} {share:>7} {row['max']:>9.1f} "
+            f"{row['thread_cpu']:>13.1f} {row['children_cpu']:>9.1f} {row['children_max_rss_kb'] / 2**10:>12.1f} "
+            f"{row['log_bytes'] / 2**20:>9.1f}"
+        )
+
+
+def print_sink_stats(paths: list[str], limit: int) -> None:
+    """
+    Show the sink call sites that spent the most solver time, and how many
+    test cases that time produced.
+    Args:
+        paths (list[str]): Output directories or sink stats files.
+        limit (int): Number of call sites to show.
+    """
+    rows = []
+    for stats_file in iter_files(paths, SINK_STATS_SUFFIX):
+        try:
+            with open(stats_file) as f:
+                stats = json.load(f)
+        except (OSError, ValueError):
+            continue
+        harness = stats_file.name[: -len(SINK_STATS_SUFFIX)]
+        if stats.get("invalid_constraints"):
+            print(f"[-] {harness}: {stats['invalid_constraints']} state(s) terminated by invalid constraints")
+        for call_site in stats.get("call_sites", []):
+            rows.append((harness, call_site))
+
+    rows.sort(key=lambda row: row[1].get("solver_us", 0), reverse=True)
+    print(
+        f"\n{'Harness':<40} {'sink':<24} {'pc':>10} {'hits':>7} {'symbolic':>9} "
+        f"{'solver s':>9} {'max ms':>8} {'skipped':>8} {'tests':>6}"
+    )
+    for harness, call_site in rows[:limit]:
+        print(
+            f"{harness[:40]:<40} {call_site['sink'][:24]:<24} {call_site['pc']:>10} {call_site.get('hits', 0):>7} "
+            f"{call_site.get('symbolic_hits', 0):>9} {call_site.get('solver_us', 0) / 1e6:>9.1f} "
+            f"{call_site.get('max_solver_us', 0) / 1e3:>8.1f} {call_site.get('skipped', 0):>8} "
+            f"{call_site.get('test_cases', 0):>6}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Show where campaign time goes, from the spans pipeline_runner.py writes per harness."
+    )
+    parser.add_argument("paths", nargs="+", help="Output directories (e.g. SymWP) or span files.")
+    parser.add_argument(
+        "--top", type=int, default=10, help="Number of harnesses to show, slowest first (default: 10)."
+    )
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON.")
+    parser.add_argument(
+        "--sinks",
+        action="store_true",
+        help="Show the sink call sites with the most solver time instead, from the SinkTracker stats.",
+    )
+    args = parser.parse_args()
+
+    if args.sinks:
+        print_sink_stats(args.paths, args.top)
+        return
+
+    summary = summarize_spans(iter_spans(args.paths))
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+
+    # Harnesses may run concurrently, so this is harness time rather than wall time
+    print(f"[+] {summary['total']:.1f} seconds spent in all phases")
+    print_table("Phase", summary["phases"], summary["total"])
+    if len(summary["iterations"]) > 1:
+        print_table("Iteration", summary["iterations"], summary["total"])
+    print_table("Harness", summary["harnesses"], summary["total"], args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+<?php declare(strict_types=1);
+use PHPUnit\Framework\TestCase;
+
+require_once __DIR__ . '/../harness_generator.php';
+
+class HarnessGeneratorTest extends TestCase
+{
+    private function definition(string $name, array $functionCalls, array $inputs = [], array $features = []): array
+    {
+        return [
+            'kind' => 'function',
+            'name' => $name,
+            'file' => 'plugin.php',
+            'params' => [],
+            'functionCalls' => $functionCalls,
+            'inputs' => $inputs,
+            'features' => $features,
+        ];
+    }
+
+    public function testStronglyConnectedComponentsAreCalleesFirst()
+    {
+        // 0 -> 1 -> 2 -> 1, 2 -> 3
+        $components = find_strongly_connected_components([0 => [1], 1 => [2], 2 => [1, 3], 3 => []]);
+
+        $this->assertCount(3, $components);
+        $this->assertEquals([3], $components[0]);
+        $this->assertEqualsCanonicalizing([1, 2], $components[1]);
+        $this->assertEquals([0], $components[2]);
+    }
+
+    public function testPropagationThroughRecursion()
+    {
+        // entry() -> a() <-> b() -> source(), unrelated() calls nothing
+        $definitions = [
+            $this->definition('entry', ['a'], ['$_POST' => ['nonce']]),
+            $this->definition('a', ['b']),
+            $this->definition('b', ['a', 'source']),
+            $this->definition('source', [], ['$_GET' => ['id']], ['xss' => false]),
+            $this->definition('unrelated', [], [], ['sqli' => false]),
+        ];
+
+        $graph = build_call_graph($definitions);
+        $this->assertEquals([[1], [2], [1, 3], [], []], $graph);
+
+        propagate_user_inputs($definitions, $graph);
+
+        // The definition's own inputs come first
+        $this->assertSame(['$_POST' => ['nonce'], '$_GET' => ['id']], $definitions[0]['inputs']);
+        $this->assertSame(['$_GET' => ['id']], $definitions[1]['inputs']);
+        $this->assertSame(['$_GET' => ['id']], $definitions[2]['inputs']);
+        $this->assertSame(['$_GET' => ['id']], $definitions[3]['inputs']);
+        $this->assertEquals([], $definitions[4]['inputs']);
+
+        foreach ([0, 1, 2, 3] as $id) {
+            $this->assertEquals(['xss' => false], $definitions[$id]['features']);
+        }
+        $this->assertEquals(['sqli' => false], $definitions[4]['features']);
+    }
+
+    public function testPropagationWithinCycleOnly()
+    {
+        // a() <-> b(), both with their own inputs, merged into each other
+        $definitions = [
+            $this->definition('a', ['b'], ['$_GET' => ['x']]),
+            $this->definition('b', ['a'], ['$_COOKIE' => ['y']]),
+        ];
+
+        propagate_user_inputs($definitions, build_call_graph($definitions));
+
+        $this->assertSame(['$_GET' => ['x'], '$_COOKIE' => ['y']], $definitions[0]['inputs']);
+        $this->assertSame(['$_COOKIE' => ['y'], '$_GET' => ['x']], $definitions[1]['inputs']);
+    }
+
+    public function testSanitizedPerSink()
+    {
+        // entry() -> escaped() prints escaped input, entry() -> query() runs a raw query,
+        // raw() -> escaped() and printed()
+        $definitions = [
+            $this->definition('entry', ['escaped', 'query']),
+            $this->definition('escaped', [], [], ['xss' => true]),
+            $this->definition('query', [], [], ['sqli' => false]),
+            $this->definition('raw', ['escaped', 'printed']),
+            $this->definition('printed', [], [], ['xss' => false]),
+        ];
+
+        propagate_user_inputs($definitions, build_call_graph($definitions));
+
+        $this->assertEquals(['xss' => true, 'sqli' => false], $definitions[0]['features']);
+        $this->assertEquals(['xss' => false], $definitions[3]['features']);
+        $this->assertFalse(get_harness_metadata('function', [], $definitions[0]['features'])['sanitized']);
+        $this->assertTrue(get_harness_metadata('function', [], $definitions[1]['features'])['sanitized']);
+        $this->assertFalse(get_harness_metadata('function', [], [])['sanitized']);
+    }
+
+    public function testSinkFeatures()
+    {
+        $features = fn(string $code) => get_collected_sink_features(collect_tokens(token_get_all($code)));
+
+        $this->assertSame(['xss' => false], $features("<div><?= \$_GET['a'] ?></div>"));
+        $this->assertSame(['xss' => true], $features("<?php echo esc_html(\$_GET['a']);"));
+        $this->assertSame(['sqli' => false], $features("<?php \$wpdb->get_results(\$_GET['a']);"));
+        $this->assertSame([], $features("<?php \$value = sanitize_text_field(\$_GET['a']);"));
+    }
+
+    public function testInputsInsideHeredoc()
+    {
+        $code = <<<'CODE'
+            <?php
+            function render() {
+                echo <<<HTML
+                <div>{$_GET['x']}</div>
+                HTML;
+            }
+            CODE;
+
+        [$functions] = extract_functions_and_methods(token_get_all($code));
+
+        $this->assertCount(1, $functions);
+        $this->assertSame(['$_GET' => ['x']], $functions[0]['inputs']);
+        $this->assertSame(['xss' => false], $functions[0]['features']);
+    }
+
+    private function collectUserInputs(string $code): array
+    {
+        return get_collected_user_inputs(collect_tokens(token_get_all("<?php\n$code")));
+    }
+
+    public function testMultipleFilterInputsInOneStatement()
+    {
+        $inputs = $this->collectUserInputs(
+            "\$value = filter_input(INPUT_POST, 'b') . filter_input( INPUT_GET , 'a' ) . filter_input(INPUT_GET, 'c');"
+        );
+
+        $this->assertSame(['$_GET' => ['a', 'c'], '$_POST' => ['b']], $inputs);
+    }
+
+    public function testSuperglobalsAndRequestParams()
+    {
+        $inputs = $this->collectUserInputs(<<<'CODE'
+            $id = $_GET['id'] ?? $_REQUEST["id"];
+            $agent = $_SERVER['HTTP_USER_AGENT'] . $_SERVER['DOCUMENT_ROOT'];
+            $params = $request->get_query_params();
+            echo $params['page'] . $request->get_param('name') . $_COOKIE[$dynamic];
+            CODE);
+
+        $this->assertSame([
+            '$_GET' => ['id'],
+            '$_REQUEST' => ['id'],
+            '$_SERVER' => ['HTTP_USER_AGENT'],
+            'set_param' => ['name'],
+            'set_query_params' => ['page'],
+        ], $inputs);
+    }
+
+    public function testUnknownFilterInputSource()
+    {
+        $this->assertSame([], $this->collectUserInputs("filter_input(INPUT_REQUEST, 'a'); filter_input(\$type, 'b');"));
+    }
+}
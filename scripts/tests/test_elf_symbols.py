@@ -0,0 +1,83 @@
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import elf_symbols
+from elf_symbols import ElfFile, resolve_symbols
+
+
+class ElfSymbolsTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        # Any dynamically linked ELF works, the running interpreter is always there
+        self.binary_path = os.path.join(self.tmp_dir, "binary")
+        shutil.copy(os.path.realpath(sys.executable), self.binary_path)
+        self.cache_path = os.path.join(self.tmp_dir, "symbols.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def read_cache(self) -> dict:
+        with open(self.cache_path) as f:
+            return json.load(f)["binaries"][str(Path(self.binary_path).resolve())]
+
+    def testResolveWithoutCache(self):
+        addresses = resolve_symbols(self.binary_path, ["main", "symwp_missing_symbol"], "")
+
+        self.assertEqual(["main"], list(addresses))
+        self.assertNotEqual(0, addresses["main"])
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def testMissingSymbolsAreCached(self):
+        resolve_symbols(self.binary_path, ["main", "symwp_missing_symbol"], self.cache_path)
+
+        entry = self.read_cache()
+        self.assertEqual(["main"], list(entry["symbols"]))
+        self.assertEqual(["symwp_missing_symbol"], entry["missing"])
+
+        # Neither the found nor the missing symbol is looked up again
+        with mock.patch.object(ElfFile, "find_symbols", side_effect=AssertionError("symbol table scanned")):
+            addresses = resolve_symbols(self.binary_path, ["main", "symwp_missing_symbol"], self.cache_path)
+        self.assertEqual(["main"], list(addresses))
+
+    def testOnlyUnknownSymbolsAreLookedUp(self):
+        resolve_symbols(self.binary_path, ["main"], self.cache_path)
+
+        with mock.patch.object(ElfFile, "find_symbols", return_value={}) as find_symbols:
+            resolve_symbols(self.binary_path, ["main", "symwp_missing_symbol"], self.cache_path)
+        find_symbols.assert_called_once_with(["symwp_missing_symbol"])
+
+    def testCacheIsKeyedByBinary(self):
+        resolve_symbols(self.binary_path, ["main"], self.cache_path)
+        key = self.read_cache()["key"]
+        self.assertEqual(os.path.getsize(self.binary_path), key["size"])
+
+        # A rebuilt binary has another mtime, so its symbols are resolved again
+        stat = os.stat(self.binary_path)
+        os.utime(self.binary_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        with mock.patch.object(ElfFile, "find_symbols", return_value={"main": 0x1234}) as find_symbols:
+            self.assertEqual({"main": 0x1234}, resolve_symbols(self.binary_path, ["main"], self.cache_path))
+        find_symbols.assert_called_once_with(["main"])
+        self.assertNotEqual(key, self.read_cache()["key"])
+
+    def testStaleCacheVersionIsIgnored(self):
+        with open(self.cache_path, "w") as f:
+            json.dump({"version": elf_symbols.SYMBOL_CACHE_VERSION + 1, "binaries": {"x": {}}}, f)
+
+        self.assertEqual({}, elf_symbols.load_symbol_cache(self.cache_path))
+
+    def testNotAnElfFile(self):
+        with self.assertRaises(ValueError):
+            ElfFile(b"#!/bin/sh\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
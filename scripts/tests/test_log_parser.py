@@ -0,0 +1,115 @@
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import log_parser
+
+from log_parser import (
+    XSS_PAYLOAD_MARKER,
+    MaxArityArgs,
+    iter_project_test_cases,
+    parse_log_line,
+    parse_record,
+)
+
+
+def make_record(kind: str, *inputs: tuple[bytes, bool]) -> bytes:
+    return json.dumps(
+        {
+            "kind": kind,
+            "pc": "0x1234",
+            "inputs": [
+                {"name": f"v{i}_arg{i}_1", "bytes": raw.hex(), "exploitable": exploitable}
+                for i, (raw, exploitable) in enumerate(inputs)
+            ],
+        }
+    ).encode()
+
+
+def make_log_line(tracker: str, *inputs: tuple[str, bool]) -> bytes:
+    # Same layout as writeSimpleTestCase of the legacy trackers
+    line = f"0 [State 3] {tracker}: Test case: "
+    for i, (value, exploitable) in enumerate(inputs):
+        name = f"v{i}_arg{i}_1" + ("(exploitable)" if exploitable else "")
+        raw = ", ".join(f"0x{byte:02x}" for byte in value.encode())
+        line += f"{name:>20} = {{{raw}}}; (string) \"{value}\", "
+    return line.encode() + b"\n"
+
+
+class ParseRecordTest(unittest.TestCase):
+    def testSqliRecord(self):
+        record = make_record("sqli", (b"1 OR 1=1\0\0\0", False), (b"(a)\xff", False))
+
+        self.assertEqual(log_parser.TestCase("sqli", ("1 OR 1=1", "(a)\udcff")), parse_record(record))
+
+    def testExploitableXssInput(self):
+        record = make_record("xss", (b"<b>", True), (b"id", True), (b"x", False))
+        test_case = parse_record(record)
+
+        self.assertEqual(log_parser.TestCase("xss", (XSS_PAYLOAD_MARKER, XSS_PAYLOAD_MARKER, "x")), test_case)
+
+    def testMalformedRecords(self):
+        self.assertIsNone(parse_record(b'{"kind": "xss", "inputs": [{"bytes": "zz"}]}'))
+        self.assertIsNone(parse_record(b'{"kind": "xss"}'))
+        self.assertIsNone(parse_record(b'{"kind": "xss", "inputs": [1]}'))
+        self.assertIsNone(parse_record(b'{"kind": "xss", "inputs'))
+
+
+class ParseLogLineTest(unittest.TestCase):
+    def testXssLine(self):
+        line = make_log_line("EchoFunctionTracker", ("abc", False), ("<b>", True))
+
+        self.assertEqual(log_parser.TestCase("xss", ("abc", XSS_PAYLOAD_MARKER)), parse_log_line(line))
+
+    def testSqliLine(self):
+        line = make_log_line("SqliteFunctionTracker", ("1", False), ("' OR 1=1", False))
+
+        self.assertEqual(log_parser.TestCase("sqli", ("1", "' OR 1=1")), parse_log_line(line))
+
+    def testOtherLines(self):
+        self.assertIsNone(parse_log_line(b"0 [State 3] SinkTracker: [echo] Test case at 0x1234 with 2 inputs\n"))
+        self.assertIsNone(parse_log_line(b"0 [State 3] EchoFunctionTracker: Test case: \n"))
+
+    def testFallbackToLogs(self):
+        tmp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        output_dir = tmp_dir / "s2e-out-0"
+        output_dir.mkdir()
+        with open(output_dir / "stdout.txt", "wb") as f:
+            f.write(b"unrelated\n")
+            f.write(make_log_line("EchoFunctionTracker", ("a", True)))
+
+        self.assertEqual([log_parser.TestCase("xss", (XSS_PAYLOAD_MARKER,))], list(iter_project_test_cases(tmp_dir)))
+
+        # Records take precedence over the logs once the plugins wrote any
+        with open(output_dir / "SinkTracker.testcases.jsonl", "wb") as f:
+            f.write(make_record("sqli", (b"b", False)) + b"\n")
+            f.write(b"truncated\n")
+
+        self.assertEqual([log_parser.TestCase("sqli", ("b",))], list(iter_project_test_cases(tmp_dir)))
+
+
+class MaxArityArgsTest(unittest.TestCase):
+    def testKeepsLongestTuples(self):
+        args = MaxArityArgs()
+
+        self.assertTrue(args.add(("a",)))
+        self.assertTrue(args.add(("a", "b")))
+        # Shorter tuples are incomplete test cases of a cut log
+        self.assertFalse(args.add(("c",)))
+        self.assertFalse(args.add(("a", "b")))
+        self.assertTrue(args.add(("c", "d")))
+
+        self.assertEqual({("a", "b"), ("c", "d")}, set(args))
+        self.assertEqual(2, len(args))
+        self.assertEqual(3, args.seen)
+
+
+if __name__ == "__main__":
+    unittest.main()
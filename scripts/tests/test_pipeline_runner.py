@@ -0,0 +1,134 @@
+import os
+import sys
+import shutil
+import subprocess
+import tempfile
+import unittest
+
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pipeline_runner
+
+from pipeline_runner import (
+    SpanLog,
+    SymbolicArgsReader,
+    add_child_usage,
+    get_minimal_loader,
+    use_full_loader,
+    wait_process,
+)
+
+
+class LoaderMissTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def write_log(self, *lines: bytes):
+        log_dir = self.tmp_dir / "project" / "s2e-out-0"
+        log_dir.mkdir(parents=True)
+        (log_dir / "stdout.txt").write_bytes(b"".join(lines))
+
+    def testMissFromGuestMessage(self):
+        # s2ecmd message as sent by the shutdown function of minimal loaders
+        self.write_log(
+            b"3 [State 0] BaseInstructions: Message from guest (0x7ffc): SymWP: target started\n",
+            b"9 [State 4] BaseInstructions: Message from guest (0x7ffc): "
+            b"SymWP: minimal loader misses wp_mail()\n",
+            b"9 [State 5] BaseInstructions: Message from guest (0x7ffc): "
+            b"SymWP: minimal loader misses Foo\\bar()\n",
+        )
+        reader = SymbolicArgsReader(self.tmp_dir / "project")
+
+        self.assertEqual({"xss": [], "sqli": []}, reader.read())
+        self.assertEqual({"wp_mail", "Foo\\bar"}, reader.loader_misses)
+        self.assertEqual(3, reader.target_start)
+
+    def testNoMiss(self):
+        self.write_log(b"9 [State 4] SinkTracker: [echo] Test case at 0x1234 with 2 inputs\n")
+        reader = SymbolicArgsReader(self.tmp_dir / "project")
+        reader.read()
+
+        self.assertEqual(set(), reader.loader_misses)
+
+    def testTestCasesCarriedOver(self):
+        self.write_log(b"9 [State 4] SinkTracker: [echo] Test case at 0x1234 with 2 inputs\n")
+        reader = SymbolicArgsReader(self.tmp_dir / "project")
+        reader.args["xss"].add(("a", "b"))
+
+        # The run with the full loader starts from the test cases of the minimal one
+        rerun = SymbolicArgsReader(self.tmp_dir / "project", reader.args)
+
+        self.assertEqual({"xss": [("a", "b")], "sqli": []}, rerun.read())
+        self.assertEqual(1, rerun.count())
+
+
+class FullLoaderFallbackTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        plugin = self.tmp_dir / "plugin"
+        self.harness = plugin / ".harness" / "symbolic" / "harness.php"
+        concrete = plugin / ".harness" / "concrete" / "harness.php"
+        self.loader = plugin / pipeline_runner.LOADER_DIR / "harness.php"
+        for path in (self.harness, concrete, self.loader):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("<?php\n")
+        self.base_loader = self.tmp_dir / "base-wordpress-loader.php"
+        self.base_loader.write_text("<?php\nrequire_once 'wp-includes/pluggable.php';\n")
+        # The traced loader is older than the base loader and would be traced again
+        os.utime(self.loader, (0, 0))
+
+        for name, value in (("BASE_LOADER", str(self.base_loader)), ("PHP_EXECUTABLE", "php")):
+            # PHP_EXECUTABLE is only set by parse_args
+            patcher = mock.patch.object(pipeline_runner, name, value, create=True)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def testFullLoaderReplacesTrace(self):
+        with mock.patch("builtins.print"):
+            use_full_loader(str(self.harness), {"wp_mail"})
+
+        self.assertEqual(self.base_loader.read_text(), self.loader.read_text())
+        with mock.patch.object(pipeline_runner.subprocess, "run") as run:
+            self.assertEqual(self.loader, get_minimal_loader(str(self.harness)))
+        run.assert_not_called()
+
+    def testStaleTraceIsTracedAgain(self):
+        with mock.patch.object(pipeline_runner.subprocess, "run") as run, mock.patch("builtins.print"):
+            self.assertEqual(self.loader, get_minimal_loader(str(self.harness)))
+        run.assert_called_once()
+
+
+class ChildUsageTest(unittest.TestCase):
+    def testWaitProcess(self):
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.5); exit(3)"])
+
+        self.assertIsNone(wait_process(proc, 0))
+        self.assertIsNone(proc.returncode)
+        rusage = wait_process(proc)
+        self.assertEqual(3, proc.returncode)
+        self.assertEqual(3, proc.wait())
+        self.assertGreater(rusage.ru_maxrss, 0)
+
+    def testSpanRecordsChildren(self):
+        spans = SpanLog(None)
+        with spans.span("checker") as span:
+            for _ in range(2):
+                proc = subprocess.Popen([sys.executable, "-c", "sum(range(10**6))"])
+                add_child_usage(span, wait_process(proc))
+
+        self.assertGreater(span["children_cpu"], 0.0)
+        self.assertGreater(span["children_max_rss_kb"], 0)
+        self.assertFalse(span["failed"])
+
+
+if __name__ == "__main__":
+    unittest.main()